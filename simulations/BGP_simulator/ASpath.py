@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+
+class ASpath:
+	'''
+	Class for AS paths, stored as persistent (immutable) linked lists: an AS path is its first ASN and a pointer to the rest of the path (the "tail"), i.e., the path announced by the next hop.
+	In this way, the path of a node is stored once and shared (as a suffix) by the paths of all the nodes that receive it, and announcing a path costs a single object (instead of a copy of the whole list).
+
+	An ASpath behaves as a (read-only) list of ASNs: it supports len(...), iteration, indexing/slicing (slices are returned as lists), "in", index(...), comparison with lists, and concatenation with lists (the result is a list).
+	The method "tolist()" returns the path as a list.
+	An ASpath is never empty; the empty paths (e.g., of the owners of a prefix) are kept as empty lists.
+
+	class variables:
+		(a) ASN:	the first ASN of the path
+		(b) tail:	object of type ASpath - the rest of the path; None if the path has only one ASN
+		(c) length:	integer - the number of ASNs in the path
+		(d) origin:	the last ASN of the path (i.e., the origin AS)
+	'''
+
+	__slots__ = ('ASN','tail','length','origin')
+
+
+	'''
+	Contructor for object of the class ASpath.
+
+	Input arguments:
+		(a) ASN:	the first ASN of the path
+		(b) tail:	the rest of the path; an ASpath, or a list of ASNs (which is converted to an ASpath); default value is None (i.e., a path with a single ASN)
+	'''
+	def __init__(self,ASN,tail=None):
+		if (tail is not None) and (not isinstance(tail,ASpath)):
+			tail = ASpath.from_list(tail)
+		self.ASN = ASN
+		self.tail = tail
+		if tail is None:
+			self.length = 1
+			self.origin = ASN
+		else:
+			self.length = tail.length + 1
+			self.origin = tail.origin
+
+
+	'''
+	Creates an ASpath from the given list of ASNs.
+
+	Input argument:
+		(a) path: list of ASNs (or, an ASpath, which is returned as is)
+
+	Returns:
+		An object of type ASpath, or None if the list is empty
+	'''
+	@classmethod
+	def from_list(cls,path):
+		if isinstance(path,ASpath):
+			return path
+		tail = None
+		for ASN in reversed(path):
+			tail = cls(ASN,tail)
+		return tail
+
+
+	'''
+	Returns:
+		The path as a list of ASNs
+	'''
+	def tolist(self):
+		path = []
+		node = self
+		while node is not None:
+			path.append(node.ASN)
+			node = node.tail
+		return path
+
+	def __len__(self):
+		return self.length
+
+	def __iter__(self):
+		node = self
+		while node is not None:
+			yield node.ASN
+			node = node.tail
+
+	def __contains__(self,ASN):
+		node = self
+		while node is not None:
+			if node.ASN == ASN:
+				return True
+			node = node.tail
+		return False
+
+	def __getitem__(self,i):
+		if i == 0:		# the most common case (i.e., the neighbor from which the path is received)
+			return self.ASN
+		if isinstance(i,slice):
+			return self.tolist()[i]
+		if i < 0:
+			i += self.length
+		if (i < 0) or (i >= self.length):
+			raise IndexError('ASpath index out of range')
+		if i == self.length-1:
+			return self.origin
+		node = self
+		for _ in range(i):
+			node = node.tail
+		return node.ASN
+
+	'''
+	Returns the position of the first occurrence of the given ASN in the path (as the method "index(...)" of lists); raises ValueError if the ASN is not in the path.
+	'''
+	def index(self,ASN):
+		i = 0
+		node = self
+		while node is not None:
+			if node.ASN == ASN:
+				return i
+			node = node.tail
+			i += 1
+		raise ValueError('{} is not in ASpath'.format(ASN))
+
+	def __eq__(self,other):
+		if self is other:
+			return True
+		if isinstance(other,ASpath):
+			if self.length != other.length:
+				return False
+			node = self
+			while (node is not None) and (node is not other):
+				if node.ASN != other.ASN:
+					return False
+				node, other = node.tail, other.tail
+			return True
+		if isinstance(other,list):
+			return (self.length == len(other)) and all(ASN == other_ASN for ASN,other_ASN in zip(self,other))
+		return NotImplemented
+
+	def __ne__(self,other):
+		equal = self.__eq__(other)
+		return equal if equal is NotImplemented else not equal
+
+	__hash__ = None		# not hashable, as the lists with which it is compared
+
+	def __add__(self,other):
+		return self.tolist() + list(other)
+
+	def __radd__(self,other):
+		return list(other) + self.tolist()
+
+	def __repr__(self):
+		return repr(self.tolist())
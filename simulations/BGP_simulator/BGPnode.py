@@ -11,9 +11,10 @@
 #
 
 
+import heapq
 import random
 from collections import defaultdict
-from copy import deepcopy
+from ASpath import ASpath
 
 class BGPnode:
 	''' 
@@ -28,9 +29,15 @@ class BGPnode:
 		(d) hijacked_IPprefix: 	dictionary (initially empty) - dictionary with (i) keys the hijacked IP prefixes and (ii) values the hijack_type as int (0==origin_AS hijack, 1== 1st hop hijack, etc. )
 		(e) ASneighbors: 		dictionary (initially empty) - dictionary with (i) keys the ASNs of neighbors and (ii) values {1,0,-1} if the neighbor is {provider,peer,customer} respectively
 		(f) ASneighbors_preference: 	dictionary (initially empty) - dictionary with (i) keys the ASNs of neighbors and (ii) values the preferences of the neighbors for selection of BGP paths / tie breaker - values are float in [0,1]
-		(g) paths:				dictionary (initially empty) corresponding to the best paths per prefix - dictionary with (i) keys the IP prefixes and (ii) values the corresponding AS path given as a list (e.g., [ASNx, ASNy, ASNz, origin_ASN])
-		(h) all_paths:			dictionary of dictionaries (initially empty) representing the local FIB of BGP - dictionary with (i) keys the IP prefixes, (ii) keys (for each prefix) the ASN of the neighbor that sent the path, and (iii) values the corresponding AS path given as a list (e.g., [ASNx, ASNy, ASNz, origin_ASN])
+		(g) paths:				dictionary (initially empty) corresponding to the best paths per prefix - dictionary with (i) keys the IP prefixes and (ii) values the corresponding AS path given as an ASpath, i.e., a list-like object sharing its tail with the path of the next hop (e.g., [ASNx, ASNy, ASNz, origin_ASN]); the (empty or hijacked) paths of the owners/hijackers of a prefix are lists
+		(h) all_paths:			dictionary of dictionaries (initially empty) representing the local FIB of BGP - dictionary with (i) keys the IP prefixes, (ii) keys (for each prefix) the ASN of the neighbor that sent the path, and (iii) values the corresponding AS path given as an ASpath (e.g., [ASNx, ASNy, ASNz, origin_ASN])
 		(i) filters:			dictionary (initially empty) - dictionary with (i) keys the IPprefixes, and (ii) values sets of ASNs; if an ASN exists in the set, then the every path for the prefix that contains this ASN need to be filtered/discarded
+		(j) routing_epoch:		integer (initially the "routing_epoch" of the topology) - the epoch of the topology in which the routing tables (i.e., "IPprefix", "hijacked_IPprefix", "paths", "all_paths" and "filters") were last cleared;
+								IF it is not equal to the "routing_epoch" of the topology, THEN the routing tables are stale (i.e., from before the last "clear_routing_information()" of the topology), and they are cleared when the node is next used through the topology (see the method "get_node(...)" of the BGPtopology class)
+		(k) ranked_paths:		dictionary (initially empty) - dictionary with (i) keys the IP prefixes and (ii) values heaps (lists ordered with the "heapq" module) of tuples (relation, path length, -preference, ASN) for the paths in the "all_paths" dictionary, i.e., ranked from the most to the least preferred path;
+								a heap is built at the first selection of the best path for the prefix (see the method "select_best_path(...)") and the received paths are pushed to it; the removed or replaced paths are discarded from it lazily (i.e., when they are at its top)
+		(l) preference_epoch:	integer (initially the "preference_epoch" of the topology) - the epoch of the preferences of the topology from which the "ASneighbors_preference" were last set;
+								IF it is not equal to the "preference_epoch" of the topology, THEN the "ASneighbors_preference" are stale (i.e., from before the last "set_preferences(...)" of the topology), and they are set when the routing tables are cleared (see the method "clear_routing_tables()")
 	'''
 
 	'''
@@ -50,6 +57,9 @@ class BGPnode:
 		self.paths = {} 
 		self.all_paths = defaultdict(dict)
 		self.filters = {}
+		self.routing_epoch = Topology.routing_epoch
+		self.ranked_paths = {}
+		self.preference_epoch = Topology.preference_epoch
 
 
 	
@@ -88,6 +98,50 @@ class BGPnode:
 		if self.has_prefix(IPprefix) or self.has_hijacked_prefix(IPprefix):
 			self.announce_path(IPprefix,list(self.ASneighbors.keys()))
 
+	'''
+	Withdraws the given prefix, if it is an owned or hijacked prefix (i.e., the node stops announcing it).
+
+	IF the given prefix is an owned or hijacked prefix,
+	THEN 	(i) remove the prefix from the owned/hijacked prefixes, and remove the path and the stored paths ("all_paths") for the prefix,
+			(ii) withdraw the path from all neighbors; the withdrawals propagate as in the method "withdraw_path(...)", i.e., the nodes whose best path is withdrawn select and export a new best path (if any), and
+			(iii) request from all neighbors to re-announce their paths for the prefix (see the method "refresh_path(...)"), since the paths that were received while the prefix was owned/hijacked have been discarded
+
+	Input argument:
+		(a) IPprefix: the prefix to be withdrawn
+	'''
+	def withdraw_prefix(self,IPprefix):
+		if self.has_prefix(IPprefix) or self.has_hijacked_prefix(IPprefix):
+			self.IPprefix.discard(IPprefix)
+			self.hijacked_IPprefix.pop(IPprefix,None)
+			self.paths.pop(IPprefix,None)
+			self.all_paths.pop(IPprefix,None)
+			self.ranked_paths.pop(IPprefix,None)
+			for neighbor in self.ASneighbors.keys():
+				self.Topology.send_BGP_message('withdraw',IPprefix,self.ASN,neighbor)
+			self.Topology.propagate_BGP_messages()
+			for neighbor in self.ASneighbors.keys():
+				self.Topology.get_node(neighbor).refresh_path(IPprefix,self.ASN)
+
+	'''
+	Re-announces the path for the given prefix to the given neighbor (i.e., a route refresh), if the path would be exported to this neighbor.
+
+	IF the given prefix is an owned prefix, or a hijacked prefix with a hijack path,
+	THEN 	announce the prefix (as owned, or the fake/hijacked path) to the neighbor
+	ELIF there is a path for the given prefix, which is not received from the given neighbor,
+	THEN 	IF the path is received from a customer AS neighbor, OR the given neighbor is a customer
+			THEN 	announce the path to the neighbor
+
+	Input arguments:
+		(a) IPprefix:	the prefix whose path is re-announced
+		(b) ASN:		the AS number of the neighbor
+	'''
+	def refresh_path(self,IPprefix,ASN):
+		if self.has_prefix(IPprefix) or (self.has_hijacked_prefix(IPprefix) and ((self.hijacked_IPprefix[IPprefix] == 0) or self.paths.get(IPprefix))):
+			self.announce_path(IPprefix,[ASN])
+		elif self.paths.get(IPprefix) and (self.paths[IPprefix][0] != ASN):
+			if (self.ASneighbors[self.paths[IPprefix][0]] == -1) or (self.ASneighbors[ASN] == -1):
+				self.announce_path(IPprefix,[ASN])
+
 	'''
 	Checks if the given prefix exists in the "IPprefix" dictionary.
 	
@@ -109,19 +163,28 @@ class BGPnode:
 
 
 	'''
-	Clears the routing tables, i.e. the dictionaries "paths" and "all_paths"
+	Clears the routing tables, i.e. the dictionaries "paths" and "all_paths" (and the owned/hijacked prefixes and the filters), and marks them as up to date with the "routing_epoch" of the topology.
+	The containers are cleared in place (i.e., no new containers are allocated), and only if they are not empty.
+	IF the preferences of the topology have been set after the last clear (see the method "set_preferences(...)" of the BGPtopology class), THEN the "ASneighbors_preference" are also set from them,
+	i.e., the preferences of a node are set only when it is next used (since the method "set_preferences(...)" clears the routing information of all nodes).
 	'''
 	def clear_routing_tables(self):
-		# self.paths.clear() #self.paths = {} 
-		# self.all_paths.clear() #self.all_paths = defaultdict(dict)
-		# self.IPprefix.clear()	
-		# self.hijacked_IPprefix.clear()
-		# self.filters.clear()		
-		self.paths = {} 
-		self.all_paths = defaultdict(dict)
-		self.IPprefix = set()
-		self.hijacked_IPprefix = {}
-		self.filters = {}
+		if self.paths:
+			self.paths.clear()
+		if self.all_paths:
+			self.all_paths.clear()
+		if self.IPprefix:
+			self.IPprefix.clear()
+		if self.hijacked_IPprefix:
+			self.hijacked_IPprefix.clear()
+		if self.filters:
+			self.filters.clear()
+		if self.ranked_paths:
+			self.ranked_paths.clear()
+		self.routing_epoch = self.Topology.routing_epoch
+		if self.preference_epoch != self.Topology.preference_epoch:
+			self.ASneighbors_preference = self.Topology.get_preferences_of_node(self.ASN)
+			self.preference_epoch = self.Topology.preference_epoch
 		
 
 	### methods for	hijacked IP prefixes ###
@@ -308,6 +371,7 @@ class BGPnode:
 	Adds the given path for the given prefix in the "all_paths" dictionary (i.e., local BGP FIB), and compares the given path with the with the stored best path (if any) for the given prefix, and decides if the new path needs to replace the stored path (or added if no stored path exists).
 
 	Adds the given path in the "all_paths" dictionary (for the keys: given prefix and neighbor that sent the path "new_path[0]"); in case a stored path for this prefix from this neighbor exists, replaces the stored path with the given path.
+	IF there is a heap of ranked paths for the prefix (see the "ranked_paths" class variable), THEN the given path is pushed to it too.
 	IF a path for the given prefix exists,
 	THEN 	IF the existing best path is from the same neighbor as the given path, 
 			THEN 	set as the existing best path the given path, and select the best path among all the stored paths in the "all_paths" dictionary (i.e., select from all paths in the local BGP FIB),
@@ -326,8 +390,11 @@ class BGPnode:
 	''' 
 	def add_received_path(self,IPprefix,new_path):
 		self.all_paths[IPprefix][new_path[0]] = new_path # replace or add the path from this neighbor (new_path[0])
+		ranked = self.ranked_paths.get(IPprefix)
+		if ranked is not None:
+			self.push_ranked_path(IPprefix,ranked,new_path)
 		if self.paths.get(IPprefix):
-			my_best_path = list(self.paths[IPprefix])
+			my_best_path = self.paths[IPprefix]
 			if new_path[0] == my_best_path[0]:
 				self.paths[IPprefix] = new_path
 				self.select_best_path(IPprefix)
@@ -345,26 +412,53 @@ class BGPnode:
 	'''
 	Selects the best path for the given prefix among all the paths in the "all_paths" dictionary, and sets this path as best path in the "paths" dictionary
 
-	IF no best path exists for the given prefix, 
-	THEN 	IF there exists at least one path in the "all_paths" dictionary
-			THEN 	select randomly one of the paths in the "all_paths" dictionary as best path (i.e., put it in the "paths" dictionary)
-			ELSE 	set the best path equal to an empty path/list
+	The paths are ranked (as in the method "conditions_to_change_existing_path(...)") by (i) the type of the neighbor (customer > peer > provider), (ii) the path length (shorter is preferred), and (iii) the preference of the neighbor (higher is preferred),
+	in a heap (see the "ranked_paths" class variable), which is built at the first call for the prefix; hence, the best path is found in O(log k) amortized time, where k the number of paths in the "all_paths" dictionary.
 
-	FOR EACH path in the "all_paths" dictionary, compare the path with the current best path, and select the best path among the two. 
-		In the end, the "paths" dictionary contains the best path among the paths in the "all_paths" dictionary.
+	WHILE the top of the heap is not a stored path (i.e., the path from this neighbor has been removed, or replaced by a path of a different length)
+		remove the top of the heap
+	IF the heap is not empty
+	THEN 	set the path of its top as the best path (i.e., put it in the "paths" dictionary)
+	ELSE 	set the best path equal to an empty path/list
 
 	Input argument:
 		(a) IPprefix:	the prefix for which a best path is to be selected 
 	'''
 	def select_best_path(self,IPprefix):
-		if not self.paths.get(IPprefix):
-			if self.all_paths.get(IPprefix):
-				self.paths[IPprefix] = random.choice(list(self.all_paths[IPprefix].values()))
-			else:
-				self.paths[IPprefix] = []
-		for search_path in self.all_paths[IPprefix].values(): # finds the best path and adds it to the self.paths[IPprefix]
-			if self.conditions_to_change_existing_path(IPprefix,search_path):
-				self.paths[IPprefix] = search_path
+		if self.Topology.stats is not None:
+			self.Topology.stats.select_best_path_calls += 1
+		stored_paths = self.all_paths[IPprefix]
+		ranked = self.ranked_paths.get(IPprefix)
+		if ranked is None:
+			ranked = self.ranked_paths[IPprefix] = self.get_ranked_paths(stored_paths)
+		while ranked:
+			path = stored_paths.get(ranked[0][3])
+			if (path is not None) and (len(path) == ranked[0][1]):
+				self.paths[IPprefix] = path
+				return
+			heapq.heappop(ranked)
+		self.paths[IPprefix] = []
+
+	'''
+	Returns a heap (list ordered with the "heapq" module) with the ranking tuples (relation, path length, -preference, ASN) of the given paths (see the "ranked_paths" class variable).
+
+	Input argument:
+		(a) stored_paths:	dictionary with (i) keys the ASNs of the neighbors and (ii) values the paths received from them (i.e., the "all_paths" for a prefix)
+	'''
+	def get_ranked_paths(self,stored_paths):
+		ranked = [(self.ASneighbors[ASN],len(path),-self.ASneighbors_preference[ASN],ASN) for ASN,path in stored_paths.items()]
+		heapq.heapify(ranked)
+		return ranked
+
+	'''
+	Pushes the given (received) path to the given heap of ranked paths for the given prefix.
+	IF the heap has more than twice as many entries as the stored paths (i.e., mostly removed or replaced paths), THEN the heap is rebuilt from the stored paths.
+	'''
+	def push_ranked_path(self,IPprefix,ranked,path):
+		ASN = path[0]
+		heapq.heappush(ranked,(self.ASneighbors[ASN],len(path),-self.ASneighbors_preference[ASN],ASN))
+		if len(ranked) > 2*len(self.all_paths[IPprefix]) + 8:
+			self.ranked_paths[IPprefix] = self.get_ranked_paths(self.all_paths[IPprefix])
 
 
 
@@ -374,7 +468,7 @@ class BGPnode:
 
 	Adds the given filter in the "filter" dictionary.
 	IF a path for the given prefix exists
-	THEN 	(i) FOR EACH stored path in the "all_paths" dictionary, remove the path if it must be filtered (using the method "must_filter_path(...)")
+	THEN 	(i) FOR EACH stored path in the "all_paths" dictionary, remove the path if it must be filtered (using the method "must_filter_path(...)"); the paths are removed in place (only the keys of the removed paths are collected, and no path is copied)
 			(ii) IF the existing best path must be filtered
 				 THEN 	call the method "withdraw_path(...)" to witdraw all previous announcements that do not conform to the filter.
 
@@ -384,19 +478,18 @@ class BGPnode:
 	'''
 	def filter_path(self,IPprefix,ASN):
 		self.add_filter(IPprefix,ASN)
-		if self.paths.get(IPprefix):	
-			copy_of_all_paths = deepcopy(self.all_paths[IPprefix])	
-			for search_key,search_path in copy_of_all_paths.items():
-				if self.must_filter_path(IPprefix,search_path):
-					del self.all_paths[IPprefix][search_key]
-			my_best_path = list(self.paths[IPprefix])		
-			if self.must_filter_path(IPprefix,my_best_path): 
+		if self.paths.get(IPprefix):
+			stored_paths = self.all_paths[IPprefix]
+			for search_key in [key for key,search_path in stored_paths.items() if self.must_filter_path(IPprefix,search_path)]:
+				del stored_paths[search_key]
+			my_best_path = self.paths[IPprefix]
+			if self.must_filter_path(IPprefix,my_best_path):
 				self.withdraw_path(IPprefix,my_best_path[0])
 
 	'''
 	Removes all the stored paths in the "all_paths" dictionary from the given AS for the given prefix, and if any of them is the best path, then (i) withdraws also the previous announcement of the existing best path, and (ii) selects and announces the new best path.
 
-	IF a path exists in the "paths" dictionary for the given prefix
+	IF a path exists in the "paths" dictionary for the given prefix (and the prefix is not a hijacked prefix, i.e., the hijacker keeps announcing the hijacked path)
 	THEN 	(i) IF a path exists in the "all_paths" dictionary for the given prefix from the given AS
 			    THEN remove this path from the "all_paths" dictionary
 			(ii) IF the existing path in the "paths" dictionary (i.e., the best path) is from the given AS
@@ -404,21 +497,24 @@ class BGPnode:
 				 		(b) select a new best path
 				 		(c) export the new best path to the neighbors
 
+	The withdrawals/announcements to the neighbors are not delivered directly; they are sent as BGP messages to the message queue of the topology (see "send_BGP_message(...)" in the BGPtopology class).
+
 	Input arguments:
 		(a) IPprefix:	the prefix for which the path will be withdrawn 
 		(b) w_ASN:		the neighbor AS (i.e., the last AS in the path; not necessarily the origin-AS) that announced the path which will be withdrawn 
 	'''
 	def withdraw_path(self,IPprefix,w_ASN):		# withdraws path without announcing a new path for this prefix
-		if self.paths.get(IPprefix):	# if a path for this prefix exists in my FIB
+		if self.paths.get(IPprefix) and (not self.has_hijacked_prefix(IPprefix)):	# if a path for this prefix exists in my FIB (and it is not the fake path of a prefix I have hijacked)
 			if self.all_paths[IPprefix].get(w_ASN):
 				del self.all_paths[IPprefix][w_ASN]		# remove it from local FIB
-			if w_ASN == list(self.paths[IPprefix])[0]:	# if the withdrawn path is my current best path
+			if w_ASN == self.paths[IPprefix][0]:	# if the withdrawn path is my current best path
 				for neighbor in self.ASneighbors.keys(): # make all my neighbors to withdraw the path (in case I have announced it to them)
-					self.Topology.get_node(neighbor).withdraw_path(IPprefix,self.ASN)	# do withdrawal to neighbor
+					self.Topology.send_BGP_message('withdraw',IPprefix,self.ASN,neighbor)	# do withdrawal to neighbor
 				self.paths[IPprefix] = []	# remove it from my best path
 				self.select_best_path(IPprefix)	# select a new best path
 				if self.paths.get(IPprefix):
 					self.export_path(IPprefix)	# export the new best path
+				self.Topology.propagate_BGP_messages()
 
 
 	'''
@@ -427,6 +523,7 @@ class BGPnode:
 	IF there are filters for the given prefix
 	THEN 	add the given ASN in the set of filters for the given prefix (if the filter exists, there will be no change, since the filters are stored in a set)
 	ELSE 	add to the dictionary a filter for the given prefix and add to it the given ASN
+	The prefix is added to the "filtered_prefixes" of the topology (i.e., the fast converge mode is not used for the prefix).
 
 	Input arguments:
 		(a) IPprefix:	the prefix for which the filter will be added 
@@ -437,6 +534,7 @@ class BGPnode:
 			self.filters[IPprefix].add(ASN)
 		else:
 			self.filters[IPprefix] = set([ASN])
+		self.Topology.filtered_prefixes.add(IPprefix)
 
 	'''
 	Checks if the received path must be filtered, based on the stored filters.
@@ -454,9 +552,10 @@ class BGPnode:
 		TRUE if the path must be filtered, FALSE otherwise
 	'''
 	def must_filter_path(self,IPprefix,path):
-		if self.filters.get(IPprefix):
+		filters = self.filters.get(IPprefix)
+		if filters:
 			for ASN in path:
-				if ASN in self.filters[IPprefix]:
+				if ASN in filters:
 					return True
 		return False
 
@@ -508,16 +607,20 @@ class BGPnode:
 		TRUE if the path for the prefix in the "paths" dictionary needs to be replaced, FALSE otherwise
 	'''
 	def conditions_to_change_existing_path(self,IPprefix, new_path):
-		my_path = list(self.paths[IPprefix])
-		if new_path[0] == my_path[0]: 	# if the new path is from the same neighbor as the old path, then change the path (because this neighbor would withdraw the old path in practice)
+		my_path = self.paths[IPprefix]
+		new_neighbor = new_path[0]
+		my_neighbor = my_path[0]
+		if new_neighbor == my_neighbor: 	# if the new path is from the same neighbor as the old path, then change the path (because this neighbor would withdraw the old path in practice)
 			return True 
-		if self.ASneighbors[new_path[0]] < self.ASneighbors[my_path[0]]:	# Prefer customer (-1) > peer (0) > provider (1)
+		new_relation = self.ASneighbors[new_neighbor]
+		my_relation = self.ASneighbors[my_neighbor]
+		if new_relation < my_relation:	# Prefer customer (-1) > peer (0) > provider (1)
 			return True
-		elif self.ASneighbors[new_path[0]] == self.ASneighbors[my_path[0]]:	# if both paths from equal neighbors ...
+		elif new_relation == my_relation:	# if both paths from equal neighbors ...
 			if len(new_path) < len(my_path):	# if new path is shorter ...prefer it
 				return True
 			elif len(new_path) == len(my_path):	# if new path is of equal length ...
-				return self.ASneighbors_preference[new_path[0]] > self.ASneighbors_preference[my_path[0]]	# ... return neighbor with highest preference
+				return self.ASneighbors_preference[new_neighbor] > self.ASneighbors_preference[my_neighbor]	# ... return neighbor with highest preference
 		return False
 
 	'''
@@ -549,15 +652,16 @@ class BGPnode:
 
 	IF a certain path is not given
 	THEN 	(i) get the path that is stored in the "paths" dictionary, and
-			(ii) add to it the self.ASN
-	Announce the (given/stored) path to the given AS neighbors
+			(ii) add to it the self.ASN (i.e., create an ASpath with the self.ASN and, as tail, the stored path; the stored path is not copied)
+	Announce the (given/stored) path to the given AS neighbors, i.e., send one BGP message per neighbor to the message queue of the topology,
+	and then let the topology deliver the queued messages (if it is not already doing so)
 	'''
 	def announce_path(self,IPprefix, neighbors_to_announce, path_to_announce=None):
 		if path_to_announce is None:
-			path_to_announce = list(self.paths[IPprefix])
-			path_to_announce.insert(0,self.ASN)
+			path_to_announce = ASpath(self.ASN,self.paths[IPprefix])
 		for neighbor in neighbors_to_announce:
-			self.Topology.get_node(neighbor).receive_path(IPprefix,path_to_announce)	# do announcement to neighbor
+			self.Topology.send_BGP_message('announce',IPprefix,self.ASN,neighbor,path_to_announce)	# do announcement to neighbor
+		self.Topology.propagate_BGP_messages()
 
 
 
@@ -584,13 +688,32 @@ class BGPnode:
 		if (not self.has_prefix(IPprefix)) and (not self.has_hijacked_prefix(IPprefix)):
 			self.add_hijacked_prefix(IPprefix,hijack_type)
 			neighbors_to_announce = set(self.ASneighbors.keys())	# announce the hijack to all neighbors
-			if hijack_type == 0: 	# origin-AS
-				path_to_announce = [self.ASN]					
-			else:					# 1st, 2nd, 3rd, etc. hop hijack, where hijack_type = 1,2,3,etc.
-				path_to_announce = self.get_path_poisoning_hijack(IPprefix, hijack_type)
+			path_to_announce = self.get_hijack_path(IPprefix, hijack_type)
 			self.paths[IPprefix] = path_to_announce[1:]
 			if len(path_to_announce):	# check for the case that the "self.get_path_poisoning_hijack(...)"" function returns an empty list
-				self.announce_path(IPprefix, neighbors_to_announce, path_to_announce)
+				self.announce_path(IPprefix, neighbors_to_announce, ASpath.from_list(path_to_announce))
+
+
+
+	'''
+	Returns the path to be announced for a hijack of the given type.
+
+	IF the hijack type is 0 (i.e. origin AS hijack)
+	THEN 	return the path [self.ASN]
+	ELSE 	call the method "get_path_poisoning_hijack(...)" to get the path
+
+	Input arguments:
+		(a) IPprefix:		the prefix to be hijacked
+		(b) hijack_type: 	the type of the hijack attack
+
+	Returns:
+		An AS-path, i.e., a list of ASNs (integers)
+	'''
+	def get_hijack_path(self, IPprefix, hijack_type):
+		if hijack_type == 0: 	# origin-AS
+			return [self.ASN]
+		else:					# 1st, 2nd, 3rd, etc. hop hijack, where hijack_type = 1,2,3,etc.
+			return self.get_path_poisoning_hijack(IPprefix, hijack_type)
 
 
 
@@ -613,7 +736,7 @@ class BGPnode:
 	'''
 	def get_path_poisoning_hijack(self, IPprefix, hijack_type):
 		if self.paths.get(IPprefix):
-			original_path = list(self.paths.get(IPprefix))
+			original_path = self.paths.get(IPprefix)	# (slices of an ASpath are lists)
 			if  hijack_type <= len(original_path):
 				path_to_announce = [self.ASN] + original_path[-hijack_type:]
 			else:
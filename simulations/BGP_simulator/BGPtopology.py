@@ -10,10 +10,21 @@
 # This file is part of the BGPsimulator
 #
 
+import bz2
 import csv
+import gzip
 import json
+import os
+import random
+import zipfile
+import numpy as np
+from collections import deque, defaultdict
+from contextlib import nullcontext
+from ASpath import ASpath
 from BGPnode import BGPnode
+from CompactTopology import CompactTopology
 from IXPNode import IXPNode
+from PropagationStats import PropagationStats
 
 class BGPtopology:
 	''' 
@@ -23,14 +34,52 @@ class BGPtopology:
 
 	class variables: 
 		(a) list_of_all_BGP_nodes:	dictionary (initially empty) - dictionary with (i) keys the ASNs of member nodes and (ii) values the objects of type BGPnode (corresponding to each member node)
+		(b) BGP_message_queue:		deque (initially empty) - FIFO queue with the BGP messages (announcements/withdrawals) that have been sent by the member nodes and have not been delivered yet; each message is a tuple (message_type, IPprefix, from_ASN, to_ASN, path)
+		(c) propagating:			boolean (initially False) - TRUE while the messages in the "BGP_message_queue" are being delivered
+		(d) nb_of_BGP_messages:		integer (initially 0) - the number of BGP messages that have been delivered
+		(e) fast_converge:			boolean (given upon creation; default False) - IF TRUE, then the converged paths for the added/hijacked prefixes are computed directly (see the method "fast_converge_prefix(...)"), instead of exchanging BGP messages
+		(f) message_passing_prefixes:	set (initially empty) - set of prefixes, for which the fast converge mode cannot be used (e.g., prefixes announced only to some of the neighbors of the origin)
+		(g) node_ids:				dictionary (initially empty) - dictionary with (i) keys the ASNs of member nodes and (ii) values dense integer ids (in the order of the "list_of_all_BGP_nodes"), and the list "node_ASNs" with the ASN of each id; they are built when needed (see the method "get_node_ids()")
+		(h) prefix_index:			dictionary (initially empty) - dictionary with (i) keys IP prefixes and (ii) values the index of the paths of the nodes for the prefix (see the method "get_prefix_index(...)"); an entry is removed when the paths for the prefix change
+		(i) customer_cones:			dictionary (initially None) - the customer cones of all nodes (see the method "get_customer_cones()"); it is computed when needed, and set to None when a node or link is added or removed
+		(j) compact_topology:		object of type CompactTopology (initially None) - an array-backed copy of the nodes and links, used to compute the routes of many prefixes at once (see the method "add_prefixes(...)"); it is created when needed, and set to None when a node or link is added or removed
+		(k) stats:					object of type PropagationStats (initially None) - the counters and phase times of the propagation of the BGP messages; they are updated only if the instrumentation is enabled (see the method "enable_instrumentation()")
+		(l) routing_epoch:			integer (initially 0) - the number of times the routing information of all nodes has been cleared; the routing tables of a node are up to date only if its "routing_epoch" is equal to this (see the method "clear_routing_information(...)")
+		(m) preferences:			np.array (2E) of float32 (initially None) - the preferences of the nodes for their neighbors (used as BGP tie breaker), indexed by edge id, i.e., the position of the (node, neighbor) entry in the CSR arrays of the "compact_topology";
+									they are set by the method "set_preferences(...)", and the "ASneighbors_preference" of each node are set from them when the node is next used (see the "preference_epoch"); set to None when a node or link is added or removed
+		(n) preference_seed:		integer (initially None) - the seed of the "preferences"; None if the preferences are the random values drawn when the links are added; IF it is not None, THEN the preferences of the nodes of an added or removed link are computed from it
+		(o) filtered_prefixes:		set (initially empty) - set of prefixes, for which a node has a filter (see the method "add_filter(...)" of the BGPnode class), i.e., for which the fast converge mode cannot be used
+		(p) preference_epoch:		integer (initially 0) - the number of times the preferences have been set (by the method "set_preferences(...)"); the "ASneighbors_preference" of a node are up to date only if its "preference_epoch" is equal to this
+		(q) preference_entries:		dictionary (initially None) - dictionary with (i) keys the ASNs and (ii) values tuples (start, end, list of the ASNs of the neighbors) with the entries of each node in the "preferences" array;
+									it is built by the method "set_preferences(...)" (if it is None), and set to None when a node or link is added or removed
 	'''
 
 
 	'''
-	Contructor for object of the class BGPtopology. Creates the class variable "list_of_all_BGP_nodes" as an empty dictionary.
+	Contructor for object of the class BGPtopology. Creates the class variable "list_of_all_BGP_nodes" as an empty dictionary, and an empty BGP message queue.
+
+	Input argument:
+		(a) fast_converge: boolean (optional) - IF TRUE, enables the fast converge mode
 	'''
-	def __init__(self):
+	def __init__(self,fast_converge=False):
 		self.list_of_all_BGP_nodes = {}
+		self.BGP_message_queue = deque()
+		self.propagating = False
+		self.nb_of_BGP_messages = 0
+		self.fast_converge = fast_converge
+		self.message_passing_prefixes = set()
+		self.node_ids = {}
+		self.node_ASNs = []
+		self.prefix_index = {}
+		self.customer_cones = None
+		self.compact_topology = None
+		self.stats = None
+		self.routing_epoch = 0
+		self.preferences = None
+		self.preference_seed = None
+		self.filtered_prefixes = set()
+		self.preference_epoch = 0
+		self.preference_entries = None
 
 	
 	'''
@@ -44,6 +93,7 @@ class BGPtopology:
 	'''
 	def add_node(self,ASN):
 		if not self.has_node(ASN):
+			self.clear_link_structures()
 			self.list_of_all_BGP_nodes[ASN] = BGPnode(ASN,self)
 
 	
@@ -63,7 +113,7 @@ class BGPtopology:
 	Return a node (i.e. the BGPnode object) belonging to the topology.
 	
 	IF the given node exists in the "list_of_all_BGP_nodes" dictionary, 
-	THEN return the node
+	THEN return the node (after clearing its routing tables, if they are stale; see the method "clear_routing_information(...)")
 	
 	Input argument:
 		(a) ASN: the ASN of the node to be returned
@@ -73,7 +123,10 @@ class BGPtopology:
 	'''
 	def get_node(self,ASN):
 		if self.has_node(ASN):
-			return self.list_of_all_BGP_nodes[ASN]
+			node = self.list_of_all_BGP_nodes[ASN]
+			if node.routing_epoch != self.routing_epoch:
+				node.clear_routing_tables()
+			return node
 
 	
 	'''
@@ -100,6 +153,8 @@ class BGPtopology:
 	THEN 	add them.
 	IF a link between the two given nodes does not exist,
 	THEN 	add ASN1 to ASN2's neighbors and ASN2 to ASN1's neighbors, and set the peering types according to the given type.
+	IF the preferences are set from a seed (see the method "set_preferences(...)")
+	THEN 	the preferences of the two nodes for their neighbors are computed from the seed (see the method "set_hashed_preferences_of_nodes(...)"), ELSE a random preference is drawn for the new neighbors
 	
 	Input arguments:
 		(a) ASN1: the AS number of the first node
@@ -107,6 +162,7 @@ class BGPtopology:
 		(c) peering_type: an int (-1 or 0) that denotes the peering relation type between the two nodes; IF -1 then ASN2 is customer of ASN1, ELSE IF 0 then the nodes are peers
 	'''
 	def add_link(self,ASN1, ASN2,peering_type):
+		self.clear_link_structures()
 		if not self.has_node(ASN1):
 			self.add_node(ASN1)
 		if not self.has_node(ASN2):
@@ -120,14 +176,19 @@ class BGPtopology:
 				self.list_of_all_BGP_nodes[ASN2].add_ASneighbor(ASN1,'peer')
 			else:
 				print('ERROR: Not valid peering relation')
+			if self.preference_seed is not None:
+				self.set_hashed_preferences_of_nodes([ASN1,ASN2])
 		else:
 			print('ERROR: a link already exists')
 
 
 	def remove_link(self,ASN1, ASN2):
 		if self.has_node(ASN1) and self.has_node(ASN2) and self.has_link(ASN1,ASN2):
+			self.clear_link_structures()
 			self.list_of_all_BGP_nodes[ASN1].remove_ASneighbor(ASN2)
 			self.list_of_all_BGP_nodes[ASN2].remove_ASneighbor(ASN1)
+			if self.preference_seed is not None:
+				self.set_hashed_preferences_of_nodes([ASN1,ASN2])
 
 
 	'''
@@ -156,22 +217,95 @@ class BGPtopology:
 	Adds the given prefix to the given node.
 	
 	IF the node exists in the topology, 
-	THEN add the prefix
+	THEN 	IF the fast converge mode is enabled and can be used for the prefix
+			THEN 	add the prefix to the node (without announcing it), and compute directly the converged paths (method "fast_converge_prefix(...)")
+			ELSE 	add the prefix (and announce it with BGP messages)
 
 	Input arguments:
 		(a) ASN: the AS number of the node
 		(b) IPprefix: the (owned) prefix to be added
+		(c) forbidden_neighbors: list of neighbors to which the prefix is not announced; default value is None (i.e., announce to all neighbors)
 	'''
 	def add_prefix(self,ASN,IPprefix,forbidden_neighbors=None):
-		if self.has_node(ASN):
-			self.get_node(ASN).add_prefix(IPprefix,forbidden_neighbors=forbidden_neighbors)
+		with self.phase('add_prefix'):
+			if self.has_node(ASN):
+				self.prefix_index.pop(IPprefix,None)
+				if forbidden_neighbors is not None:
+					self.message_passing_prefixes.add(IPprefix)
+				node = self.get_node(ASN)
+				if self.fast_converge and self.can_fast_converge(IPprefix):
+					if not node.has_prefix(IPprefix):
+						node.IPprefix.add(IPprefix)
+						node.paths[IPprefix] = []
+						self.fast_converge_prefix(IPprefix)
+				else:
+					node.add_prefix(IPprefix,forbidden_neighbors=forbidden_neighbors)
+
+
+	'''
+	Adds many prefixes (each to a given node) at once, and computes directly their converged paths (i.e., as in the fast converge mode, even if it is not enabled) in batches of prefixes.
+
+	The converged routes of a batch of prefixes are computed together (i.e., vectorized over the prefixes) with the array-backed copy of the topology (see the method "compute_routes(...)" of the CompactTopology class),
+	and then they are set in the "paths" and "all_paths" dictionaries of the nodes (the same paths as set by the method "fast_converge_prefix(...)").
+
+	IF a prefix is given more than once, OR it already exists in the topology (i.e., any node has a path, or a filter, for the prefix), OR it is in the "message_passing_prefixes"
+	THEN 	add it with the method "add_prefix(...)" (after the batched prefixes)
+
+	Input arguments:
+		(a) origins_and_prefixes:	list of tuples (ASN, IPprefix), where ASN is the AS number of the node to which the prefix is added
+		(b) batch_size:				the number of prefixes whose routes are computed at once; default value is 64
+	'''
+	def add_prefixes(self,origins_and_prefixes,batch_size=64):
+		with self.phase('add_prefixes'):
+			origins_and_prefixes = [(ASN,IPprefix) for ASN,IPprefix in origins_and_prefixes if self.has_node(ASN)]
+			existing_prefixes = self.message_passing_prefixes | self.filtered_prefixes
+			for ASN,node in self.get_nodes_with_routing_tables():
+				existing_prefixes.update(node.paths.keys(),node.IPprefix,node.hijacked_IPprefix.keys())
+			batched, remaining = [], []
+			for ASN,IPprefix in origins_and_prefixes:
+				if IPprefix in existing_prefixes:
+					remaining.append((ASN,IPprefix))
+				else:
+					existing_prefixes.add(IPprefix)
+					batched.append((ASN,IPprefix))
+
+			if batched:
+				if self.compact_topology is None:
+					self.compact_topology = CompactTopology.from_BGPtopology(self)
+				compact = self.compact_topology
+				ASNs = compact.ASNs.tolist()
+				nodes = [self.get_node(ASN) for ASN in ASNs]	# the nodes in the order of their ids in the compact topology (with their stale routing tables cleared, since paths are set to all nodes)
+				for k in range(0,len(batched),batch_size):
+					batch = batched[k:k+batch_size]
+					origin_ids = [compact.ASN_to_id[ASN] for ASN,IPprefix in batch]
+					next_hop, length, route_class = compact.compute_routes(origin_ids)
+					exported_columns, exported_from, exported_to = compact.get_exported_routes(next_hop,length,route_class)
+					bounds = np.searchsorted(exported_columns,np.arange(len(batch)+1))
+					for j,(origin_id,(ASN,IPprefix)) in enumerate(zip(origin_ids,batch)):
+						self.prefix_index.pop(IPprefix,None)
+						nodes[origin_id].IPprefix.add(IPprefix)
+						nodes[origin_id].paths[IPprefix] = []
+						announced_paths = [None]*len(ASNs)	# the paths announced by the nodes, by id
+						announced_paths[origin_id] = ASpath(ASN)
+						ids = np.flatnonzero(length[:,j] > 1)
+						ids = ids[np.argsort(length[ids,j],kind='stable')]	# in increasing path length, so that the path of the next hop is computed first
+						for x,u in zip(ids.tolist(),next_hop[ids,j].tolist()):
+							nodes[x].paths[IPprefix] = announced_paths[u]
+							announced_paths[x] = ASpath(ASNs[x],announced_paths[u])
+						for u,x in zip(exported_from[bounds[j]:bounds[j+1]].tolist(),exported_to[bounds[j]:bounds[j+1]].tolist()):
+							nodes[x].all_paths[IPprefix][ASNs[u]] = announced_paths[u]
+
+			for ASN,IPprefix in remaining:
+				self.add_prefix(ASN,IPprefix)
 
 
 	'''
 	Hijack the given prefix from the given node with the given hijack type.
 	
 	IF the node exists in the topology, 
-	THEN hijack the prefix
+	THEN 	IF the fast converge mode is enabled and can be used for the prefix
+			THEN 	set the hijacked path to the node (without announcing it), and compute directly the converged paths (method "fast_converge_prefix(...)")
+			ELSE 	hijack the prefix (and announce the hijacked path with BGP messages)
 
 	Input arguments:
 		(a) ASN: the AS number of the node
@@ -179,9 +313,447 @@ class BGPtopology:
 		(c) hijack_type: the type of the hijack attack
 	'''
 	def do_hijack(self,ASN,IPprefix,hijack_type):
-		if self.has_node(ASN):
-			self.get_node(ASN).do_hijack(IPprefix,hijack_type)
+		with self.phase('do_hijack'):
+			if self.has_node(ASN):
+				self.prefix_index.pop(IPprefix,None)
+				node = self.get_node(ASN)
+				if self.fast_converge and self.can_fast_converge(IPprefix):
+					if (not node.has_prefix(IPprefix)) and (not node.has_hijacked_prefix(IPprefix)):
+						node.add_hijacked_prefix(IPprefix,hijack_type)
+						path_to_announce = node.get_hijack_path(IPprefix,hijack_type)
+						node.paths[IPprefix] = path_to_announce[1:]
+						if len(path_to_announce):
+							self.fast_converge_prefix(IPprefix)
+				else:
+					node.do_hijack(IPprefix,hijack_type)
+
+
+	'''
+	Withdraws the given prefix from the given node, i.e., the node stops announcing the prefix that it owns or has hijacked; the other owners/hijackers of the prefix (if any) continue to announce it.
+
+	IF the node exists in the topology, 
+	THEN 	IF the fast converge mode is enabled and can be used for the prefix
+			THEN 	remove the prefix from the owned/hijacked prefixes of the node, and compute directly the converged paths (method "fast_converge_prefix(...)")
+			ELSE 	withdraw the prefix (and propagate the withdrawals with BGP messages; see the method "withdraw_prefix(...)" of the BGPnode class)
+
+	Input arguments:
+		(a) ASN: the AS number of the node
+		(b) IPprefix: the (owned or hijacked) prefix to be withdrawn
+	'''
+	def withdraw_prefix(self,ASN,IPprefix):
+		with self.phase('withdraw_prefix'):
+			if self.has_node(ASN):
+				self.prefix_index.pop(IPprefix,None)
+				node = self.get_node(ASN)
+				if self.fast_converge and self.can_fast_converge(IPprefix):
+					if node.has_prefix(IPprefix) or node.has_hijacked_prefix(IPprefix):
+						node.IPprefix.discard(IPprefix)
+						node.hijacked_IPprefix.pop(IPprefix,None)
+						node.paths.pop(IPprefix,None)
+						self.fast_converge_prefix(IPprefix)
+				else:
+					node.withdraw_prefix(IPprefix)
+
+
+	'''
+	Checks if the converged paths for the given prefix can be computed directly (i.e., in the fast converge mode).
+
+	IF the prefix has been announced only to some of the neighbors of its origin (i.e., it is in the "message_passing_prefixes"), OR any node has a filter for the prefix (i.e., it is in the "filtered_prefixes")
+	THEN 	return FALSE
+	ELSE 	return TRUE
+
+	Input argument:
+		(a) IPprefix: the prefix to be checked
+
+	Returns:
+		TRUE if the fast converge mode can be used for the prefix, FALSE otherwise
+	'''
+	def can_fast_converge(self,IPprefix):
+		return (IPprefix not in self.message_passing_prefixes) and (IPprefix not in self.filtered_prefixes)
+
+
+	'''
+	Computes directly the converged paths for the given prefix (i.e., the paths that would be selected after the exchange of all BGP messages), and sets them in the "paths" and "all_paths" dictionaries of the nodes.
+
+	The announcing nodes are the owners of the prefix (announcing the path [ASN]) and the hijackers of the prefix (announcing the hijacked path); they announce to all their neighbors and do not accept any paths for the prefix.
+	The paths are computed with a three-phase BFS, which follows the preference customer > peer > provider, the shortest path, and the neighbor preference ("ASneighbors_preference") as tie-breaker:
+		(i) 	customer routes: the paths are propagated upwards (customer -> provider) from the announcing nodes, in increasing path length
+		(ii) 	peer routes: the nodes without a customer route select among the paths of their peers that have a customer route (or, are announcing nodes)
+		(iii) 	provider routes: the paths are propagated downwards (provider -> customer) from all the nodes with a path, in increasing path length
+	As in the exchange of BGP messages, a path that contains the ASN of the receiving node is discarded.
+
+	The complexity is O(V+E) per prefix (apart from the loop checks, which are linear to the path lengths).
+
+	Input argument:
+		(a) IPprefix: the prefix for which the paths are computed
+	'''
+	def fast_converge_prefix(self,IPprefix):
+		with self.phase('fast_converge_prefix'):
+			nodes = self.list_of_all_BGP_nodes
+			self.prefix_index.pop(IPprefix,None)
+
+			fixed_nodes = set()		# the owners and hijackers of the prefix, which do not accept paths
+			announced_paths = {}	# the paths that are announced by the announcing nodes, and (after the BFS) by all nodes with a path
+			routing_epoch = self.routing_epoch
+			for ASN,node in nodes.items():
+				if node.routing_epoch != routing_epoch:	# stale routing tables: they are cleared in this pass, since the paths are set to all nodes
+					node.clear_routing_tables()
+				elif node.has_prefix(IPprefix):
+					fixed_nodes.add(ASN)
+					announced_paths[ASN] = ASpath(ASN)
+				elif node.has_hijacked_prefix(IPprefix):
+					fixed_nodes.add(ASN)
+					if (node.hijacked_IPprefix[IPprefix] == 0) or node.paths.get(IPprefix):
+						announced_paths[ASN] = ASpath(ASN,node.paths[IPprefix])
+
+			next_hop = {}		# dictionary with (i) keys the ASNs of the nodes with a path, and (ii) values the neighbor from which the path is received
+			route_class = {}	# dictionary with (i) keys the ASNs of the nodes with a path, and (ii) values {-1,0,1} if the path is received from a {customer,peer,provider}
+
+			# phase (i): customer routes
+			self.fast_converge_propagate(list(announced_paths.keys()),announced_paths,next_hop,route_class,fixed_nodes,1)
+
+			# phase (ii): peer routes
+			candidates = {}
+			for u,path_u in list(announced_paths.items()):
+				for x,relation in nodes[u].ASneighbors.items():
+					if (relation == 0) and (x not in fixed_nodes) and (x not in next_hop) and (x not in path_u):
+						current = candidates.get(x)
+						if (current is None) or (len(path_u) < len(announced_paths[current])) or \
+							((len(path_u) == len(announced_paths[current])) and (nodes[x].ASneighbors_preference[u] > nodes[x].ASneighbors_preference[current])):
+							candidates[x] = u
+			for x,u in candidates.items():
+				next_hop[x] = u
+				route_class[x] = 0
+				announced_paths[x] = ASpath(x,announced_paths[u])
+
+			# phase (iii): provider routes
+			self.fast_converge_propagate(list(announced_paths.keys()),announced_paths,next_hop,route_class,fixed_nodes,-1)
+
+			# set the converged paths to the nodes
+			for ASN,node in nodes.items():
+				if ASN not in fixed_nodes:
+					node.paths.pop(IPprefix,None)
+					node.all_paths.pop(IPprefix,None)
+					node.ranked_paths.pop(IPprefix,None)
+			for x,u in next_hop.items():
+				nodes[x].paths[IPprefix] = announced_paths[u]
+			for u,path_u in announced_paths.items():
+				export_to_all = (u in fixed_nodes) or (route_class[u] == -1)
+				for x,relation in nodes[u].ASneighbors.items():
+					if (export_to_all or (relation == -1)) and (x not in fixed_nodes) and (x not in path_u):
+						nodes[x].all_paths[IPprefix][u] = path_u
+
+
+	'''
+	Propagates paths (in the fast converge mode) from the given nodes to the neighbors of the given relation type, in increasing path length; the nodes that receive a path, propagate it further to their neighbors of the same relation type.
+
+	FOR each path length (starting from the shortest announced path)
+		FOR each node that announces a path of this length
+			offer the path to its neighbors of the given relation type, which do not have a path (and are not in the announced path)
+		Each neighbor that has received an offer, selects the offer from the neighbor with the highest preference, and announces it (with a length increased by one)
+
+	Input arguments:
+		(a) sources: 			list of ASNs of the nodes that initially announce paths
+		(b) announced_paths:	dictionary with the paths announced by each node; it is updated with the paths of the nodes that receive paths
+		(c) next_hop:			dictionary with the neighbor from which each node has received its path; it is updated with the nodes that receive paths
+		(d) route_class:		dictionary with the type {-1,0,1} of the neighbor from which each node has received its path; it is updated with the nodes that receive paths
+		(e) fixed_nodes:		set of ASNs of the nodes that do not accept paths
+		(f) export_relation:	the type of the neighbors (from the announcing node's perspective) to which the paths are propagated; 1 (i.e., to providers) or -1 (i.e., to customers)
+	'''
+	def fast_converge_propagate(self,sources,announced_paths,next_hop,route_class,fixed_nodes,export_relation):
+		nodes = self.list_of_all_BGP_nodes
+		buckets = defaultdict(list)
+		for ASN in sources:
+			buckets[len(announced_paths[ASN])].append(ASN)
+		if not buckets:
+			return
+		path_length = min(buckets.keys())
+		while buckets:
+			candidates = {}
+			for u in buckets.pop(path_length,[]):
+				path_u = announced_paths[u]
+				for x,relation in nodes[u].ASneighbors.items():
+					if (relation == export_relation) and (x not in fixed_nodes) and (x not in next_hop) and (x not in path_u):
+						current = candidates.get(x)
+						if (current is None) or (nodes[x].ASneighbors_preference[u] > nodes[x].ASneighbors_preference[current]):
+							candidates[x] = u
+			for x,u in candidates.items():
+				next_hop[x] = u
+				route_class[x] = -export_relation
+				announced_paths[x] = ASpath(x,announced_paths[u])
+				buckets[path_length+1].append(x)
+			path_length += 1
+
+
+
+	'''
+	Sends a BGP message from a node to one of its neighbors, i.e., appends the message to the end of the "BGP_message_queue".
+	The message is delivered later by the method "propagate_BGP_messages()".
+
+	Input arguments:
+		(a) message_type:	a string {'announce','withdraw'} denoting the type of the BGP message
+		(b) IPprefix:		the prefix of the BGP message
+		(c) from_ASN:		the AS number of the node that sends the message
+		(d) to_ASN:			the AS number of the node that receives the message
+		(e) path:			the announced path (i.e., list of ASNs) ; default value is None (i.e., for withdrawals)
+	'''
+	def send_BGP_message(self,message_type,IPprefix,from_ASN,to_ASN,path=None):
+		self.BGP_message_queue.append((message_type,IPprefix,from_ASN,to_ASN,path))
+		stats = self.stats
+		if stats is not None:
+			if message_type == 'announce':
+				stats.announcements_sent += 1
+			else:
+				stats.withdrawals_sent += 1
+			stats.max_queue_depth = max(stats.max_queue_depth,len(self.BGP_message_queue))
+
+
+	'''
+	Delivers the BGP messages in the "BGP_message_queue" (in FIFO order) to the receiving nodes, until no more messages are sent, i.e., until the propagation of the BGP messages converges.
+
+	The BGP messages that are sent by a node during the reception of a message, are appended to the queue (and not delivered directly);
+	in this way the propagation is iterative, and its stack depth does not depend on the size of the topology or on the length of the paths.
+
+	IF the messages are already being delivered (i.e., the method has been called -indirectly- during the reception of a message)
+	THEN 	return (the messages will be delivered by the ongoing call)
+	ELSE 	WHILE the queue is not empty
+				pop the first message, and
+				IF it is an announcement, THEN call the method "receive_path(...)" of the receiving node,
+				ELSE call the method "withdraw_path(...)" of the receiving node
+
+	IF the instrumentation is enabled, THEN update also the counters of the received messages, best path changes, recursion depth and convergence rounds (see the class PropagationStats)
+	'''
+	def propagate_BGP_messages(self):
+		stats = self.stats
+		if self.propagating:	# a call during the delivery of the messages (e.g., by a receiving node); its messages are delivered by the running call
+			if stats is not None:
+				stats.reentrant_calls += 1
+			return
+		self.propagating = True
+		try:
+			queue = self.BGP_message_queue
+			nodes = self.list_of_all_BGP_nodes
+			prefix_index = self.prefix_index
+			routing_epoch = self.routing_epoch
+			if stats is None:
+				while queue:
+					message_type, IPprefix, from_ASN, to_ASN, path = queue.popleft()
+					self.nb_of_BGP_messages += 1
+					if prefix_index:
+						prefix_index.pop(IPprefix,None)	# the paths for the prefix may change
+					node = nodes[to_ASN]
+					if node.routing_epoch != routing_epoch:	# stale routing tables (from before the last clearing of the routing information)
+						node.clear_routing_tables()
+					if message_type == 'announce':
+						node.receive_path(IPprefix,path)
+					else:
+						node.withdraw_path(IPprefix,from_ASN)
+			else:
+				rounds = 0
+				messages_left_in_round = 0
+				while queue:
+					if messages_left_in_round == 0:	# the messages of the previous round have been delivered; the messages in the queue form the next round
+						rounds += 1
+						messages_left_in_round = len(queue)
+					messages_left_in_round -= 1
+					message_type, IPprefix, from_ASN, to_ASN, path = queue.popleft()
+					self.nb_of_BGP_messages += 1
+					if prefix_index:
+						prefix_index.pop(IPprefix,None)	# the paths for the prefix may change
+					node = nodes[to_ASN]
+					if node.routing_epoch != routing_epoch:
+						node.clear_routing_tables()
+					best_path = node.paths.get(IPprefix)
+					if message_type == 'announce':
+						stats.announcements_received += 1
+						node.receive_path(IPprefix,path)
+					else:
+						stats.withdrawals_received += 1
+						node.withdraw_path(IPprefix,from_ASN)
+					if node.paths.get(IPprefix) is not best_path:
+						stats.best_path_changes += 1
+				stats.convergence_rounds += rounds
+				stats.max_convergence_rounds = max(stats.max_convergence_rounds,rounds)
+		finally:
+			self.propagating = False
+
+
+
+	'''
+	Returns a snapshot of the (converged) routing state of all nodes for the given prefix, which can be restored later with the method "restore_prefix(...)".
+
+	The snapshot contains for each node with a state for the prefix: the best path ("paths"), the stored paths ("all_paths"), the ownership of the prefix ("IPprefix"), the hijack type if the node has hijacked the prefix ("hijacked_IPprefix"), and the filters ("filters").
+	The paths are not copied (paths are never modified in place; new paths are always new ASpaths or lists), so taking a snapshot costs a dictionary entry per node.
+
+	Input argument:
+		(a) IPprefix: the prefix whose routing state is stored
+
+	Returns:
+		A dictionary with the routing state for the prefix
+	'''
+	def snapshot_prefix(self,IPprefix):
+		snapshot = {'paths': {}, 'all_paths': {}, 'owners': set(), 'hijackers': {}, 'filters': {}, 'message_passing': IPprefix in self.message_passing_prefixes}
+		for ASN,node in self.get_nodes_with_routing_tables():
+			if IPprefix in node.paths:
+				snapshot['paths'][ASN] = node.paths[IPprefix]
+			if node.all_paths.get(IPprefix):
+				snapshot['all_paths'][ASN] = dict(node.all_paths[IPprefix])
+			if node.has_prefix(IPprefix):
+				snapshot['owners'].add(ASN)
+			if node.has_hijacked_prefix(IPprefix):
+				snapshot['hijackers'][ASN] = node.hijacked_IPprefix[IPprefix]
+			if node.filters.get(IPprefix):
+				snapshot['filters'][ASN] = set(node.filters[IPprefix])
+		return snapshot
+
+
+	'''
+	Removes the routing state of all nodes for the given prefix (i.e., the paths, the stored paths, the ownership, the hijacks and the filters), without exchanging any BGP messages; the routing state of the other prefixes is not affected.
+
+	Input argument:
+		(a) IPprefix: the prefix to be removed
+	'''
+	def drop_prefix(self,IPprefix):
+		self.prefix_index.pop(IPprefix,None)
+		self.message_passing_prefixes.discard(IPprefix)
+		self.filtered_prefixes.discard(IPprefix)
+		for ASN,node in self.get_nodes_with_routing_tables():
+			node.paths.pop(IPprefix,None)
+			node.all_paths.pop(IPprefix,None)
+			node.ranked_paths.pop(IPprefix,None)
+			node.IPprefix.discard(IPprefix)
+			node.hijacked_IPprefix.pop(IPprefix,None)
+			node.filters.pop(IPprefix,None)
+
+
+	'''
+	Restores the routing state of a snapshot (taken with the method "snapshot_prefix(...)") for the given prefix.
+
+	The existing routing state of all nodes for the prefix is removed (method "drop_prefix(...)"), and then the state of the snapshot is set, without exchanging any BGP messages.
+	The same snapshot can be restored multiple times (e.g., to evaluate different hijacks against the same legitimate routing state), or to a different prefix (i.e., fork the routing state to a new prefix).
+
+	Input arguments:
+		(a) snapshot: a dictionary returned by the method "snapshot_prefix(...)"
+		(b) IPprefix: the prefix whose routing state is restored
+	'''
+	def restore_prefix(self,snapshot,IPprefix):
+		self.drop_prefix(IPprefix)
+		get_node = self.get_node	# (clears the stale routing tables of the nodes, before their state is set)
+		for ASN,path in snapshot['paths'].items():
+			get_node(ASN).paths[IPprefix] = path
+		for ASN,paths in snapshot['all_paths'].items():
+			get_node(ASN).all_paths[IPprefix] = dict(paths)
+		for ASN in snapshot['owners']:
+			get_node(ASN).IPprefix.add(IPprefix)
+		for ASN,hijack_type in snapshot['hijackers'].items():
+			get_node(ASN).hijacked_IPprefix[IPprefix] = hijack_type
+		for ASN,filters in snapshot['filters'].items():
+			get_node(ASN).filters[IPprefix] = set(filters)
+			self.filtered_prefixes.add(IPprefix)
+		if snapshot['message_passing']:
+			self.message_passing_prefixes.add(IPprefix)
+
+
+	'''
+	Adds (in bulk) the given links to the topology; it has the same result as calling the method "add_link(...)" for each link in the given order
+	(i.e., the nodes are created and the random preferences of the neighbors are drawn in the same order), but without the overhead of the per link checks.
+	IF the preferences are set from a seed (see the method "set_preferences(...)"), THEN the preferences of the nodes of the given links are computed from the seed, as in the method "add_link(...)".
+
+	Input arguments:
+		(a) list_of_ASN1: list with the AS numbers of the first nodes of the links
+		(b) list_of_ASN2: list with the AS numbers of the second nodes of the links
+		(c) list_of_peering_types: list with the peering types (-1 or 0) of the links; see the method "add_link(...)"
+	'''
+	def add_links(self,list_of_ASN1,list_of_ASN2,list_of_peering_types):
+		nodes = self.list_of_all_BGP_nodes
+		rand = random.random
+		self.clear_link_structures()
+		for ASN1,ASN2,peering_type in zip(list_of_ASN1,list_of_ASN2,list_of_peering_types):
+			node1 = nodes.get(ASN1)
+			if node1 is None:
+				node1 = nodes[ASN1] = BGPnode(ASN1,self)
+			node2 = nodes.get(ASN2)
+			if node2 is None:
+				node2 = nodes[ASN2] = BGPnode(ASN2,self)
+			if (ASN2 in node1.ASneighbors) or (ASN1 in node2.ASneighbors):
+				print('ERROR: a link already exists')
+			elif (peering_type == -1) or (peering_type == 0):	# same as the method "add_ASneighbor(...)" of the BGPnode class
+				node1.ASneighbors[ASN2] = peering_type
+				node1.ASneighbors_preference[ASN2] = rand()
+				node2.ASneighbors[ASN1] = -peering_type
+				node2.ASneighbors_preference[ASN1] = rand()
+			else:
+				print('ERROR: Not valid peering relation')
+		if self.preference_seed is not None:
+			self.set_hashed_preferences_of_nodes(set(list_of_ASN1) | set(list_of_ASN2))
+
+
+	'''
+	Opens (for reading, in text mode) the given file; files ending in ".gz" or ".bz2" are decompressed on the fly.
+
+	Input argument:
+		(a) file: a string with the name of the file
 
+	Returns:
+		A file object
+	'''
+	def open_topology_file(self,file):
+		if file.endswith('.gz'):
+			return gzip.open(file,'rt')
+		elif file.endswith('.bz2'):
+			return bz2.open(file,'rt')
+		else:
+			return open(file,'r')
+
+
+	'''
+	Reads the links of the given csv file (of the "CAIDA AS-relationship dataset" format, see the method "load_topology_from_csv(...)").
+
+	IF use_cache is TRUE and a cache file (i.e., a .npz file with name the name of the csv file plus the suffix ".npz") exists, and it corresponds to the current version (size and modification time) of the csv file
+	THEN 	read the links from the cache file (IF the cache file cannot be read, THEN parse the csv file, as below)
+	ELSE 	parse the csv file, and (IF use_cache is TRUE) write the links to the cache file (if it cannot be written, e.g., in a read-only folder, then it is ignored)
+
+	Input arguments:
+		(a) file: a string with the name of the csv file to be read (it can be compressed with gzip or bzip2, i.e., ".gz" or ".bz2" file)
+		(b) asn_as_str: boolean - IF TRUE, then the ASNs are returned as strings, ELSE as integers
+		(c) use_cache: boolean - IF TRUE, then use (read or write) the cache file
+
+	Returns:
+		A tuple (list_of_ASN1, list_of_ASN2, list_of_peering_types) with the links, in the order they appear in the csv file
+	'''
+	def read_links_from_csv(self,file,asn_as_str=False,use_cache=True):
+		stat = os.stat(file)
+		cache_file = file+'.npz'
+		if use_cache and os.path.isfile(cache_file):
+			try:
+				with np.load(cache_file) as data:
+					if (data['source_size'] == stat.st_size) and (data['source_mtime'] == stat.st_mtime_ns) and (data['asn_as_str'] == asn_as_str):
+						return data['ASN1'].tolist(), data['ASN2'].tolist(), data['peering_type'].tolist()
+			except (OSError,EOFError,ValueError,KeyError,zipfile.BadZipFile):	# a corrupt (e.g., empty or partially written) or old cache file: parse the csv file again
+				pass
+
+		list_of_ASN1, list_of_ASN2, list_of_peering_types = [], [], []
+		with self.open_topology_file(file) as csvfile:
+			for row in csv.reader(csvfile,delimiter='|'):
+				if row and not row[0].startswith('#'):	# ignore lines starting with "#"
+					if asn_as_str:
+						list_of_ASN1.append(row[0])
+						list_of_ASN2.append(row[1])
+					else:
+						list_of_ASN1.append(int(row[0]))
+						list_of_ASN2.append(int(row[1]))
+					list_of_peering_types.append(int(row[2]))
+
+		if use_cache:
+			tmp_file = '{}.{}.tmp.npz'.format(file,os.getpid())
+			try:
+				np.savez(tmp_file,ASN1=np.array(list_of_ASN1,dtype=str if asn_as_str else np.int64),ASN2=np.array(list_of_ASN2,dtype=str if asn_as_str else np.int64),
+					peering_type=np.array(list_of_peering_types,dtype=np.int8),source_size=stat.st_size,source_mtime=stat.st_mtime_ns,asn_as_str=asn_as_str)
+				os.replace(tmp_file,cache_file)	# atomic, so that concurrent runs never read a partially written cache file
+			except OSError:
+				if os.path.exists(tmp_file):
+					os.remove(tmp_file)
+		return list_of_ASN1, list_of_ASN2, list_of_peering_types
 
 
 	'''
@@ -191,25 +763,688 @@ class BGPtopology:
 	The format is:		ASN1|ASN2|peering_type|other_not_used_fields
 				e.g., 	1|11537|0|bgp
 
+	The links are read with the method "read_links_from_csv(...)", i.e., the csv file can be compressed (".gz" or ".bz2") and, after the first load, they are read from a binary cache file.
+
 	Input arguments:
 		(a) file: a string with the name of the csv file to be read
 		(b) type: a string denoting the format type of the csv file; default is 'CAIDA' (which is currently the only supported type)
+		(c) asn_as_str: boolean - IF TRUE, then the ASNs are stored as strings; default is FALSE
+		(d) use_cache: boolean - IF TRUE, then use the binary cache file; default is TRUE
+		(e) preference_seed: integer - IF given, then the preferences of the nodes for their neighbors are set from this seed (see the method "set_preferences(...)"); default is None (i.e., random preferences drawn from the global random number generator)
 	'''
-	def load_topology_from_csv(self,file,type='CAIDA', asn_as_str=False):
+	def load_topology_from_csv(self,file,type='CAIDA', asn_as_str=False, use_cache=True, preference_seed=None):
 		try:
 			if type == 'CAIDA':
-				with open(file, 'r') as csvfile:
-					csvreader = csv.reader(csvfile,delimiter='|')
-					for row in csvreader:
-						if row[0][0] is not '#':	# ignore lines starting with "#"
-							if asn_as_str:
-								self.add_link(row[0],row[1],int(row[2]))
-							else:
-								self.add_link(int(row[0]),int(row[1]),int(row[2]))
+				self.add_links(*self.read_links_from_csv(file,asn_as_str=asn_as_str,use_cache=use_cache))
+				if preference_seed is not None:
+					self.set_preferences(preference_seed)
 		except IOError:
 			print('ERROR: file not found')
 
 
+	'''
+	Sets (i.e., re-draws) the preferences of all nodes for their neighbors (used as BGP tie breaker) from the given seed, without rebuilding the topology; e.g., to run a new Monte Carlo replica of the random preferences.
+
+	The preferences are computed at once for all the (node, neighbor) entries of the array-backed copy of the topology ("compact_topology"), from a hash of (ASN of the node, ASN of the neighbor, seed) (see the method "get_hashed_preferences(...)" of the CompactTopology class);
+	so, they are reproducible (they do not depend on the order in which the links are loaded, or on the global random number generator). They are stored in the "preferences" array, and the "preference_epoch" is increased,
+	i.e., the "ASneighbors_preference" dictionaries of the nodes are not set here (which would cost O(E) per call), but from the "preferences" array when each node is next used (see the method "clear_routing_tables()" of the BGPnode class).
+	Since the paths depend on the preferences, the routing information of all nodes is cleared (see the method "clear_routing_information(...)"); hence, every node with stale preferences has stale routing tables, which are cleared (and its preferences set) before it is used.
+
+	Input argument:
+		(a) seed: integer - the seed of the preferences
+	'''
+	def set_preferences(self,seed):
+		if self.compact_topology is None:
+			self.compact_topology = CompactTopology.from_BGPtopology(self)
+		compact = self.compact_topology
+		self.preferences = CompactTopology.get_hashed_preferences(compact.ASNs,compact.indptr,compact.indices,seed)
+		self.preference_seed = seed
+		compact.preferences = self.preferences.astype(np.float64)
+		compact.relation_entries = {}
+		if self.preference_entries is None:
+			neighbor_ASNs = compact.ASNs[compact.indices].tolist()
+			indptr = compact.indptr.tolist()
+			self.preference_entries = {ASN:(indptr[i],indptr[i+1],neighbor_ASNs[indptr[i]:indptr[i+1]]) for i,ASN in enumerate(compact.ASNs.tolist())}
+		self.preference_epoch += 1
+		self.clear_routing_information()
+
+
+	'''
+	Returns the preferences of the given node for its neighbors from the "preferences" array (see the method "set_preferences(...)"), i.e., a dictionary with (i) keys the ASNs of the neighbors and (ii) values the preferences.
+
+	Input argument:
+		(a) ASN: the ASN of the node
+	'''
+	def get_preferences_of_node(self,ASN):
+		start, end, neighbor_ASNs = self.preference_entries[ASN]
+		return dict(zip(neighbor_ASNs,self.preferences[start:end].tolist()))
+
+
+	'''
+	Sets the stale "ASneighbors_preference" of all nodes (i.e., of the nodes that have not been used since the last "set_preferences(...)") from the "preferences" array;
+	it costs O(E), so it is called only before the links change (i.e., before the "preferences" array is removed; see the method "clear_link_structures()").
+	'''
+	def refresh_preferences(self):
+		preference_epoch = self.preference_epoch
+		for ASN,node in self.list_of_all_BGP_nodes.items():
+			if node.preference_epoch != preference_epoch:
+				node.ASneighbors_preference = self.get_preferences_of_node(ASN)
+				node.preference_epoch = preference_epoch
+
+
+	'''
+	Sets the preferences of the given nodes for their neighbors from the "preference_seed", i.e., to the preferences that the method "set_preferences(preference_seed)" would set for the current links of the nodes.
+	It is used when the links of the nodes change, since the preference of a node for a neighbor depends on (the hashes of) all its neighbors (see the method "get_hashed_preferences(...)" of the CompactTopology class).
+
+	Input argument:
+		(a) list_of_ASNs: the ASNs of the nodes
+	'''
+	def set_hashed_preferences_of_nodes(self,list_of_ASNs):
+		for ASN in list_of_ASNs:
+			node = self.list_of_all_BGP_nodes[ASN]
+			neighbors = list(node.ASneighbors.keys())
+			degree = len(neighbors)
+			indptr = np.full(degree+2,degree,dtype=np.int64)	# the node (with id 0) and its neighbors (with ids 1,...,degree, and no neighbors)
+			indptr[0] = 0
+			preferences = CompactTopology.get_hashed_preferences(np.array([ASN]+neighbors),indptr,np.arange(1,degree+1),self.preference_seed)
+			node.ASneighbors_preference = dict(zip(neighbors,preferences.tolist()))
+
+
+	'''
+	Removes the structures that are computed from the links (i.e., the "customer_cones", the "compact_topology", the "preferences" and the "preference_entries"), before a node or link is added or removed;
+	the stale preferences of the nodes are set first (see the method "refresh_preferences()"), since they are set from the "preferences" array.
+	'''
+	def clear_link_structures(self):
+		if self.preferences is not None:
+			self.refresh_preferences()
+		self.customer_cones = None
+		self.compact_topology = None
+		self.preferences = None
+		self.preference_entries = None
+
+
+	'''
+	Estimates the probability of each node to be infected by a hijack (i.e., to have a path to the hijacker) over an ensemble of random preference draws (i.e., the BGP tie breaker), without changing the preferences or the paths of the nodes.
+
+	The draw k has the preferences set by the method "set_preferences(seed+k)", and its routes are the ones computed in the fast converge mode after the victim announces the prefix and the hijacker hijacks it ("add_prefix(...)" and "do_hijack(...)").
+	The routes of a batch of draws are computed together (i.e., vectorized over the draws) with the array-backed copy of the topology (see the method "compute_hijack_routes(...)" of the CompactTopology class).
+	The confidence intervals of the probabilities are Wilson score intervals, and the confidence interval of the mean impact is the normal approximation.
+
+	Input arguments:
+		(a) victim_ASN:		the AS number of the victim (i.e., the legitimate origin of the prefix)
+		(b) hijacker_ASN:	the AS number of the hijacker
+		(c) hijack_type:	the type of the hijack attack; default value is 0
+		(d) nb_of_draws:	the number of preference draws; default value is 100
+		(e) seed:			the seed of the first draw; default value is 0
+		(f) z:				the z-score of the confidence intervals; default value is 1.96 (i.e., 95% confidence)
+		(g) batch_size:		the number of draws whose routes are computed at once; default value is 32
+
+	Returns:
+		A dictionary with the entries:
+			(i)		'ASNs':			np.array (V) with the ASNs of the nodes
+			(ii)	'probability':	np.array (V) with the fraction of the draws in which each node is infected
+			(iii)	'ci_low':		np.array (V) with the lower bound of the confidence interval of each probability
+			(iv)	'ci_high':		np.array (V) with the upper bound of the confidence interval of each probability
+			(v)		'impact':		np.array (nb_of_draws) with the number of infected nodes in each draw
+			(vi)	'impact_mean':	the mean number of infected nodes
+			(vii)	'impact_ci':	tuple with the bounds of the confidence interval of the mean number of infected nodes
+	'''
+	def get_hijack_infection_probabilities(self,victim_ASN,hijacker_ASN,hijack_type=0,nb_of_draws=100,seed=0,z=1.96,batch_size=32):
+		with self.phase('monte_carlo'):
+			if self.compact_topology is None:
+				self.compact_topology = CompactTopology.from_BGPtopology(self)
+			compact = self.compact_topology
+			victim_id, hijacker_id = compact.ASN_to_id[victim_ASN], compact.ASN_to_id[hijacker_ASN]
+			nb_of_infections = np.zeros(len(compact.ASNs),dtype=np.int64)
+			impact = np.zeros(nb_of_draws,dtype=np.int64)
+			for k in range(0,nb_of_draws,batch_size):
+				preferences = compact.get_preference_draws(range(seed+k,seed+min(k+batch_size,nb_of_draws)))
+				infected, length = compact.compute_hijack_routes(victim_id,hijacker_id,hijack_type,preferences)
+				nb_of_infections += infected.sum(axis=1)
+				impact[k:k+preferences.shape[1]] = infected.sum(axis=0)
+
+			probability = nb_of_infections / nb_of_draws
+			ci_low, ci_high = self.get_wilson_interval(nb_of_infections,nb_of_draws,z)
+			impact_mean = impact.mean()
+			impact_error = z*impact.std(ddof=1)/np.sqrt(nb_of_draws) if nb_of_draws > 1 else 0.0
+			return {'ASNs': compact.ASNs, 'probability': probability, 'ci_low': ci_low, 'ci_high': ci_high,
+					'impact': impact, 'impact_mean': impact_mean, 'impact_ci': (impact_mean-impact_error,impact_mean+impact_error)}
+
+
+	'''
+	Computes the impact of the hijacks of a prefix of the given victim by each of the given hijackers, for each of the given hijack types (i.e., the number of nodes with a path to the hijacker, as returned by the method "get_nb_of_nodes_with_hijacked_path_to_prefix(...)"
+	after "add_prefix(...)" and "do_hijack(...)" in the fast converge mode), without changing the paths of the nodes.
+
+	The legitimate routes of the victim are computed once, and reused for all the hijackers and hijack types. The hijacked routes of a batch of hijackers are computed together (i.e., vectorized over the hijackers)
+	with the array-backed copy of the topology (see the method "compute_hijack_routes(...)" of the CompactTopology class); the batches are executed in parallel by a SimulationRunner (IF nb_of_processes > 1),
+	which is given only the compact topology (i.e., the routing information of the nodes, and the global random number generator, are not changed).
+
+	Input arguments:
+		(a) victim_ASN:			the AS number of the victim
+		(b) list_of_hijackers:	list with the AS numbers of the hijackers; default value is None (i.e., all the nodes of the topology, apart from the victim)
+		(c) hijack_types:		list with the types of the hijacks; default value is [0,1,2]
+		(d) batch_size:			the number of hijackers whose routes are computed at once; default value is 64
+		(e) nb_of_processes:	the number of worker processes; default value is 1
+
+	Returns:
+		A list (i.e., the ranked table) of tuples (hijacker_ASN, hijack_type, nb_of_infected_nodes, fraction_of_infected_nodes), sorted in decreasing order of impact
+	'''
+	def get_hijack_impact_per_hijacker(self,victim_ASN,list_of_hijackers=None,hijack_types=(0,1,2),batch_size=64,nb_of_processes=1):
+		if self.compact_topology is None:
+			self.compact_topology = CompactTopology.from_BGPtopology(self)
+		compact = self.compact_topology
+		victim_id = compact.ASN_to_id[victim_ASN]
+		if list_of_hijackers is None:
+			list_of_hijackers = compact.ASNs.tolist()
+		hijackers = [ASN for ASN in dict.fromkeys(list_of_hijackers) if (ASN in compact.ASN_to_id) and (ASN != victim_ASN)]
+		hijacker_ids = np.array([compact.ASN_to_id[ASN] for ASN in hijackers],dtype=np.int64)
+		legitimate_routes = compact.compute_routes([victim_id])
+
+		def compute_batch(compact_topology,run_id,rng):
+			hijack_type, k = run_id
+			infected, length = compact_topology.compute_hijack_routes(victim_id,hijacker_ids[k:k+batch_size],hijack_type,legitimate_routes=legitimate_routes)
+			return infected.sum(axis=0).tolist()
+
+		from SimulationRunner import SimulationRunner	# (imported only when needed, so that loading the topology does not load the runner)
+		runner = SimulationRunner(compact,compute_batch,nb_of_processes=nb_of_processes,clear_after_run=False,seed_random=False)	# the batches only read the compact topology
+		table = []
+		for (hijack_type,k), seed, impact in runner.run([(hijack_type,k) for hijack_type in hijack_types for k in range(0,len(hijackers),batch_size)]):
+			table.extend((ASN,hijack_type,nb,nb/len(compact.ASNs)) for ASN,nb in zip(hijackers[k:k+batch_size],impact))
+		table.sort(key=lambda row: row[2],reverse=True)
+		return table
+
+
+	'''
+	Computes the impact of the hijacks (of the given type) of a prefix of each of the given victims by each of the given hijackers (e.g., a list of known hijackers), as the method "get_hijack_impact_per_hijacker(...)",
+	and stores it in a victim x hijacker matrix in a file (in the .npy format), which is written (and can be read) as a memory-mapped array, i.e., without keeping the whole matrix in memory.
+
+	The victims are processed in batches: the legitimate routes of a batch of victims are computed together (one column per victim), and then the hijacked routes of all the (victim, hijacker) pairs of the batch are computed together,
+	in passes of batch_size pairs (see the method "compute_hijack_routes(...)" of the CompactTopology class); the batches of victims are executed in parallel by a SimulationRunner (IF nb_of_processes > 1), and their rows are written to the matrix as soon as they are computed.
+	The SimulationRunner is given only the compact topology (i.e., the routing information of the nodes, and the global random number generator, are not changed).
+	The arrays of a batch (the legitimate routes of its victims, and the temporary arrays of a computation) take about 60 bytes per node and column (i.e., per victim, or per pair); so, the peak memory of each process
+	is about 60*V*max(victims_per_batch,batch_size) bytes (e.g., about 300 MB for an AS-graph with 75k ASes, with the default values), and it is multiplied by nb_of_processes.
+	The element of a victim that is also a hijacker (i.e., the hijacker of its own prefix) is -1.
+	The ASNs of the victims and of the hijackers (i.e., of the rows and columns of the matrix) are stored in the file "<filename>.ASNs.npz"; see the method "load_hijack_impact_matrix(...)".
+
+	Input arguments:
+		(a) filename:			the name of the file of the matrix (e.g., "impact.npy")
+		(b) list_of_hijackers:	list with the AS numbers of the hijackers
+		(c) list_of_victims:	list with the AS numbers of the victims; default value is None (i.e., all the nodes of the topology)
+		(d) hijack_type:		the type of the hijack attack; default value is 0
+		(e) batch_size:			the number of (victim, hijacker) pairs whose routes are computed at once; default value is 64
+		(f) victims_per_batch:	the number of victims whose legitimate routes are computed at once (i.e., in a single batch); default value is 64
+		(g) nb_of_processes:	the number of worker processes; default value is 1
+
+	Returns:
+		A dictionary with the entries 'impact', 'victims', and 'hijackers' (see the method "load_hijack_impact_matrix(...)")
+	'''
+	def write_hijack_impact_matrix(self,filename,list_of_hijackers,list_of_victims=None,hijack_type=0,batch_size=64,victims_per_batch=64,nb_of_processes=1):
+		if self.compact_topology is None:
+			self.compact_topology = CompactTopology.from_BGPtopology(self)
+		compact = self.compact_topology
+		if list_of_victims is None:
+			list_of_victims = compact.ASNs.tolist()
+		victims = [ASN for ASN in dict.fromkeys(list_of_victims) if ASN in compact.ASN_to_id]
+		hijackers = [ASN for ASN in dict.fromkeys(list_of_hijackers) if ASN in compact.ASN_to_id]
+		victim_ids = np.array([compact.ASN_to_id[ASN] for ASN in victims],dtype=np.int64)
+		hijacker_ids = np.array([compact.ASN_to_id[ASN] for ASN in hijackers],dtype=np.int64)
+		np.savez(filename+'.ASNs.npz',victims=np.array(victims),hijackers=np.array(hijackers))
+		impact = np.lib.format.open_memmap(filename,mode='w+',dtype=np.int32,shape=(len(victims),len(hijackers)))
+
+		def compute_batch(compact_topology,run_id,rng):
+			ids = victim_ids[run_id:run_id+victims_per_batch]
+			next_hop, length, route_class = compact_topology.compute_routes(ids)
+			pair_victims = np.repeat(np.arange(len(ids)),len(hijacker_ids))	# the (victim, hijacker) pairs of the batch, by victim
+			pair_hijackers = np.tile(hijacker_ids,len(ids))
+			valid = ids[pair_victims] != pair_hijackers
+			batch_impact = np.full(len(pair_victims),-1,dtype=np.int32)
+			for k in range(0,len(pair_victims),batch_size):
+				pairs = np.arange(k,min(k+batch_size,len(pair_victims)))
+				pairs = pairs[valid[pairs]]
+				if len(pairs):
+					columns = pair_victims[pairs]
+					infected, hijacked_length = compact_topology.compute_hijack_routes(ids[columns],pair_hijackers[pairs],hijack_type,legitimate_routes=(next_hop[:,columns],length[:,columns]))
+					batch_impact[pairs] = infected.sum(axis=0)
+			return batch_impact.reshape(len(ids),len(hijacker_ids))
+
+		from SimulationRunner import SimulationRunner	# (imported only when needed, so that loading the topology does not load the runner)
+		runner = SimulationRunner(compact,compute_batch,nb_of_processes=nb_of_processes,clear_after_run=False,seed_random=False)	# the batches only read the compact topology
+		for run_id, seed, batch_impact in runner.run(range(0,len(victims),victims_per_batch)):
+			impact[run_id:run_id+len(batch_impact)] = batch_impact
+		impact.flush()
+		del impact
+		return self.load_hijack_impact_matrix(filename)
+
+
+	'''
+	Loads a victim x hijacker matrix of impacts written by the method "write_hijack_impact_matrix(...)"; the matrix is memory-mapped (read-only), so that its slices are read from the file when they are accessed.
+
+	Input argument:
+		(a) filename: the name of the file of the matrix
+
+	Returns:
+		A dictionary with the entries:
+			(i)		'impact':		np.memmap (victims x hijackers) with the number of infected nodes of each hijack (-1 for the hijacks of a victim by itself)
+			(ii)	'victims':		np.array with the ASNs of the victims (rows)
+			(iii)	'hijackers':	np.array with the ASNs of the hijackers (columns)
+	'''
+	@staticmethod
+	def load_hijack_impact_matrix(filename):
+		with np.load(filename+'.ASNs.npz') as data:
+			victims, hijackers = data['victims'], data['hijackers']
+		return {'impact': np.load(filename,mmap_mode='r'), 'victims': victims, 'hijackers': hijackers}
+
+
+	'''
+	Returns the lengths of the (policy-compliant) paths of the given nodes to a prefix announced by each of the given origins, i.e., the lengths of the paths after the convergence (as with "add_prefix(...)"),
+	without computing the paths; e.g., the distances dV and dH of monitors from a victim and a hijacker.
+
+	The lengths are computed together for many origins with the array-backed copy of the topology, and they are cached per origin (see the method "get_path_lengths(...)" of the CompactTopology class);
+	the cache is kept until the nodes or links of the topology are changed.
+
+	Input arguments:
+		(a) list_of_origins:	list with the AS numbers of the origins
+		(b) list_of_nodes:		list with the AS numbers of the nodes; default value is None (i.e., all the nodes, in the order of the method "get_all_nodes_ASNs()" of the CompactTopology class)
+		(c) batch_size:			the number of origins whose path lengths are computed at once; default value is 256
+
+	Returns:
+		An np.array (len(list_of_origins) x len(list_of_nodes)) of int16 with the number of ASes in the path of each node to the prefix of each origin (as in the "paths" of the nodes), 0 for the origin itself, and -1 for the nodes without a path
+	'''
+	def get_path_length_matrix(self,list_of_origins,list_of_nodes=None,batch_size=256):
+		if self.compact_topology is None:
+			self.compact_topology = CompactTopology.from_BGPtopology(self)
+		compact = self.compact_topology
+		path_lengths = compact.get_path_lengths([compact.ASN_to_id[ASN] for ASN in list_of_origins],batch_size=batch_size)
+		if list_of_nodes is None:
+			return path_lengths
+		return path_lengths[:,[compact.ASN_to_id[ASN] for ASN in list_of_nodes]]
+
+
+	'''
+	Returns the Wilson score interval of the probability of success, from the given number of successes in the given number of trials.
+
+	Input arguments:
+		(a) successes:	integer, or np.array of integers
+		(b) trials:		integer
+		(c) z:			the z-score of the interval
+
+	Returns:
+		A tuple (low, high) with the bounds of the interval (np.arrays of the size of "successes")
+	'''
+	@staticmethod
+	def get_wilson_interval(successes,trials,z):
+		p = np.asarray(successes) / trials
+		denominator = 1 + z**2/trials
+		center = (p + z**2/(2*trials)) / denominator
+		error = z*np.sqrt(p*(1-p)/trials + z**2/(4*trials**2)) / denominator
+		return np.clip(center-error,0,p), np.clip(center+error,p,1)	# (the bounds contain p, also with rounding errors, e.g., at p=1)
+
+
+
+
+
+
+	### methods for the customer cones ###
+	# the customer cone of a node contains the node itself and all the nodes that can be reached from it following provider->customer links
+
+
+
+	'''
+	Returns the customer cones of all nodes of the topology; they are computed (at the first call after a change in the nodes or links of the topology) in one pass over the provider->customer graph.
+
+	(i)		find the strongly connected components of the provider->customer graph (Tarjan's algorithm, iterative); the nodes of a component (e.g., a provider->customer cycle) have the same customer cone
+	(ii)	number the nodes in the order the components are found; a component is found after all the components that can be reached from it (i.e., the customers are numbered before their providers),
+			so that the cone of a node consists mostly of nodes with nearby numbers
+	(iii) 	FOR each component, in the order they are found
+				the cone of the component is the union of its nodes and the cones of the components of their customers (which have already been computed)
+
+	A cone is stored as an "offset bitset": a tuple (offset, bits), where bit j of the integer "bits" denotes the node with number offset+j; since the cones of the customers are reused (memoization), the complexity is O(V+E) unions of bitsets.
+
+	Returns:
+		A dictionary with the entries:
+			(i) 	'ASNs':			list with the ASNs of the nodes, in the order of their numbers
+			(ii)	'numbers':		dictionary with (i) keys the ASNs and (ii) values the numbers of the nodes
+			(iii)	'component':	dictionary with (i) keys the ASNs and (ii) values the index of the component of the nodes
+			(iv) 	'cones':		list with the cone (offset, bits) of each component
+	'''
+	def get_customer_cones(self):
+		if self.customer_cones is not None:
+			return self.customer_cones
+
+		nodes = self.list_of_all_BGP_nodes
+		customers = {ASN:[neighbor for neighbor,relation in node.ASneighbors.items() if relation == -1] for ASN,node in nodes.items()}
+
+		# (i) strongly connected components
+		index = {}
+		low = {}
+		stack = []
+		on_stack = set()
+		components = []
+		for root in nodes:
+			if root in index:
+				continue
+			index[root] = low[root] = len(index)
+			stack.append(root)
+			on_stack.add(root)
+			work = [(root,iter(customers[root]))]
+			while work:
+				ASN, it = work[-1]
+				for customer in it:
+					if customer not in index:
+						index[customer] = low[customer] = len(index)
+						stack.append(customer)
+						on_stack.add(customer)
+						work.append((customer,iter(customers[customer])))
+						break
+					elif customer in on_stack:
+						low[ASN] = min(low[ASN],index[customer])
+				else:
+					work.pop()
+					if work:
+						provider = work[-1][0]
+						low[provider] = min(low[provider],low[ASN])
+					if low[ASN] == index[ASN]:
+						component = []
+						while True:
+							member = stack.pop()
+							on_stack.discard(member)
+							component.append(member)
+							if member == ASN:
+								break
+						components.append(component)
+
+		# (ii) numbering
+		ASNs = [ASN for component in components for ASN in component]
+		numbers = {ASN:i for i,ASN in enumerate(ASNs)}
+		component_of = {ASN:c for c,component in enumerate(components) for ASN in component}
+
+		# (iii) cones
+		cones = []
+		for c,component in enumerate(components):
+			offset = numbers[component[0]]
+			bits = (1 << len(component)) - 1
+			customer_components = set(component_of[customer] for ASN in component for customer in customers[ASN]) - {c}
+			for cc in customer_components:
+				cc_offset, cc_bits = cones[cc]
+				if cc_offset < offset:
+					bits = (bits << (offset-cc_offset)) | cc_bits
+					offset = cc_offset
+				else:
+					bits |= cc_bits << (cc_offset-offset)
+			cones.append((offset,bits))
+
+		self.customer_cones = {'ASNs': ASNs, 'numbers': numbers, 'component': component_of, 'cones': cones}
+		return self.customer_cones
+
+
+	'''
+	Returns the size of the customer cone of each of the given nodes; the cone of a node includes the node itself (i.e., the size is 1 for a stub, or for a node that does not exist in the topology).
+
+	Input argument:
+		(a) list_of_ASNs: the list of nodes
+
+	Returns:
+		A list with the cone sizes (integers)
+	'''
+	def get_customer_cone_sizes(self,list_of_ASNs):
+		customer_cones = self.get_customer_cones()
+		component_of = customer_cones['component']
+		cones = customer_cones['cones']
+		return [bin(cones[component_of[ASN]][1]).count('1') if ASN in component_of else 1 for ASN in list_of_ASNs]
+
+
+	'''
+	Returns the set of the nodes in the customer cone of the given node (including the node itself).
+
+	Input argument:
+		(a) ASN: the AS number of the node
+
+	Returns:
+		A set of ASNs (empty if the node does not exist in the topology)
+	'''
+	def get_customer_cone(self,ASN):
+		customer_cones = self.get_customer_cones()
+		if ASN not in customer_cones['component']:
+			return set()
+		offset, bits = customer_cones['cones'][customer_cones['component'][ASN]]
+		ASNs = customer_cones['ASNs']
+		return set(ASNs[offset+j] for j,bit in enumerate(reversed(bin(bits)[2:])) if bit == '1')
+
+
+	'''
+	Checks if the node customer_ASN is in the customer cone of the node ASN.
+
+	Input arguments:
+		(a) ASN: the AS number of the node whose cone is checked
+		(b) customer_ASN: the AS number of the node to be checked
+
+	Returns:
+		TRUE if it is in the cone, FALSE otherwise
+	'''
+	def is_in_customer_cone(self,ASN,customer_ASN):
+		customer_cones = self.get_customer_cones()
+		if (ASN not in customer_cones['component']) or (customer_ASN not in customer_cones['numbers']):
+			return False
+		offset, bits = customer_cones['cones'][customer_cones['component'][ASN]]
+		j = customer_cones['numbers'][customer_ASN] - offset
+		return (j >= 0) and bool((bits >> j) & 1)
+
+
+
+
+
+
+	### methods for the instrumentation ###
+
+	'''
+	Enables the instrumentation, i.e., creates new (zero) counters and phase times (see the class PropagationStats); IF the instrumentation is already enabled, THEN the counters are reset.
+
+	Returns:
+		The object of type PropagationStats
+	'''
+	def enable_instrumentation(self):
+		self.stats = PropagationStats()
+		return self.stats
+
+	'''
+	Disables the instrumentation.
+	'''
+	def disable_instrumentation(self):
+		self.stats = None
+
+	'''
+	Returns the report of the instrumentation (see the method "get_report()" of the PropagationStats class), or None if the instrumentation is not enabled.
+	'''
+	def get_instrumentation_report(self):
+		if self.stats is not None:
+			return self.stats.get_report()
+
+	'''
+	Returns a context manager that measures the wall-clock time of the given phase (see the method "phase(...)" of the PropagationStats class), or does nothing if the instrumentation is not enabled.
+
+	Input argument:
+		(a) name: the name of the phase
+	'''
+	def phase(self,name):
+		if self.stats is None:
+			return nullcontext()
+		return self.stats.phase(name)
+
+
+
+
+	### methods for the index of the paths per prefix ###
+	# the queries for the number/set of nodes with (hijacked) paths to a prefix use the index, instead of scanning the paths of all nodes in every call
+
+
+
+	'''
+	Returns the dictionary "node_ids" with the (dense) ids of the nodes of the topology; the id of a node is its position in the dictionary "list_of_all_BGP_nodes".
+
+	IF nodes have been added after the last call (nodes are never removed from the topology)
+	THEN 	rebuild the dictionary "node_ids" and remove all the entries of the "prefix_index" (which refer to the previous ids)
+
+	Returns:
+		A dictionary with (i) keys the ASNs and (ii) values the ids of the nodes
+	'''
+	def get_node_ids(self):
+		if len(self.node_ids) != len(self.list_of_all_BGP_nodes):
+			self.node_ids = {ASN:i for i,ASN in enumerate(self.list_of_all_BGP_nodes)}
+			self.node_ASNs = list(self.list_of_all_BGP_nodes)
+			self.prefix_index = {}
+		return self.node_ids
+
+
+	'''
+	Returns the ids of the given nodes (only the nodes that exist in the topology, and each node once).
+
+	Input argument:
+		(a) list_of_nodes: 	the list of nodes (ASNs)
+
+	Returns:
+		A np.array with the ids of the nodes
+	'''
+	def get_ids_of_nodes(self,list_of_nodes):
+		node_ids = self.get_node_ids()
+		return np.unique(np.fromiter((node_ids[ASN] for ASN in list_of_nodes if ASN in node_ids),dtype=np.int64))
+
+
+	'''
+	Returns the index of the paths of the nodes for the given prefix; the index is built (with a single scan of the paths of all nodes) at the first call after the paths for the prefix have changed.
+
+	The index is a dictionary with the entries:
+		(i) 	'has_path':		np.array (V) of booleans - TRUE for the nodes that have a (non empty) path to the prefix
+		(ii) 	'origin':		np.array (V) of integers - the id of the origin AS (i.e., the last ASN in the path) of each node with a path, and -1 for the nodes without a path
+		(iii)	'path_length':	np.array (V) of integers - the length of the path of each node (0 for the nodes without a path)
+		(iv)	'paths':		list (V) with the path of each node (None for the nodes without a path)
+		(v)		'transit':		dictionary with (i) keys ASNs and (ii) values np.arrays (V) of booleans - TRUE for the nodes whose path includes the ASN; an entry is added at the first query for the ASN
+
+	The entry of a prefix is removed (and, thus, the index is rebuilt at the next query) when a BGP message for the prefix is delivered, when the paths for the prefix are set directly (fast converge mode, or "restore_prefix(...)"), when the prefix is dropped ("drop_prefix(...)"), and when the routing information is cleared.
+	IF the paths of the nodes are modified directly (i.e., not through the methods of the topology), THEN the entry of the prefix must be removed from the "prefix_index" too.
+
+	Input argument:
+		(a) IPprefix: the prefix
+
+	Returns:
+		A dictionary with the index of the paths for the prefix
+	'''
+	def get_prefix_index(self,IPprefix):
+		node_ids = self.get_node_ids()
+		index = self.prefix_index.get(IPprefix)
+		if index is None:
+			routing_epoch = self.routing_epoch
+			paths = [node.paths.get(IPprefix) if node.routing_epoch == routing_epoch else None for node in self.list_of_all_BGP_nodes.values()]	# (the nodes with stale routing tables have no paths)
+			path_length = np.fromiter((len(path) if path else 0 for path in paths),dtype=np.int64,count=len(paths))
+			origin = np.fromiter((node_ids.get(path[-1],-1) if path else -1 for path in paths),dtype=np.int64,count=len(paths))
+			index = {'has_path': path_length > 0, 'origin': origin, 'path_length': path_length, 'paths': paths, 'transit': {}}
+			self.prefix_index[IPprefix] = index
+		return index
+
+
+	'''
+	Returns a mask of the nodes that have a path to the given prefix (and, if any ASN is given, only paths originated by the given ASN).
+
+	Input arguments:
+		(a) IPprefix: 		the prefix for which paths to be considered
+		(b) origin_ASN: 	the origin ASN for the paths to be considered; default value is None (i.e., consider paths from any origin AS)
+
+	Returns:
+		A np.array (V) of booleans, where the position of each node is its id (see the method "get_node_ids()")
+	'''
+	def get_mask_of_nodes_with_path_to_prefix(self,IPprefix,origin_ASN=None):
+		index = self.get_prefix_index(IPprefix)
+		if origin_ASN:
+			origin_id = self.node_ids.get(origin_ASN)
+			if origin_id is None:
+				return np.zeros(len(index['has_path']),dtype=bool)
+			return index['origin'] == origin_id
+		return index['has_path']
+
+
+	'''
+	Returns a mask of the nodes that have a path (for the given prefix) that includes the hijacker ASN.
+
+	IF the mask for the given ASN is not in the index of the prefix (entry 'transit')
+	THEN 	compute it, with a single scan of the paths of all nodes, and add it to the index
+
+	Input arguments:
+		(a) IPprefix: 		the prefix for which paths to be considered
+		(b) hijacker_ASN: 	the hijacker ASN for the paths to be considered
+
+	Returns:
+		A np.array (V) of booleans, where the position of each node is its id (see the method "get_node_ids()")
+	'''
+	def get_mask_of_nodes_with_hijacked_path_to_prefix(self,IPprefix,hijacker_ASN):
+		index = self.get_prefix_index(IPprefix)
+		mask = index['transit'].get(hijacker_ASN)
+		if mask is None:
+			paths = index['paths']
+			mask = np.fromiter(((path is not None) and (hijacker_ASN in path) for path in paths),dtype=bool,count=len(paths))
+			index['transit'][hijacker_ASN] = mask
+		return mask
+
+
+	'''
+	Returns the number of the given nodes (only the nodes that exist in the topology, and each node once) that are TRUE in the given mask.
+
+	IF a list_of_nodes is given:
+	THEN 	count only the given nodes
+	ELSE 	count all the nodes
+
+	Input arguments:
+		(a) mask: 			a np.array (V) of booleans (e.g., returned by the method "get_mask_of_nodes_with_path_to_prefix(...)")
+		(b) list_of_nodes: 	the list of nodes, which will be considered ; default value is None (i.e., consider all the nodes of the topology)
+
+	Returns:
+		An integer denoting the number of nodes
+	'''
+	def count_nodes_in_mask(self,mask,list_of_nodes=None):
+		if list_of_nodes:
+			return int(np.count_nonzero(mask[self.get_ids_of_nodes(list_of_nodes)]))
+		return int(np.count_nonzero(mask))
+
+
+	'''
+	Returns the set of the ASNs of the given nodes (only the nodes that exist in the topology) that are TRUE in the given mask; see the method "count_nodes_in_mask(...)".
+	'''
+	def get_set_of_nodes_in_mask(self,mask,list_of_nodes=None):
+		if list_of_nodes:
+			ids = self.get_ids_of_nodes(list_of_nodes)
+			ids = ids[mask[ids]]
+		else:
+			ids = np.flatnonzero(mask)
+		node_ASNs = self.node_ASNs
+		return set(node_ASNs[i] for i in ids.tolist())
+
+
+	'''
+	Returns the number of nodes that are TRUE in the given mask, for each of the given sets of nodes (e.g., many sets of monitors), in a single (vectorized) operation.
+
+	Input arguments:
+		(a) mask: 			a np.array (V) of booleans (e.g., returned by the method "get_mask_of_nodes_with_hijacked_path_to_prefix(...)")
+		(b) sets_of_ids: 	a np.array (K x M) with the ids of the nodes (see the method "get_ids_of_nodes(...)"), where each row is a set of nodes
+
+	Returns:
+		A np.array (K) of integers, with the number of nodes per set
+	'''
+	def count_nodes_in_mask_per_set(self,mask,sets_of_ids):
+		return np.count_nonzero(mask[sets_of_ids],axis=-1)
+
+
+	'''
+	Returns the number of nodes that have a path (for the given prefix) that includes the hijacker ASN, for each of the given sets of nodes; see the methods "get_nb_of_nodes_with_hijacked_path_to_prefix(...)" and "count_nodes_in_mask_per_set(...)".
+	'''
+	def get_nb_of_nodes_with_hijacked_path_to_prefix_per_set(self,IPprefix,hijacker_ASN,sets_of_ids):
+		return self.count_nodes_in_mask_per_set(self.get_mask_of_nodes_with_hijacked_path_to_prefix(IPprefix,hijacker_ASN),sets_of_ids)
+
+
+	'''
+	Returns the number of nodes that have a path to the given prefix (and, if any ASN is given, only paths originated by the given ASN), for each of the given sets of nodes; see the methods "get_nb_of_nodes_with_path_to_prefix(...)" and "count_nodes_in_mask_per_set(...)".
+	'''
+	def get_nb_of_nodes_with_path_to_prefix_per_set(self,IPprefix,sets_of_ids,origin_ASN=None):
+		return self.count_nodes_in_mask_per_set(self.get_mask_of_nodes_with_path_to_prefix(IPprefix,origin_ASN),sets_of_ids)
+
+
 
 
 
@@ -223,6 +1458,7 @@ class BGPtopology:
 	Print some information for each node in the topology; see the respective method defined in the BGPnode class
 	'''
 	def print_info(self):
+		self.refresh_routing_tables()
 		for key,node in self.list_of_all_BGP_nodes.items():
 			node.print_info()
 
@@ -244,7 +1480,7 @@ class BGPtopology:
 	'''
 	def get_list_of_prefixes(self):
 		list_of_prefixes = {}
-		for key,node in self.list_of_all_BGP_nodes.items():
+		for key,node in self.get_nodes_with_routing_tables():
 			if node.get_prefixes():
 				list_of_prefixes[key] = list(node.get_prefixes())
 		return list_of_prefixes
@@ -255,7 +1491,7 @@ class BGPtopology:
 	'''
 	def get_list_of_hijacked_prefixes(self):
 		list_of_hijacked_prefixes = {}
-		for key,node in self.list_of_all_BGP_nodes.items():
+		for key,node in self.get_nodes_with_routing_tables():
 			if node.get_hijacked_prefixes():
 				list_of_hijacked_prefixes[key] = list(node.get_hijacked_prefixes().keys())
 		return list_of_hijacked_prefixes
@@ -266,7 +1502,7 @@ class BGPtopology:
 	'''
 	def get_list_of_hijacked_prefixes_and_hijackers(self):
 		hijacked_prefixes_and_hijackers = {}
-		for key,node in self.list_of_all_BGP_nodes.items():
+		for key,node in self.get_nodes_with_routing_tables():
 			if node.get_hijacked_prefixes():
 				for prefix in list(node.get_hijacked_prefixes().keys()):
 					hijacked_prefixes_and_hijackers[prefix] = node.ASN
@@ -297,26 +1533,7 @@ class BGPtopology:
 		An integer denoting the number of nodes 
 	'''
 	def get_nb_of_nodes_with_path_to_prefix(self,IPprefix,origin_ASN = None, list_of_nodes=None):
-		nb_of_nodes_with_path_to_prefix = 0
-
-		if list_of_nodes:
-			list_of_nodes_to_search = {}
-			for key in list_of_nodes:
-				if key in self.list_of_all_BGP_nodes.keys():
-					list_of_nodes_to_search[key] = self.list_of_all_BGP_nodes[key]
-		else:
-			list_of_nodes_to_search = self.list_of_all_BGP_nodes
-
-		for key,node in list_of_nodes_to_search.items():
-			if node.paths.get(IPprefix):
-				if origin_ASN:
-					if node.paths.get(IPprefix)[-1] == origin_ASN:	# in case there is path, check the origin AS in the path
-						nb_of_nodes_with_path_to_prefix += 1
-				else:
-					nb_of_nodes_with_path_to_prefix += 1
-
-		return nb_of_nodes_with_path_to_prefix
-
+		return self.count_nodes_in_mask(self.get_mask_of_nodes_with_path_to_prefix(IPprefix,origin_ASN),list_of_nodes)
 
 
 	'''
@@ -340,22 +1557,7 @@ class BGPtopology:
 		An integer denoting the number of nodes 
 	'''
 	def get_nb_of_nodes_with_hijacked_path_to_prefix(self,IPprefix,hijacker_ASN, list_of_nodes=None):
-		nb_of_nodes_with_path_to_prefix = 0
-
-		if list_of_nodes:
-			list_of_nodes_to_search = {}
-			for key in list_of_nodes:
-				if key in self.list_of_all_BGP_nodes.keys():
-					list_of_nodes_to_search[key] = self.list_of_all_BGP_nodes[key]
-		else:
-			list_of_nodes_to_search = self.list_of_all_BGP_nodes
-
-		for key,node in list_of_nodes_to_search.items():
-			if node.paths.get(IPprefix):
-				if hijacker_ASN in node.paths.get(IPprefix):
-					nb_of_nodes_with_path_to_prefix += 1
-
-		return nb_of_nodes_with_path_to_prefix
+		return self.count_nodes_in_mask(self.get_mask_of_nodes_with_hijacked_path_to_prefix(IPprefix,hijacker_ASN),list_of_nodes)
 
 
 	'''
@@ -378,31 +1580,21 @@ class BGPtopology:
 		An number denoting the average path length (i.e., sum of path length over the number of nodes with path to prefix)
 	'''
 	def get_average_path_length(self,IPprefix,list_of_nodes=None):
-		nb_of_nodes_with_path_to_prefix = 0
-		sum_path_lengths = 0
-
+		index = self.get_prefix_index(IPprefix)
 		if list_of_nodes:
-			list_of_nodes_to_search = {}
-			for key in list_of_nodes:
-				if key in self.list_of_all_BGP_nodes.keys():
-					list_of_nodes_to_search[key] = self.list_of_all_BGP_nodes[key]
+			ids = self.get_ids_of_nodes(list_of_nodes)
+			path_length = index['path_length'][ids][index['has_path'][ids]]
 		else:
-			list_of_nodes_to_search = self.list_of_all_BGP_nodes
-
-		for key,node in list_of_nodes_to_search.items():
-			if node.paths.get(IPprefix):
-				sum_path_lengths = sum_path_lengths + len(node.paths.get(IPprefix))
-				nb_of_nodes_with_path_to_prefix += 1
+			path_length = index['path_length'][index['has_path']]
 
-		if nb_of_nodes_with_path_to_prefix == 0:
+		if len(path_length) == 0:
 			average_path_length = 0
 		else:
-			average_path_length = sum_path_lengths/nb_of_nodes_with_path_to_prefix
+			average_path_length = int(path_length.sum())/len(path_length)
 
 		return average_path_length
 
 
-
 		'''
 	Returns the set of the (given) nodes that have a path to the given prefix (and, if any ASN is given, consider only paths originated by the given ASN)
 
@@ -426,25 +1618,8 @@ class BGPtopology:
 		A set of ASNs
 	'''
 	def get_set_of_nodes_with_path_to_prefix(self,IPprefix,origin_ASN = None, list_of_nodes=None):
-		set_of_nodes_with_path_to_prefix = set()
+		return self.get_set_of_nodes_in_mask(self.get_mask_of_nodes_with_path_to_prefix(IPprefix,origin_ASN),list_of_nodes)
 
-		if list_of_nodes:
-			list_of_nodes_to_search = {}
-			for key in list_of_nodes:
-				if key in self.list_of_all_BGP_nodes.keys():
-					list_of_nodes_to_search[key] = self.list_of_all_BGP_nodes[key]
-		else:
-			list_of_nodes_to_search = self.list_of_all_BGP_nodes
-
-		for key,node in list_of_nodes_to_search.items():
-			if node.paths.get(IPprefix):
-				if origin_ASN:
-					if node.paths.get(IPprefix)[-1] == origin_ASN:	# in case there is path, check the origin AS in the path
-						set_of_nodes_with_path_to_prefix.add(node.ASN)
-				else:
-					set_of_nodes_with_path_to_prefix.add(node.ASN)
-
-		return set_of_nodes_with_path_to_prefix
 
 	'''
 	Returns the set of the (given) nodes that have a path (for the given prefix) that includes the hijacker ASN.
@@ -467,24 +1642,8 @@ class BGPtopology:
 		A set of ASNs
 	'''
 	def get_set_of_nodes_with_hijacked_path_to_prefix(self,IPprefix,hijacker_ASN, list_of_nodes=None):
-		set_of_nodes_with_path_to_prefix = set()
+		return self.get_set_of_nodes_in_mask(self.get_mask_of_nodes_with_hijacked_path_to_prefix(IPprefix,hijacker_ASN),list_of_nodes)
 
-		if list_of_nodes:
-			list_of_nodes_to_search = {}
-			for key in list_of_nodes:
-				if key in self.list_of_all_BGP_nodes.keys():
-					list_of_nodes_to_search[key] = self.list_of_all_BGP_nodes[key]
-		else:
-			list_of_nodes_to_search = self.list_of_all_BGP_nodes
-
-		for key,node in list_of_nodes_to_search.items():
-			if node.paths.get(IPprefix):
-				if hijacker_ASN in node.paths.get(IPprefix):
-					set_of_nodes_with_path_to_prefix.add(node.ASN)
-
-		return set_of_nodes_with_path_to_prefix
-
-	
 
 	'''
 	Returns the set of the nodes seen in the AS paths of the (given) monitors that have a path (for the given prefix) that includes the hijacker ASN.
@@ -506,7 +1665,7 @@ class BGPtopology:
 	def get_set_of_infected_nodes_seen_by_monitors(self,IPprefix,hijacker_ASN, list_of_monitors):
 		set_of_seen_infected_nodes = set()
 
-		list_of_monitors_in_topology = [self.list_of_all_BGP_nodes[mon] for mon in list_of_monitors if mon in self.list_of_all_BGP_nodes.keys()]
+		list_of_monitors_in_topology = [self.get_node(mon) for mon in list_of_monitors if mon in self.list_of_all_BGP_nodes.keys()]
 		
 		for node in list_of_monitors_in_topology:
 			path_to_prefix = node.paths.get(IPprefix)
@@ -540,7 +1699,7 @@ class BGPtopology:
 	def get_set_of_nodes_seen_by_monitors(self,IPprefix,list_of_monitors):
 		set_of_seen_nodes = set()
 
-		list_of_monitors_in_topology = [self.list_of_all_BGP_nodes[mon] for mon in list_of_monitors if mon in self.list_of_all_BGP_nodes.keys()]
+		list_of_monitors_in_topology = [self.get_node(mon) for mon in list_of_monitors if mon in self.list_of_all_BGP_nodes.keys()]
 		
 		for node in list_of_monitors_in_topology:
 			path_to_prefix = node.paths.get(IPprefix)
@@ -581,9 +1740,9 @@ class BGPtopology:
 			list_of_nodes_to_search = {}
 			for key in list_of_nodes:
 				if key in self.list_of_all_BGP_nodes.keys():
-					list_of_nodes_to_search[key] = self.list_of_all_BGP_nodes[key]
+					list_of_nodes_to_search[key] = self.get_node(key)
 		else:
-			list_of_nodes_to_search = self.list_of_all_BGP_nodes
+			list_of_nodes_to_search = dict(self.get_nodes_with_routing_tables())
 
 		for key,node in list_of_nodes_to_search.items():
 			if node.paths.get(IPprefix):
@@ -707,10 +1866,43 @@ class BGPtopology:
 
 
 	'''
-	Clears the routing information of all nodes in topology.
+	Clears the routing information of all nodes in topology (or, of the given nodes).
+
+	IF a list_of_nodes is given
+	THEN 	clear the routing tables of the given nodes
+	ELSE 	increase the "routing_epoch", i.e., mark the routing tables of all nodes as stale, in constant time; the routing tables of each node are cleared (in place) only when state is next set to the node through the topology
+			(e.g., when it receives a BGP message, is returned by the method "get_node(...)", or gets a path in the fast converge mode), and, until then, the node is seen (and skipped by the queries) as having no routing information;
+			so, no pass over all nodes is needed for the reset (the benchmark "benchmark_reset(...)" of the benchmarks measures its cost)
+
+	Input argument:
+		(a) list_of_nodes: list of ASNs of the nodes whose routing tables are cleared; default value is None (i.e., all nodes)
 	'''
 	def clear_routing_information(self,list_of_nodes=None):
-		if not list_of_nodes:
-			list_of_nodes = self.get_all_nodes_ASNs()
-		for ASN in list_of_nodes:
-			self.get_node(ASN).clear_routing_tables()
+		with self.phase('clear_routing_information'):
+			self.prefix_index = {}
+			if not list_of_nodes:
+				self.routing_epoch += 1
+				self.message_passing_prefixes = set()
+				self.filtered_prefixes = set()
+			else:
+				for ASN in list_of_nodes:
+					self.get_node(ASN).clear_routing_tables()
+				self.filtered_prefixes = set(IPprefix for node in self.list_of_all_BGP_nodes.values() if node.routing_epoch == self.routing_epoch for IPprefix,filters in node.filters.items() if filters)
+
+	'''
+	Brings the routing tables of all nodes up to date, i.e., clears the stale routing tables (see the method "clear_routing_information(...)"); it costs O(V), so it is not called in the simulation loops (only, e.g., by the method "print_info()").
+	'''
+	def refresh_routing_tables(self):
+		routing_epoch = self.routing_epoch
+		for node in self.list_of_all_BGP_nodes.values():
+			if node.routing_epoch != routing_epoch:
+				node.clear_routing_tables()
+
+	'''
+	Returns an iterator over the tuples (ASN, node) of the nodes whose routing tables are up to date (see the method "clear_routing_information(...)");
+	the nodes with stale routing tables have no routing information, so they are skipped (without clearing their routing tables).
+	It is used by the methods that read (or remove) the routing information of all nodes (e.g., the snapshots, the queries for all nodes).
+	'''
+	def get_nodes_with_routing_tables(self):
+		routing_epoch = self.routing_epoch
+		return ((ASN,node) for ASN,node in self.list_of_all_BGP_nodes.items() if node.routing_epoch == routing_epoch)
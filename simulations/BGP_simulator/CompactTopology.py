@@ -0,0 +1,942 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import zlib
+import numpy as np
+
+
+class CompactTopology:
+	'''
+	Class for a compact, array-backed representation of a network topology, where ASes are represented as single nodes.
+	The ASNs are mapped to dense integer ids (0,1,...,V-1, in increasing ASN order), and the neighbors, relationship types and preferences of the nodes are stored in NumPy arrays in CSR format,
+	i.e., the neighbors of the node with id i are the entries indptr[i]:indptr[i+1] of the arrays "indices", "relations" and "preferences".
+	The routing information (per prefix) is stored as an array with the id of the next hop of each node (see the method "set_routes(...)").
+
+	In this class, there exist methods (with the same names and arguments as in the classes BGPtopology and BGPnode) to obtain information about the nodes, their neighbors and their paths,
+	so that a CompactTopology can be used in place of a BGPtopology for these queries.
+
+	class variables:
+		(a) ASNs:			np.array (V) - the ASNs of the nodes, in increasing order; the position of an ASN in the array is the id of the node
+		(b) ASN_to_id:		dictionary - dictionary with (i) keys the ASNs and (ii) values the ids of the nodes
+		(c) indptr:			np.array (V+1) of int64 - the offsets of the neighbors of each node in the arrays "indices", "relations" and "preferences"
+		(d) indices:		np.array (2E) of int32 - the ids of the neighbors
+		(e) relations:		np.array (2E) of int8 - values {1,0,-1} if the neighbor is {provider,peer,customer} respectively (same as the "ASneighbors" in the BGPnode class)
+		(f) preferences:	np.array (2E) of float64 - the preference of the node for the neighbor, used as BGP tie breaker (same as the "ASneighbors_preference" in the BGPnode class)
+		(g) routes:			dictionary (initially empty) - dictionary with (i) keys the IP prefixes and (ii) values dictionaries with the routing information for the prefix (see the method "set_routes(...)")
+		(h) relation_entries:	dictionary (initially empty) - the entries of each relation type, sorted by node and preference (see the method "get_relation_entries(...)"); computed when needed
+		(i) path_lengths:		dictionary (initially empty) - dictionary with (i) keys the ids of origins and (ii) values the lengths of the paths of all nodes to a prefix of the origin (see the method "get_path_lengths(...)"); computed when needed
+	'''
+
+
+	'''
+	Contructor for object of the class CompactTopology, from the arrays of the CSR representation.
+	The entries of the arrays "indices", "relations" and "preferences" must be grouped per node (i.e., in the order of the "indptr").
+
+	Input arguments:
+		(a) ASNs:			array-like with the ASNs of the nodes, in increasing order
+		(b) indptr:			array-like (V+1)
+		(c) indices:		array-like (2E)
+		(d) relations:		array-like (2E)
+		(e) preferences:	array-like (2E)
+	'''
+	def __init__(self,ASNs,indptr,indices,relations,preferences):
+		self.ASNs = np.asarray(ASNs)
+		self.ASN_to_id = {ASN:i for i,ASN in enumerate(self.ASNs.tolist())}
+		self.indptr = np.asarray(indptr,dtype=np.int64)
+		self.indices = np.asarray(indices,dtype=np.int32)
+		self.relations = np.asarray(relations,dtype=np.int8)
+		self.preferences = np.asarray(preferences,dtype=np.float64)
+		self.routes = {}
+		self.relation_entries = {}
+		self.path_lengths = {}
+
+
+	'''
+	Creates a CompactTopology from the given arrays of directed neighbor entries (in any order).
+
+	The node ids are assigned in increasing ASN order, and the entries of each node are sorted by relation type (customers, peers, providers) and neighbor id.
+
+	Input arguments:
+		(a) ASNs:			np.array (V) with the ASNs of the nodes, in increasing order
+		(b) rows:			np.array with the id of the node of each entry
+		(c) cols:			np.array with the id of the neighbor of each entry
+		(d) relations:		np.array with the relation type {1,0,-1} of the neighbor of each entry
+		(e) preferences:	np.array with the preference of the node for the neighbor of each entry
+
+	Returns:
+		An object of type CompactTopology
+	'''
+	@classmethod
+	def from_directed_entries(cls,ASNs,rows,cols,relations,preferences):
+		order = np.lexsort((cols,relations,rows))
+		indptr = np.zeros(len(ASNs)+1,dtype=np.int64)
+		np.cumsum(np.bincount(rows,minlength=len(ASNs)),out=indptr[1:])
+		return cls(ASNs,indptr,cols[order],relations[order],preferences[order])
+
+
+	'''
+	Creates a CompactTopology from the given BGPtopology, i.e., with the same nodes, links, relation types, and preferences.
+	The routing information of the BGPtopology is not copied (see the method "load_routes_from_BGPtopology(...)").
+
+	Input arguments:
+		(a) Topology: object of type BGPtopology
+
+	Returns:
+		An object of type CompactTopology
+	'''
+	@classmethod
+	def from_BGPtopology(cls,Topology):
+		ASNs = np.array(sorted(Topology.get_all_nodes_ASNs()))
+		ASN_to_id = {ASN:i for i,ASN in enumerate(ASNs.tolist())}
+		rows, cols, relations, preferences = [], [], [], []
+		for ASN,node in Topology.list_of_all_BGP_nodes.items():
+			i = ASN_to_id[ASN]
+			for neighbor,relation in node.ASneighbors.items():
+				rows.append(i)
+				cols.append(ASN_to_id[neighbor])
+				relations.append(relation)
+				preferences.append(node.ASneighbors_preference[neighbor])
+		return cls.from_directed_entries(ASNs,np.array(rows,dtype=np.int64),np.array(cols,dtype=np.int32),np.array(relations,dtype=np.int8),np.array(preferences,dtype=np.float64))
+
+
+	'''
+	Creates a CompactTopology from the given arrays of links (e.g., as read from a CAIDA AS-relationship file).
+	Duplicate links are ignored (only the first occurrence of a link is kept), as in the method "add_link(...)" of the BGPtopology class.
+
+	Input arguments:
+		(a) ASN1:			array-like with the AS numbers of the first nodes of the links
+		(b) ASN2:			array-like with the AS numbers of the second nodes of the links
+		(c) peering_type:	array-like with the peering relation types of the links; -1 if ASN2 is customer of ASN1, 0 if the nodes are peers
+		(d) seed:			the seed for the preferences of the neighbors (see the method "get_hashed_preferences(...)"); default value is None (i.e., a random seed)
+
+	Returns:
+		An object of type CompactTopology
+	'''
+	@classmethod
+	def from_links(cls,ASN1,ASN2,peering_type,seed=None):
+		ASN1, ASN2, peering_type = np.asarray(ASN1), np.asarray(ASN2), np.asarray(peering_type,dtype=np.int8)
+		ASNs, ids = np.unique(np.concatenate((ASN1,ASN2)),return_inverse=True)
+		ids1, ids2 = ids[:len(ASN1)], ids[len(ASN1):]
+		_, first = np.unique(np.minimum(ids1,ids2)*len(ASNs)+np.maximum(ids1,ids2),return_index=True)
+		first.sort()
+		ids1, ids2, peering_type = ids1[first], ids2[first], peering_type[first]
+		rows = np.concatenate((ids1,ids2))
+		cols = np.concatenate((ids2,ids1)).astype(np.int32)
+		relations = np.concatenate((peering_type,-peering_type))
+		Topology = cls.from_directed_entries(ASNs,rows,cols,relations,np.zeros(len(rows)))
+		if seed is None:
+			seed = int(np.random.default_rng().integers(2**63))
+		Topology.preferences = cls.get_hashed_preferences(Topology.ASNs,Topology.indptr,Topology.indices,seed).astype(np.float64)
+		return Topology
+
+
+	'''
+	Returns the preferences of the nodes for their neighbors (for the entries of the given CSR arrays), computed from a hash of (the ASN of the node, the ASN of the neighbor, the seed);
+	hence, the preference of a node for a neighbor depends only on the two ASNs and the seed, and not on the order in which the links are loaded.
+
+	The preferences of each node are the ranks of the hashes of its neighbors, scaled to (0,1), i.e., (rank+1)/(degree+1);
+	so, they are distinct (i.e., there are no ties in the BGP tie breaker), and their order is a uniformly random permutation of the neighbors, as for independent uniform random preferences.
+
+	Input arguments:
+		(a) ASNs:		np.array (V) with the ASNs of the nodes (integers, or strings)
+		(b) indptr:		np.array (V+1) with the offsets of the neighbors of each node
+		(c) indices:	np.array (2E) with the ids of the neighbors
+		(d) seed:		integer
+
+	Returns:
+		An np.array (2E) of float32
+	'''
+	@staticmethod
+	def get_hashed_preferences(ASNs,indptr,indices,seed):
+		if ASNs.dtype.kind in 'iu':
+			keys = ASNs.astype(np.uint64)
+		else:
+			keys = np.array([zlib.crc32(str(ASN).encode()) for ASN in ASNs.tolist()],dtype=np.uint64)
+		degrees = np.diff(indptr)
+		rows = np.repeat(np.arange(len(ASNs),dtype=np.int64),degrees)
+		seed_hash = CompactTopology.hash_uint64(np.array([seed % 2**64],dtype=np.uint64))
+		hashes = CompactTopology.hash_uint64(CompactTopology.hash_uint64(seed_hash ^ keys[rows]) ^ keys[indices])
+		order = np.lexsort((hashes,rows))
+		ranks = np.arange(len(order),dtype=np.int64) - indptr[rows[order]]
+		preferences = np.empty(len(order),dtype=np.float32)
+		preferences[order] = (ranks+1)/(degrees[rows[order]]+1)
+		return preferences
+
+	'''
+	Returns the (splitmix64) hash of each element of the given np.array of uint64.
+	'''
+	@staticmethod
+	def hash_uint64(x):
+		x = x + np.uint64(0x9E3779B97F4A7C15)
+		x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+		x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+		return x ^ (x >> np.uint64(31))
+
+
+
+	### methods for the nodes and links ###
+
+	'''
+	Returns the number of nodes in the topology
+	'''
+	def get_nb_nodes(self):
+		return len(self.ASNs)
+
+	'''
+	Returns a list containing the ASNs of the nodes in the topology
+	'''
+	def get_all_nodes_ASNs(self):
+		return self.ASNs.tolist()
+
+	'''
+	Checks if the given node exists in the topology.
+
+	Returns:
+		TRUE if it exists, FALSE otherwise
+	'''
+	def has_node(self,ASN):
+		return ASN in self.ASN_to_id
+
+	'''
+	Returns a (read-only) view of the node with the given ASN, which supports the main methods for the neighbors and paths of the BGPnode class (see the class CompactNode).
+
+	Returns:
+		An object of type CompactNode, or None if the node does not exist
+	'''
+	def get_node(self,ASN):
+		if self.has_node(ASN):
+			return CompactNode(self,self.ASN_to_id[ASN])
+
+	'''
+	Checks if the given link exists in the topology.
+
+	Returns:
+		TRUE if the link exists, FALSE otherwise
+	'''
+	def has_link(self,ASN1,ASN2):
+		if self.has_node(ASN1) and self.has_node(ASN2):
+			i, j = self.ASN_to_id[ASN1], self.ASN_to_id[ASN2]
+			return bool(np.any(self.indices[self.indptr[i]:self.indptr[i+1]] == j))
+		return False
+
+	'''
+	Returns the ids of the given ASNs that exist in the topology (each id is returned once, in increasing order).
+
+	Input argument:
+		(a) list_of_ASNs: list (or array) of ASNs
+
+	Returns:
+		An np.array of node ids
+	'''
+	def get_ids(self,list_of_ASNs):
+		ASNs = np.asarray(list(list_of_ASNs),dtype=self.ASNs.dtype)
+		ids = np.searchsorted(self.ASNs,ASNs)
+		ids[ids>=len(self.ASNs)] = 0
+		return np.unique(ids[self.ASNs[ids] == ASNs])
+
+
+
+	### methods for the routing information ###
+
+	'''
+	Sets the routing information for the given prefix.
+
+	The path of a node is stored as the id of its next hop; the full path of the node is the ASN of the next hop followed by the path of the next hop.
+	The nodes that own or hijack the prefix (i.e., the nodes without next hop that have a path, possibly empty) are given in a separate dictionary with their paths.
+
+	Input arguments:
+		(a) IPprefix:		the prefix
+		(b) next_hop:		np.array (V) with the id of the next hop of each node (-1 if the node has no next hop)
+		(c) fixed_paths:	dictionary with (i) keys the ids of the nodes that own or hijack the prefix, and (ii) values their paths (lists of ASNs; an empty list for the owners)
+	'''
+	def set_routes(self,IPprefix,next_hop,fixed_paths):
+		self.routes[IPprefix] = {'next_hop': np.asarray(next_hop,dtype=np.int32), 'fixed_paths': dict(fixed_paths)}
+
+	'''
+	Copies the (converged) routing information for the given prefixes from the given BGPtopology.
+
+	Input arguments:
+		(a) Topology:	object of type BGPtopology with the same nodes as this topology
+		(b) IPprefixes:	list of prefixes to be copied; default value is None (i.e., all the prefixes with paths in the BGPtopology)
+	'''
+	def load_routes_from_BGPtopology(self,Topology,IPprefixes=None):
+		next_hops = {}
+		fixed_paths = {}
+		for ASN,node in Topology.get_nodes_with_routing_tables():
+			i = self.ASN_to_id[ASN]
+			for IPprefix,path in node.paths.items():
+				if (IPprefixes is not None) and (IPprefix not in IPprefixes):
+					continue
+				if IPprefix not in next_hops:
+					next_hops[IPprefix] = np.full(len(self.ASNs),-1,dtype=np.int32)
+					fixed_paths[IPprefix] = {}
+				if node.has_prefix(IPprefix) or node.has_hijacked_prefix(IPprefix):
+					fixed_paths[IPprefix][i] = list(path)
+				elif path:
+					next_hops[IPprefix][i] = self.ASN_to_id[path[0]]
+		for IPprefix in next_hops.keys():
+			self.set_routes(IPprefix,next_hops[IPprefix],fixed_paths[IPprefix])
+
+	'''
+	Removes the routing information for all prefixes.
+	'''
+	def clear_routing_information(self):
+		self.routes = {}
+
+	'''
+	Returns the routing information for the given prefix, after computing (if not already computed) for each node (i) the root of its path, i.e., the owner/hijacker node at the end of its chain of next hops, and (ii) its distance (number of next hops) from the root.
+
+	Returns:
+		A dictionary with the routing information, or None if there is no routing information for the prefix
+	'''
+	def get_routes(self,IPprefix):
+		routes = self.routes.get(IPprefix)
+		if (routes is not None) and ('root' not in routes):
+			next_hop = routes['next_hop']
+			ids = np.arange(len(next_hop))
+			root = np.where(next_hop >= 0,next_hop,ids)
+			depth = (next_hop >= 0).astype(np.int32)
+			for _ in range(64):	# pointer jumping; the number of iterations is logarithmic to the maximum path length
+				parent = root[root]
+				if np.array_equal(parent,root):
+					break
+				depth = depth + depth[root]
+				root = parent
+			fixed = np.zeros(len(next_hop),dtype=bool)
+			fixed_lengths = np.zeros(len(next_hop),dtype=np.int32)
+			for i,path in routes['fixed_paths'].items():
+				fixed[i] = True
+				fixed_lengths[i] = len(path)
+			routes['root'] = root
+			routes['depth'] = depth
+			routes['path_length'] = np.where(fixed[root],depth+fixed_lengths[root],0)
+			routes['has_path'] = routes['path_length'] > 0
+		return routes
+
+	'''
+	Returns the path (i.e., list of ASNs) of the node with the given id for the given prefix, or None if the node has no path.
+	'''
+	def get_path_by_id(self,i,IPprefix):
+		routes = self.routes.get(IPprefix)
+		if routes is None:
+			return None
+		next_hop = routes['next_hop']
+		fixed_paths = routes['fixed_paths']
+		path = []
+		while i not in fixed_paths:
+			i = next_hop[i]
+			if i < 0:
+				return None
+			path.append(self.ASNs[i].item())
+		return path + list(fixed_paths[i])
+
+	'''
+	Returns the path (i.e., list of ASNs) of the given node for the given prefix, or None if the node has no path.
+	'''
+	def get_path(self,ASN,IPprefix):
+		if self.has_node(ASN):
+			return self.get_path_by_id(self.ASN_to_id[ASN],IPprefix)
+
+	'''
+	Returns a boolean np.array (V), which is TRUE for the nodes whose path for the given prefix ends at (i.e., is originated by) the given ASN.
+	'''
+	def get_origin_mask(self,IPprefix,origin_ASN):
+		routes = self.get_routes(IPprefix)
+		root_origins = {}
+		for i,path in routes['fixed_paths'].items():
+			root_origins[i] = path[-1] if path else self.ASNs[i].item()
+		roots = [i for i,origin in root_origins.items() if origin == origin_ASN]
+		return routes['has_path'] & np.isin(routes['root'],roots)
+
+	'''
+	Returns a boolean np.array (V), which is TRUE for the nodes whose path for the given prefix contains the given ASN.
+
+	A path contains the ASN, if the ASN is one of the next hops in the chain from the node to the root of the path, or the ASN is in the path of the root.
+	The next hops are checked in increasing distance from the root, so that each node is checked once.
+	'''
+	def get_transit_mask(self,IPprefix,transit_ASN):
+		routes = self.get_routes(IPprefix)
+		roots = [i for i,path in routes['fixed_paths'].items() if transit_ASN in path]
+		mask = routes['has_path'] & np.isin(routes['root'],roots)
+		if self.has_node(transit_ASN):
+			t = self.ASN_to_id[transit_ASN]
+			next_hop = routes['next_hop']
+			depth = routes['depth']
+			order = np.argsort(depth,kind='stable')
+			boundaries = np.searchsorted(depth[order],np.arange(1,depth.max()+2))
+			for d in range(1,len(boundaries)):
+				ids = order[boundaries[d-1]:boundaries[d]]
+				nh = next_hop[ids]
+				mask[ids] |= (nh == t) | mask[nh]
+		return mask
+
+	'''
+	Returns the boolean mask of the nodes to be considered in a query;
+	IF a list_of_nodes is given THEN consider only the list of the given nodes (that exist in the topology) ELSE consider every node in the topology
+	'''
+	def get_nodes_mask(self,list_of_nodes=None):
+		if list_of_nodes:
+			mask = np.zeros(len(self.ASNs),dtype=bool)
+			mask[self.get_ids(list_of_nodes)] = True
+			return mask
+		return np.ones(len(self.ASNs),dtype=bool)
+
+
+
+	### methods to obtain information from the routing information (same as in the BGPtopology class) ###
+
+	'''
+	Returns the number of the (given) nodes that have a path to the given prefix (and, if any ASN is given, consider only paths originated by the given ASN); see the respective method in the BGPtopology class
+	'''
+	def get_nb_of_nodes_with_path_to_prefix(self,IPprefix,origin_ASN = None, list_of_nodes=None):
+		return len(self.get_set_of_nodes_with_path_to_prefix(IPprefix,origin_ASN,list_of_nodes))
+
+	'''
+	Returns the number of the (given) nodes that have a path (for the given prefix) that includes the hijacker ASN; see the respective method in the BGPtopology class
+	'''
+	def get_nb_of_nodes_with_hijacked_path_to_prefix(self,IPprefix,hijacker_ASN, list_of_nodes=None):
+		if self.get_routes(IPprefix) is None:
+			return 0
+		return int(np.count_nonzero(self.get_transit_mask(IPprefix,hijacker_ASN) & self.get_nodes_mask(list_of_nodes)))
+
+	'''
+	Returns the average path length that (the given) nodes have for the given prefix; see the respective method in the BGPtopology class
+	'''
+	def get_average_path_length(self,IPprefix,list_of_nodes=None):
+		routes = self.get_routes(IPprefix)
+		if routes is None:
+			return 0
+		mask = routes['has_path'] & self.get_nodes_mask(list_of_nodes)
+		if not np.any(mask):
+			return 0
+		return np.sum(routes['path_length'][mask])/np.count_nonzero(mask)
+
+	'''
+	Returns the set of the (given) nodes that have a path to the given prefix (and, if any ASN is given, consider only paths originated by the given ASN); see the respective method in the BGPtopology class
+	'''
+	def get_set_of_nodes_with_path_to_prefix(self,IPprefix,origin_ASN = None, list_of_nodes=None):
+		routes = self.get_routes(IPprefix)
+		if routes is None:
+			return set()
+		if origin_ASN:
+			mask = self.get_origin_mask(IPprefix,origin_ASN)
+		else:
+			mask = routes['has_path']
+		return set(self.ASNs[mask & self.get_nodes_mask(list_of_nodes)].tolist())
+
+	'''
+	Returns the set of the (given) nodes that have a path (for the given prefix) that includes the hijacker ASN; see the respective method in the BGPtopology class
+	'''
+	def get_set_of_nodes_with_hijacked_path_to_prefix(self,IPprefix,hijacker_ASN, list_of_nodes=None):
+		if self.get_routes(IPprefix) is None:
+			return set()
+		return set(self.ASNs[self.get_transit_mask(IPprefix,hijacker_ASN) & self.get_nodes_mask(list_of_nodes)].tolist())
+
+	'''
+	Returns the set of the nodes seen in the AS paths of the (given) monitors that have a path (for the given prefix) that includes the hijacker ASN; see the respective method in the BGPtopology class
+	'''
+	def get_set_of_infected_nodes_seen_by_monitors(self,IPprefix,hijacker_ASN, list_of_monitors):
+		set_of_seen_infected_nodes = set()
+		for i in self.get_ids(list_of_monitors):
+			path_to_prefix = self.get_path_by_id(i,IPprefix)
+			if (path_to_prefix is not None) and (hijacker_ASN in path_to_prefix):
+				set_of_seen_infected_nodes.add(self.ASNs[i].item())
+				set_of_seen_infected_nodes.update(path_to_prefix[0:path_to_prefix.index(hijacker_ASN)])
+		return set_of_seen_infected_nodes
+
+	'''
+	Returns the set of the nodes seen in the AS paths of the (given) monitors that have a path for the given prefix; see the respective method in the BGPtopology class
+	'''
+	def get_set_of_nodes_seen_by_monitors(self,IPprefix,list_of_monitors):
+		set_of_seen_nodes = set()
+		for i in self.get_ids(list_of_monitors):
+			path_to_prefix = self.get_path_by_id(i,IPprefix)
+			if path_to_prefix is not None:
+				set_of_seen_nodes.add(self.ASNs[i].item())
+				set_of_seen_nodes.update(path_to_prefix)
+		return set_of_seen_nodes
+
+	'''
+	Returns the set of the (given) nodes that have a path (for the given prefix) that includes a specific edge (i.e., sequence of two ASNs); see the respective method in the BGPtopology class
+	'''
+	def get_set_of_nodes_with_specific_edge_to_prefix(self,IPprefix,edge, list_of_nodes=None, directed=False):
+		set_of_nodes_with_path_to_prefix = set()
+		routes = self.get_routes(IPprefix)
+		if routes is None:
+			return set_of_nodes_with_path_to_prefix
+		ASN1 = edge[0]
+		ASN2 = edge[1]
+		candidates = routes['has_path'] & self.get_transit_mask(IPprefix,ASN1) & self.get_transit_mask(IPprefix,ASN2) & self.get_nodes_mask(list_of_nodes)
+		for i in np.flatnonzero(candidates):
+			path = self.get_path_by_id(i,IPprefix)
+			if directed:
+				if (path.index(ASN1) - path.index(ASN2)) == 1:
+					set_of_nodes_with_path_to_prefix.add(self.ASNs[i].item())
+			else:
+				if abs(path.index(ASN1) - path.index(ASN2)) == 1:
+					set_of_nodes_with_path_to_prefix.add(self.ASNs[i].item())
+		return set_of_nodes_with_path_to_prefix
+
+	def get_nb_of_nodes_with_specific_edge_to_prefix(self,IPprefix,edge,list_of_nodes=None, directed=False):
+		return len(self.get_set_of_nodes_with_specific_edge_to_prefix(IPprefix,edge,list_of_nodes,directed))
+
+
+
+	### methods for computing the routes (in batch) ###
+
+	'''
+	Returns the entries (node, neighbor) of the given relation type, sorted by node and (for each node) by increasing preference for the neighbor;
+	i.e., among the entries of a node, the entry with the highest position is the one with the most preferred neighbor.
+
+	Input argument:
+		(a) relation: the relation type {1,0,-1} of the neighbor
+
+	Returns:
+		A tuple (rows, cols, entries) of np.arrays with the ids of the nodes and neighbors of the entries, and the positions of the entries in the CSR arrays (e.g., "indices")
+	'''
+	def get_relation_entries(self,relation):
+		if relation not in self.relation_entries:
+			rows = np.repeat(np.arange(len(self.ASNs),dtype=np.int64),np.diff(self.indptr))
+			entries = np.flatnonzero(self.relations == relation)
+			entries = entries[np.lexsort((self.preferences[entries],rows[entries]))]
+			self.relation_entries[relation] = (rows[entries],self.indices[entries].astype(np.int64),entries)
+		return self.relation_entries[relation]
+
+	'''
+	Offers (in all the columns, i.e., prefixes, at once) the paths of the given source nodes to their neighbors of the given relation type, and sets to each node without a path the offer that it prefers.
+
+	The candidate offers of a node are selected (i) IF min_length is TRUE, THEN among the offers with the shortest path (i.e., the first criterion is the path length), and (ii) with the highest preference for the neighbor.
+
+	Input arguments:
+		(a) sources:		np.array (V x P) of booleans - TRUE for the nodes that offer their path, per column
+		(b) length:			np.array (V x P) - the length of the announced path of each node (including the node), -1 for the nodes without a path (and 0 for the nodes that neither have nor accept a path); it is updated
+		(c) next_hop:		np.array (V x P) - the next hop of each node; it is updated
+		(d) route_class:	np.array (V x P) - the type {-1,0,1} of the neighbor from which each node received its path; it is updated
+		(e) relation:		the type of the neighbors (from the receiving node's perspective) from which the paths are received
+		(f) min_length:		boolean - IF TRUE, then select the offers with the shortest path first
+		(g) preferences:	np.array (2E x P) - the preferences of the nodes for their neighbors (per entry of the CSR arrays) per column; default value is None (i.e., the "preferences" of the topology in all columns)
+		(h) hijacked:		np.array (V x P) of booleans - TRUE for the nodes whose path is (or, derives from) a hijacked path; it is updated (a node that receives a path inherits the value of the neighbor); default value is None
+		(i) excluded:		np.array (V x P) of booleans - TRUE for the nodes that do not accept hijacked paths (i.e., the nodes in the fake part of the hijacked path); default value is None
+
+	Returns:
+		TRUE if any node received a path, FALSE otherwise
+	'''
+	def offer_routes(self,sources,length,next_hop,route_class,relation,min_length=False,preferences=None,hijacked=None,excluded=None):
+		rows, cols, csr_entries = self.get_relation_entries(relation)
+		entries = np.flatnonzero(sources.any(axis=1)[cols])	# only the entries from nodes that offer a path in some column
+		if len(entries) == 0:
+			return False
+		rows, cols = rows[entries], cols[entries]
+		candidates = sources[cols] & (length[rows] < 0)
+		if excluded is not None:
+			candidates &= ~(excluded[rows] & hijacked[cols])
+		starts = np.flatnonzero(np.r_[True,rows[1:] != rows[:-1]])
+		counts = np.diff(np.r_[starts,len(rows)])
+		if min_length:
+			offered_length = np.where(candidates,length[cols],np.iinfo(np.int32).max)
+			shortest = np.minimum.reduceat(offered_length,starts,axis=0)
+			candidates &= offered_length == np.repeat(shortest,counts,axis=0)
+		if preferences is None:		# the entries of each node are sorted by preference, i.e., the last candidate is the most preferred
+			best = np.maximum.reduceat(np.where(candidates,np.arange(len(rows))[:,np.newaxis],-1),starts,axis=0)
+			groups, columns = np.nonzero(best >= 0)
+			best = best[groups,columns]
+		else:						# the most preferred candidate (the preferences of a node are distinct) per column
+			offered_preference = np.where(candidates,preferences[csr_entries[entries]],-1)
+			highest = np.maximum.reduceat(offered_preference,starts,axis=0)
+			best, columns = np.nonzero(candidates & (offered_preference == np.repeat(highest,counts,axis=0)))
+		if len(best) == 0:
+			return False
+		x, u = rows[best], cols[best]
+		next_hop[x,columns] = u
+		length[x,columns] = length[u,columns] + 1
+		route_class[x,columns] = relation
+		if hijacked is not None:
+			hijacked[x,columns] = hijacked[u,columns]
+		return True
+
+	'''
+	Computes the converged routes (i.e., the paths that would be selected after the exchange of all BGP messages) for many prefixes at once, each announced by a single origin;
+	it is the vectorized (over prefixes) version of the method "fast_converge_prefix(...)" of the BGPtopology class, i.e., with the same three phases:
+		(i) 	customer routes: FOR each path length (in increasing order), the nodes with a customer route (or, the origins) of this length offer it to their providers
+		(ii) 	peer routes: the nodes with a customer route (or, the origins) offer it to their peers, which select the shortest path (and, then, the highest preference)
+		(iii) 	provider routes: FOR each path length (in increasing order), all the nodes with a route of this length offer it to their customers
+	In every step, a node without a path selects the offer from the neighbor with the highest preference.
+	A node receives a path only if it has no path yet, and all the nodes in an offered path already have a path; thus, the offered paths never contain the receiving node.
+
+	Input argument:
+		(a) origin_ids: list (P) with the ids of the origins (one per prefix)
+
+	Returns:
+		A tuple (next_hop, length, route_class) of np.arrays (V x P); next_hop is -1 for the nodes without a next hop (the origins, and the nodes without a path), length is the length of the path of each node including the node (-1 for the nodes without a path),
+		and route_class is the type {-1,0,1} of the neighbor from which each node received its path (-2 for the origins)
+	'''
+	def compute_routes(self,origin_ids,preferences=None):
+		V, P = len(self.ASNs), len(origin_ids)
+		columns = np.arange(P)
+		next_hop = np.full((V,P),-1,dtype=np.int32)
+		length = np.full((V,P),-1,dtype=np.int32)
+		route_class = np.full((V,P),2,dtype=np.int8)
+		length[origin_ids,columns] = 1
+		route_class[origin_ids,columns] = -2
+		self.propagate_routes(next_hop,length,route_class,preferences=preferences)
+		return next_hop, length, route_class
+
+	'''
+	Runs the three phases of the method "compute_routes(...)", from the given announcing nodes (i.e., the nodes with route_class -2, and length the length of their announced path) in each column.
+
+	Input arguments:
+		(a) next_hop:		np.array (V x P) - the next hop of each node; it is updated
+		(b) length:			np.array (V x P) - the length of the announced path of each node, -1 for the nodes without a path, and 0 for the nodes that neither have nor accept a path; it is updated
+		(c) route_class:	np.array (V x P) - the type of the neighbor from which each node received its path (-2 for the announcing nodes); it is updated
+		(d) preferences, hijacked, excluded: see the method "offer_routes(...)"
+	'''
+	def propagate_routes(self,next_hop,length,route_class,preferences=None,hijacked=None,excluded=None):
+		offer = lambda sources,relation,min_length=False: self.offer_routes(sources,length,next_hop,route_class,relation,min_length,preferences,hijacked,excluded)
+
+		# phase (i): customer routes
+		path_length = 1
+		max_length = length.max()
+		while True:
+			sources = (length == path_length) & (route_class < 0)
+			if (not sources.any()) and (path_length >= max_length):
+				break
+			offer(sources,-1)
+			path_length += 1
+
+		# phase (ii): peer routes
+		offer((length > 0) & (route_class < 0),0,min_length=True)
+
+		# phase (iii): provider routes
+		path_length = 1
+		max_length = length.max()
+		while path_length <= max_length:
+			if offer(length == path_length,1):
+				max_length = max(max_length,path_length+1)
+			path_length += 1
+
+	'''
+	Returns the preferences of the nodes for their neighbors for each of the given seeds (see the method "get_hashed_preferences(...)"), i.e., independent preference draws for an ensemble of routes.
+
+	Input argument:
+		(a) seeds: list (K) of integers
+
+	Returns:
+		An np.array (2E x K) of float32; column k is equal to the preferences set by the method "set_preferences(seeds[k])" of the BGPtopology class
+	'''
+	def get_preference_draws(self,seeds):
+		preferences = np.empty((len(self.indices),len(seeds)),dtype=np.float32)
+		for k,seed in enumerate(seeds):
+			preferences[:,k] = self.get_hashed_preferences(self.ASNs,self.indptr,self.indices,seed)
+		return preferences
+
+	'''
+	Computes the converged routes after a hijack of the given type (i.e., the legitimate prefix is announced by the victim, and, after the convergence, it is hijacked by the hijacker), for many scenarios at once (one column per scenario),
+	as in the fast converge mode of the BGPtopology class (the methods "add_prefix(...)" and "do_hijack(...)"); the scenarios differ in the victim and/or the hijacker (e.g., sweeps over the hijackers or the victims) and/or the preferences (e.g., an ensemble of preference draws).
+
+	(i)		the legitimate routes are computed (IF they are not given); they have one column per scenario, OR a single column IF the victim and the preferences are the same in all scenarios
+	(ii)	the hijacked path of each scenario is [hijacker] + the last hijack_type ASes of the legitimate path of the hijacker (see the method "get_path_poisoning_hijack(...)" of the BGPnode class), i.e., of length hijack_type+1;
+			the nodes in this (fake) part of the path do not accept the hijacked paths; IF the hijack type is not 0 and the hijacker has no legitimate path, THEN there is no hijack in the scenario
+	(iii)	the routes are computed from the victim and the hijacker (which do not accept any paths), and the nodes whose path derives from the hijacked path are the infected nodes
+
+	Input arguments:
+		(a) victim_ids:			the id of the victim, or a list (K) with the id of the victim of each scenario
+		(b) hijacker_ids:		the id of the hijacker, or a list (K) with the id of the hijacker of each scenario; the hijacker of a scenario must not be its victim
+		(c) hijack_type:		the type of the hijack (0 for an origin-AS hijack, 1,2,... for the N-th hop hijacks)
+		(d) preferences:		np.array (2E x K) with the preferences of each scenario (e.g., from the method "get_preference_draws(...)"); default value is None (i.e., the "preferences" of the topology in all scenarios)
+		(e) legitimate_routes:	tuple (next_hop, length) with the legitimate routes, as returned by the method "compute_routes(...)" (with a column per scenario, or a single column for a single victim); default value is None (i.e., compute them);
+								e.g., they can be reused for all the hijackers and hijack types of a victim
+
+	Returns:
+		A tuple (infected, length) of np.arrays (V x K); infected is TRUE for the nodes with a hijacked path (apart from the hijacker), and length is the length of the path of each node (-1 for the nodes without a path)
+	'''
+	def compute_hijack_routes(self,victim_ids,hijacker_ids,hijack_type,preferences=None,legitimate_routes=None):
+		victim_ids = np.atleast_1d(np.asarray(victim_ids,dtype=np.int64))
+		hijacker_ids = np.atleast_1d(np.asarray(hijacker_ids,dtype=np.int64))
+		V, K = len(self.ASNs), max(len(victim_ids),len(hijacker_ids),1 if preferences is None else preferences.shape[1])
+		columns = np.arange(K)
+
+		# (i) legitimate routes
+		if legitimate_routes is None:
+			legitimate_routes = self.compute_routes(victim_ids if preferences is None else np.broadcast_to(victim_ids,(K,)),preferences)
+		victim_ids = np.broadcast_to(victim_ids,(K,))
+		hijacker_ids = np.broadcast_to(hijacker_ids,(K,))
+		legitimate_next_hop, legitimate_length = legitimate_routes[0], legitimate_routes[1]
+		legitimate_columns = columns if legitimate_length.shape[1] == K else np.zeros(K,dtype=np.int64)
+
+		# (ii) the hijacked paths, and the nodes in their fake part
+		excluded = np.zeros((V,K),dtype=bool)
+		if hijack_type == 0:
+			announced_length = np.ones(K,dtype=np.int32)
+		else:
+			hijacker_length = legitimate_length[hijacker_ids,legitimate_columns]	# the length of the legitimate path of the hijacker (including the hijacker)
+			announced_length = np.where(hijacker_length > 0,hijack_type+1,0)	# 0: no hijacked path (the hijacker neither has nor accepts a path)
+			node = legitimate_next_hop[hijacker_ids,legitimate_columns].astype(np.int64)
+			while True:
+				on_path = node >= 0
+				if not on_path.any():
+					break
+				node = np.maximum(node,0)
+				tail = on_path & (legitimate_length[node,legitimate_columns] <= hijack_type)	# the last hijack_type ASes of the path
+				excluded[node[tail],columns[tail]] = True
+				node = np.where(on_path,legitimate_next_hop[node,legitimate_columns],-1)
+
+		# (iii) hijacked routes
+		next_hop = np.full((V,K),-1,dtype=np.int32)
+		length = np.full((V,K),-1,dtype=np.int32)
+		route_class = np.full((V,K),2,dtype=np.int8)
+		length[victim_ids,columns] = 1
+		route_class[victim_ids,columns] = -2
+		length[hijacker_ids,columns] = announced_length
+		route_class[hijacker_ids,columns] = -2
+		hijacked = np.zeros((V,K),dtype=bool)
+		hijacked[hijacker_ids,columns] = True
+		self.propagate_routes(next_hop,length,route_class,preferences=preferences,hijacked=hijacked,excluded=excluded)
+		hijacked[hijacker_ids,columns] = False
+		length[length == 0] = -1
+		return hijacked & (length > 0), length
+
+	'''
+	Computes the lengths of the converged paths for many prefixes at once, each announced by a single origin, i.e., the "length" of the method "compute_routes(...)", without selecting the next hops.
+
+	The length of the converged path of a node does not depend on the preferences (which only select the next hop among the neighbors that offer paths of the same length); so, the same three phases are run as a multi-source BFS over the relation types,
+	where a node without a path receives (in each step) the shortest of the offered paths:
+		(i) 	customer routes: FOR each path length (in increasing order), the nodes with a path of this length (all of them have a customer route, or are origins) offer it to their providers
+		(ii) 	peer routes: the nodes with a customer route (or, the origins) offer it to their peers
+		(iii) 	provider routes: FOR each path length (in increasing order), all the nodes with a path of this length offer it to their customers
+
+	Input argument:
+		(a) origin_ids: list (P) with the ids of the origins (one per prefix)
+
+	Returns:
+		An np.array (V x P) with the length of the path of each node including the node (1 for the origins, -1 for the nodes without a path)
+	'''
+	def compute_path_lengths(self,origin_ids):
+		V, P = len(self.ASNs), len(origin_ids)
+		length = np.full((V,P),-1,dtype=np.int32)
+		length[origin_ids,np.arange(P)] = 1
+
+		# phase (i): customer routes
+		path_length = 1
+		while self.offer_path_lengths(length == path_length,length,-1,path_length):
+			path_length += 1
+
+		# phase (ii): peer routes
+		self.offer_path_lengths(length > 0,length,0)
+
+		# phase (iii): provider routes
+		path_length = 1
+		max_length = length.max()
+		while path_length <= max_length:
+			if self.offer_path_lengths(length == path_length,length,1,path_length):
+				max_length = max(max_length,path_length+1)
+			path_length += 1
+		return length
+
+	'''
+	Offers the paths of the given nodes to their neighbors of the given relation type (from the neighbor's perspective; see the method "offer_routes(...)"), in each column;
+	each neighbor without a path receives the shortest of the offered paths.
+	IF all the offered paths have the same length, THEN the columns are packed in bits (8 columns per byte), and the offers to each neighbor are merged with a bitwise OR.
+
+	Input arguments:
+		(a) sources:		np.array (V x P) of booleans - TRUE for the nodes that offer their path, per column
+		(b) length:			np.array (V x P) - the length of the path of each node (including the node), -1 for the nodes without a path; it is updated
+		(c) relation:		the type of the neighbors (from the receiving node's perspective) from which the paths are received
+		(d) path_length:	the length of all the offered paths; default value is None (i.e., the offered paths may have different lengths)
+
+	Returns:
+		TRUE if any node received a path, FALSE otherwise
+	'''
+	def offer_path_lengths(self,sources,length,relation,path_length=None):
+		rows, cols, csr_entries = self.get_relation_entries(relation)
+		entries = np.flatnonzero(sources.any(axis=1)[cols])
+		if len(entries) == 0:
+			return False
+		rows, cols = rows[entries], cols[entries]
+		starts = np.flatnonzero(np.r_[True,rows[1:] != rows[:-1]])
+		receiving = rows[starts]
+		if path_length is None:
+			no_offer = np.iinfo(np.int32).max
+			shortest = np.minimum.reduceat(np.where(sources[cols],length[cols],no_offer),starts,axis=0)
+			received = (shortest < no_offer) & (length[receiving] < 0)
+			received_length = shortest + 1
+		else:
+			offered = np.bitwise_or.reduceat(np.packbits(sources,axis=1)[cols],starts,axis=0)
+			received = np.unpackbits(offered,axis=1,count=sources.shape[1]).view(bool) & (length[receiving] < 0)
+			received_length = path_length + 1
+		if not received.any():
+			return False
+		length[receiving] = np.where(received,received_length,length[receiving])
+		return True
+
+	'''
+	Returns the lengths of the converged paths of all nodes to a prefix of each of the given origins (see the method "compute_path_lengths(...)"); they are cached per origin (in the dictionary "path_lengths"),
+	and the lengths for the origins that are not in the cache are computed together, in batches of origins.
+
+	Input arguments:
+		(a) origin_ids:	list (P) with the ids of the origins
+		(b) batch_size:	the number of origins whose path lengths are computed at once; default value is 256
+
+	Returns:
+		An np.array (P x V) of int16 with the number of ASes in the path of each node to a prefix of each origin, excluding the node (i.e., the length of the path as stored in the "paths" of the BGPnode class),
+		which is 0 for the origin itself, and -1 for the nodes without a path
+	'''
+	def get_path_lengths(self,origin_ids,batch_size=256):
+		missing = [origin_id for origin_id in dict.fromkeys(np.asarray(origin_ids,dtype=np.int64).tolist()) if origin_id not in self.path_lengths]
+		for k in range(0,len(missing),batch_size):
+			batch = missing[k:k+batch_size]
+			length = self.compute_path_lengths(batch)
+			distances = np.where(length > 0,length-1,-1).astype(np.int16).T
+			for origin_id,row in zip(batch,distances):
+				self.path_lengths[origin_id] = row
+		return np.array([self.path_lengths[origin_id] for origin_id in np.asarray(origin_ids,dtype=np.int64).tolist()],dtype=np.int16).reshape(len(origin_ids),len(self.ASNs))
+
+	'''
+	Returns the routes that are exported (after the convergence) by each node to its neighbors, for the routes computed by the method "compute_routes(...)", i.e., the paths that each node receives from its neighbors (its "all_paths" in the BGPnode class).
+
+	A node exports its route (i) to all its neighbors, IF it is the origin or its route is received from a customer, ELSE (ii) only to its customers.
+	A neighbor does not receive the route, IF it is in the path of the route; since a node in the path has a shorter path, only these neighbors are checked, by following the next hops of the path until the path length of the neighbor.
+
+	Input arguments:
+		(a) next_hop:		np.array (V x P) - the next hop of each node
+		(b) length:			np.array (V x P) - the length of the announced path of each node (-1 for the nodes without a path)
+		(c) route_class:	np.array (V x P) - the type of the neighbor from which each node received its path (-2 for the origins)
+
+	Returns:
+		A tuple (columns, exporting_ids, receiving_ids) of np.arrays, with an element per exported route, sorted by column (i.e., prefix)
+	'''
+	def get_exported_routes(self,next_hop,length,route_class):
+		rows = np.repeat(np.arange(len(self.ASNs),dtype=np.int64),np.diff(self.indptr))
+		cols = self.indices.astype(np.int64)
+		exported = (length[rows] > 0) & ((route_class[rows] < 0) | (self.relations == -1)[:,np.newaxis])
+		entries, columns = np.nonzero(exported & (length[cols] > 0) & (length[cols] < length[rows]))
+		node = rows[entries]
+		receiving_length = length[cols[entries],columns]
+		while True:
+			up = length[node,columns] > receiving_length
+			if not up.any():
+				break
+			node = np.where(up,next_hop[node,columns],node)
+		in_path = node == cols[entries]
+		exported[entries[in_path],columns[in_path]] = False
+		columns, entries = np.nonzero(exported.T)
+		return columns, rows[entries], cols[entries]
+
+	'''
+	Adds the given prefixes, and computes their converged routes in batches of prefixes (see the method "compute_routes(...)").
+
+	Input arguments:
+		(a) origins_and_prefixes:	list of tuples (origin ASN, IPprefix)
+		(b) batch_size:				the number of prefixes whose routes are computed at once; default value is 64
+	'''
+	def add_prefixes(self,origins_and_prefixes,batch_size=64):
+		origins_and_prefixes = list(origins_and_prefixes)
+		for k in range(0,len(origins_and_prefixes),batch_size):
+			batch = origins_and_prefixes[k:k+batch_size]
+			origin_ids = [self.ASN_to_id[ASN] for ASN,IPprefix in batch]
+			next_hop = self.compute_routes(origin_ids)[0]
+			for j,(origin_id,(ASN,IPprefix)) in enumerate(zip(origin_ids,batch)):
+				self.set_routes(IPprefix,next_hop[:,j],{origin_id: []})
+
+
+
+
+	### methods for storing/loading the arrays ###
+
+	'''
+	Writes the arrays of the topology (not the routing information) to the given .npz file.
+	'''
+	def save(self,filename):
+		np.savez(filename,ASNs=self.ASNs,indptr=self.indptr,indices=self.indices,relations=self.relations,preferences=self.preferences)
+
+	'''
+	Creates a CompactTopology from the arrays in the given .npz file (written with the method "save(...)").
+
+	Returns:
+		An object of type CompactTopology
+	'''
+	@classmethod
+	def load(cls,filename):
+		with np.load(filename) as data:
+			return cls(data['ASNs'],data['indptr'],data['indices'],data['relations'],data['preferences'])
+
+
+
+
+class CompactNode:
+	'''
+	Class for a (read-only) view of a node of a CompactTopology, with the same methods for the neighbors and paths as the BGPnode class.
+
+	class variables:
+		(a) ASN:		the AS number of the node
+		(b) Topology:	object of type CompactTopology - the topology to which the node belongs
+		(c) id:			integer - the id of the node in the topology
+	'''
+
+	def __init__(self,Topology,id):
+		self.Topology = Topology
+		self.id = id
+		self.ASN = Topology.ASNs[id].item()
+
+	'''
+	Returns a dictionary with (i) keys the ASNs of neighbors and (ii) values {1,0,-1} if the neighbor is {provider,peer,customer} respectively
+	'''
+	@property
+	def ASneighbors(self):
+		start, end = self.Topology.indptr[self.id], self.Topology.indptr[self.id+1]
+		return dict(zip(self.Topology.ASNs[self.Topology.indices[start:end]].tolist(),self.Topology.relations[start:end].tolist()))
+
+	'''
+	Returns a dictionary with (i) keys the ASNs of neighbors and (ii) values the preferences of the neighbors
+	'''
+	@property
+	def ASneighbors_preference(self):
+		start, end = self.Topology.indptr[self.id], self.Topology.indptr[self.id+1]
+		return dict(zip(self.Topology.ASNs[self.Topology.indices[start:end]].tolist(),self.Topology.preferences[start:end].tolist()))
+
+	'''
+	Returns a dictionary with (i) keys the IP prefixes and (ii) values the paths of the node
+	'''
+	@property
+	def paths(self):
+		paths = {}
+		for IPprefix in self.Topology.routes.keys():
+			path = self.get_path(IPprefix)
+			if path is not None:
+				paths[IPprefix] = path
+		return paths
+
+	def has_ASneighbor(self,ASN):
+		return self.Topology.has_link(self.ASN,ASN)
+
+	'''
+	Returns the number of neighbors, grouped by type, as a list [nb_of_providers, nb_of_peers, nb_of_customers]
+	'''
+	def get_nb_of_neighbors(self):
+		relations = self.Topology.relations[self.Topology.indptr[self.id]:self.Topology.indptr[self.id+1]]
+		return [int(np.count_nonzero(relations == 1)), int(np.count_nonzero(relations == 0)), int(np.count_nonzero(relations == -1))]
+
+	'''
+	Returns a dictionary {'providers' : list_of_providers, 'peers' : list_of_peers, 'customers' : list_of_customers}
+	'''
+	def get_neighbors(self):
+		start, end = self.Topology.indptr[self.id], self.Topology.indptr[self.id+1]
+		neighbors = self.Topology.ASNs[self.Topology.indices[start:end]]
+		relations = self.Topology.relations[start:end]
+		return {'providers': neighbors[relations == 1].tolist(),
+				'peers': neighbors[relations == 0].tolist(),
+				'customers': neighbors[relations == -1].tolist()}
+
+	'''
+	Returns the best path of the node for the given prefix (or None if the node has no path)
+	'''
+	def get_path(self,IPprefix):
+		return self.Topology.get_path_by_id(self.id,IPprefix)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class PropagationStats:
+	'''
+	Class for the instrumentation of the propagation of the BGP messages in a topology, i.e., counters of the work done (e.g., by an "add_prefix(...)" or a "do_hijack(...)") and wall-clock times per phase.
+	The counters are updated by the BGPtopology (and its BGPnodes) only if the instrumentation is enabled (see the method "enable_instrumentation()" of the BGPtopology class).
+
+	class variables:
+		(a) announcements_sent:			integer - the number of BGP announcements sent
+		(b) withdrawals_sent:			integer - the number of BGP withdrawals sent
+		(c) announcements_received:		integer - the number of BGP announcements delivered to the receiving nodes
+		(d) withdrawals_received:		integer - the number of BGP withdrawals delivered to the receiving nodes
+		(e) best_path_changes:			integer - the number of delivered messages that changed the best path (i.e., the "paths" entry) of the receiving node
+		(f) select_best_path_calls:		integer - the number of calls of the method "select_best_path(...)" of the nodes
+		(g) max_queue_depth:			integer - the maximum number of messages in the "BGP_message_queue"
+		(h) reentrant_calls:			integer - the number of calls of the method "propagate_BGP_messages()" during the delivery of the messages (e.g., by a receiving node); they return directly, and their messages are delivered by the running call
+		(i) convergence_rounds:			integer - the total number of rounds of the propagations; a round is the delivery of the messages that were in the queue when the previous round ended
+		(j) max_convergence_rounds:		integer - the maximum number of rounds of a single propagation (i.e., of a call of "propagate_BGP_messages()" that delivered messages)
+		(k) phase_times:				dictionary - dictionary with (i) keys the names of the phases (e.g., 'add_prefix', 'do_hijack') and (ii) values the total wall-clock time (in seconds) spent in the phase; the times of nested phases are included in the outer phases
+		(l) phase_counts:				dictionary - dictionary with (i) keys the names of the phases and (ii) values the number of times the phase was executed
+	'''
+
+	COUNTERS = ['announcements_sent','withdrawals_sent','announcements_received','withdrawals_received','best_path_changes','select_best_path_calls',
+				'max_queue_depth','reentrant_calls','convergence_rounds','max_convergence_rounds']
+	PHASES = ['add_prefix','add_prefixes','do_hijack','withdraw_prefix','fast_converge_prefix','clear_routing_information','monte_carlo']
+
+
+	'''
+	Contructor for object of the class PropagationStats; all the counters and times are set to zero.
+	'''
+	def __init__(self):
+		for counter in PropagationStats.COUNTERS:
+			setattr(self,counter,0)
+		self.phase_times = defaultdict(float)
+		self.phase_counts = defaultdict(int)
+
+
+	'''
+	Measures the wall-clock time of the given phase, i.e., the time spent in the "with" block; e.g.,
+		with stats.phase('add_prefix'):
+			...
+
+	Input argument:
+		(a) name: the name of the phase
+	'''
+	@contextmanager
+	def phase(self,name):
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.phase_times[name] += time.perf_counter() - start
+			self.phase_counts[name] += 1
+
+
+	'''
+	Returns the report of the instrumentation.
+
+	Returns:
+		A dictionary with (i) the counters (keys the names of the counters), (ii) the 'phase_times', and (iii) the 'phase_counts' (dictionaries with keys the names of the phases)
+	'''
+	def get_report(self):
+		report = {counter:getattr(self,counter) for counter in PropagationStats.COUNTERS}
+		report['phase_times'] = dict(self.phase_times)
+		report['phase_counts'] = dict(self.phase_counts)
+		return report
+
+
+	'''
+	Returns the names of the columns of the instrumentation, as written by the method "get_csv_row()": the counters, and the wall-clock times of the phases (in the order of "PHASES", with names "time_<phase>").
+	'''
+	@staticmethod
+	def get_csv_header():
+		return PropagationStats.COUNTERS + ['time_'+name for name in PropagationStats.PHASES]
+
+
+	'''
+	Returns the report of the instrumentation as a list of values (e.g., to be appended to a row of a csv file), in the order of the columns of the method "get_csv_header()".
+	'''
+	def get_csv_row(self):
+		return [getattr(self,counter) for counter in PropagationStats.COUNTERS] + [self.phase_times.get(name,0.0) for name in PropagationStats.PHASES]
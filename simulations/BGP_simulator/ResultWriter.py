@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import csv
+import glob
+import json
+import os
+import numpy as np
+
+
+class ResultWriter:
+	'''
+	Class for writing the results of simulation runs to disk as they complete (one row per run), so that a long sweep can be resumed after a crash.
+
+	The results are written to:
+		(i)		a csv file, where each row is appended (and flushed) as soon as it is written
+		(ii)	(optionally) NumPy chunk files "<csv file>.chunk<k>.npz", each with the rows of chunk_size runs (arrays 'data', 'run_ids', 'seeds'); see the function "load_chunks(...)"
+		(iii)	a sidecar file "<csv file>.done", with a line "run_id,seed" for each completed run (in the order of the rows of the csv file); the run id is the string of the given id (e.g., "(0, 64)" for a tuple), i.e., only the last comma separates the seed
+
+	The parameters of the sweep (e.g., the base seed, and the columns of the rows) are stored in a sidecar file "<csv file>.params" (as JSON).
+
+	IF resume is TRUE and the files exist (e.g., from a sweep that was interrupted)
+	THEN 	IF the stored parameters are not the given ones (e.g., the sweep is run with a different seed, or with rows of a different width), THEN raise a ValueError (i.e., refuse to mix the rows of different sweeps)
+			ELSE 	keep the completed runs (i.e., the runs in the sidecar file), which can be skipped (see the method "is_done(...)"), and append the next runs
+					(the csv file, and the sidecar file, are truncated to the runs that were completed in both; the rows that are not in a chunk file yet are read again from the csv file)
+	ELSE 	start new (empty) files
+
+	class variables:
+		(a) filename:		string - the name of the csv file
+		(b) columnar:		boolean - IF TRUE, then write also the NumPy chunk files
+		(c) chunk_size:		integer - the number of rows per chunk file
+		(d) done_runs:		dictionary - dictionary with (i) keys the ids (as strings) of the completed runs and (ii) values their seeds
+		(e) buffer:			list - the rows (and run ids and seeds) that have not been written in a chunk file yet
+		(f) nb_of_chunks:	integer - the number of chunk files written
+		(g) parameters:		the parameters of the sweep (a JSON-serializable value, e.g., a dictionary)
+	'''
+
+
+	'''
+	Contructor for object of the class ResultWriter; opens (or creates) the files.
+
+	Input arguments:
+		(a) filename:	the name of the csv file
+		(b) columnar:	IF TRUE, then write also NumPy chunk files; default value is False
+		(c) chunk_size:	the number of rows per chunk file; default value is 1000
+		(d) resume:		IF TRUE, then keep the completed runs of existing files; default value is True
+		(e) parameters:	the parameters of the sweep (a JSON-serializable value), which must be the same to resume a sweep; default value is None
+	'''
+	def __init__(self,filename,columnar=False,chunk_size=1000,resume=True,parameters=None):
+		self.filename = filename
+		self.columnar = columnar
+		self.chunk_size = chunk_size
+		self.parameters = json.loads(json.dumps(parameters))	# (e.g., tuples become lists, as when they are read from the file)
+		self.done_runs = {}
+		self.buffer = []
+		self.nb_of_chunks = 0
+
+		rows = []
+		chunk_files = sorted(glob.glob(glob.escape(filename)+'.chunk*.npz'))
+		if resume and os.path.exists(filename) and os.path.exists(filename+'.done'):
+			stored_parameters = None
+			if os.path.exists(filename+'.params'):
+				with open(filename+'.params','r') as f:
+					stored_parameters = json.load(f)
+			if stored_parameters != self.parameters:
+				raise ValueError('the parameters of the sweep in {} ({}) are not the given ones ({}); remove the files, or set resume to False, to start a new sweep'.format(filename+'.params',stored_parameters,self.parameters))
+			with open(filename+'.done','r') as f:
+				done = [line.rstrip('\n').rsplit(',',1) for line in f if line.endswith('\n')]	# (the run id may contain commas, e.g., a tuple)
+			with open(filename,'r',newline='') as f:
+				rows = list(csv.reader(f,delimiter=','))
+			nb_of_runs = min(len(done),len(rows))
+			done, rows = done[:nb_of_runs], rows[:nb_of_runs]
+			self.done_runs = {run_id:int(seed) for run_id,seed in done}
+		else:
+			done = []
+			for chunk_file in chunk_files:
+				os.remove(chunk_file)
+			chunk_files = []
+
+		# rewrite the (possibly truncated) files, and keep them open for appending
+		with open(filename+'.tmp','w',newline='') as f:
+			csv.writer(f,delimiter=',').writerows(rows)
+		os.replace(filename+'.tmp',filename)
+		with open(filename+'.done.tmp','w') as f:
+			f.writelines('{},{}\n'.format(run_id,seed) for run_id,seed in done)
+		os.replace(filename+'.done.tmp',filename+'.done')
+		with open(filename+'.params.tmp','w') as f:
+			json.dump(self.parameters,f)
+		os.replace(filename+'.params.tmp',filename+'.params')
+		self.csv_file = open(filename,'a',newline='')
+		self.csv_writer = csv.writer(self.csv_file,delimiter=',')
+		self.done_file = open(filename+'.done','a')
+
+		if self.columnar:
+			nb_of_chunked_runs = 0
+			for chunk_file in chunk_files:
+				with np.load(chunk_file) as chunk:
+					nb_of_runs_in_chunk = len(chunk['run_ids'])
+				if nb_of_chunked_runs + nb_of_runs_in_chunk > len(done):
+					os.remove(chunk_file)	# a chunk with runs that are not in the csv file (e.g., the csv file was truncated)
+					continue
+				nb_of_chunked_runs += nb_of_runs_in_chunk
+				self.nb_of_chunks += 1
+			for (run_id,seed),row in zip(done[nb_of_chunked_runs:],rows[nb_of_chunked_runs:]):
+				self.buffer.append((run_id,int(seed),[parse_value(value) for value in row]))
+
+
+	'''
+	Checks if the given run has been completed (i.e., its results have been written).
+
+	Input argument:
+		(a) run_id: the id of the run
+
+	Returns:
+		TRUE if it has been completed, FALSE otherwise
+	'''
+	def is_done(self,run_id):
+		return str(run_id) in self.done_runs
+
+
+	'''
+	Writes the results of a run.
+
+	(i)		append the row to the csv file, and flush it
+	(ii)	append the run to the sidecar file, and flush it (i.e., a run is considered as completed, only after its row is written)
+	(iii)	IF columnar is TRUE, THEN add the row to the buffer, and IF the buffer has chunk_size rows, THEN write a chunk file
+
+	Input arguments:
+		(a) run_id:	the id of the run
+		(b) seed:	the seed of the run
+		(c) row:	a list with the results of the run
+	'''
+	def write(self,run_id,seed,row):
+		self.csv_writer.writerow(row)
+		self.csv_file.flush()
+		self.done_file.write('{},{}\n'.format(run_id,seed))
+		self.done_file.flush()
+		self.done_runs[str(run_id)] = seed
+		if self.columnar:
+			self.buffer.append((str(run_id),seed,row))
+			if len(self.buffer) >= self.chunk_size:
+				self.write_chunk()
+
+
+	'''
+	Writes the rows of the buffer to a new chunk file, and empties the buffer.
+	'''
+	def write_chunk(self):
+		if not self.buffer:
+			return
+		chunk_file = '{}.chunk{:06d}.npz'.format(self.filename,self.nb_of_chunks)
+		run_ids, seeds, rows = zip(*self.buffer)
+		with open(chunk_file+'.tmp','wb') as f:
+			np.savez(f,data=np.array(rows),run_ids=np.array(run_ids),seeds=np.array(seeds,dtype=np.uint64))
+		os.replace(chunk_file+'.tmp',chunk_file)
+		self.nb_of_chunks += 1
+		self.buffer = []
+
+
+	'''
+	Writes the remaining rows of the buffer to a chunk file (if columnar), and closes the files.
+	'''
+	def close(self):
+		if self.columnar:
+			self.write_chunk()
+		self.csv_file.close()
+		self.done_file.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self,exc_type,exc_value,traceback):
+		self.close()
+
+
+
+'''
+Converts a value read from the csv file to an int (or float, if it is not an integer).
+'''
+def parse_value(value):
+	try:
+		return int(value)
+	except ValueError:
+		return float(value)
+
+
+'''
+Loads the NumPy chunk files written by a ResultWriter for the given csv file.
+
+Input argument:
+	(a) filename: the name of the csv file
+
+Returns:
+	A tuple (data, run_ids, seeds) of np.arrays, with the rows of all the chunk files (in the order they were written)
+'''
+def load_chunks(filename):
+	data, run_ids, seeds = [], [], []
+	for chunk_file in sorted(glob.glob(glob.escape(filename)+'.chunk*.npz')):
+		with np.load(chunk_file) as chunk:
+			data.append(chunk['data'])
+			run_ids.append(chunk['run_ids'])
+			seeds.append(chunk['seeds'])
+	if not data:
+		return np.empty((0,0)), np.empty(0,dtype=str), np.empty(0,dtype=np.uint64)
+	return np.concatenate(data), np.concatenate(run_ids), np.concatenate(seeds)
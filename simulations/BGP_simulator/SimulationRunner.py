@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import gc
+import hashlib
+import multiprocessing
+import random
+
+
+# the SimulationRunner (with its topology and simulation function) whose worker processes are being forked; it is set in the main process only while the pool of workers is created (and then restored),
+# so that the workers share it (copy-on-write) without pickling, and other (e.g., nested) runners are not affected
+_shared_runner = None
+
+
+class SimulationRunner:
+	'''
+	Class for running independent simulations (e.g., one hijack per run) in parallel, in a pool of worker processes that share the same topology.
+
+	The topology is loaded once (in the main process), and the worker processes are created with "fork", so that they share the (read-only) topology via copy-on-write.
+	Each run is identified by a run id, and gets a deterministic seed (derived from the base seed and the run id), so that the results do not depend on the number of processes or on the order of execution.
+	The results of the runs are returned (streamed) in the order of the given run ids.
+	When the runs are executed in the main process, the state of the global random number generator is restored after the runs (i.e., the seeding of the runs does not affect the caller).
+
+	class variables:
+		(a) Topology:				object of type BGPtopology (or CompactTopology) - the topology shared by all the runs
+		(b) simulation_function:	function with arguments (Topology, run_id, rng) that executes a run and returns its results (e.g., a list with the row to be written in the output file);
+									the function must leave the topology as it found it, except for the routing information, which is cleared after each run
+		(c) nb_of_processes:		integer - the number of worker processes; if 1, then the runs are executed in the main process
+		(d) base_seed:				integer - the seed from which the seeds of the runs are derived
+		(e) chunksize:				integer - the number of runs sent to a worker process at a time
+		(f) clear_after_run:		boolean - IF TRUE, then the routing information of the topology is cleared after each run
+		(g) seed_random:			boolean - IF TRUE, then the global random number generator is seeded with the seed of each run (before the run)
+	'''
+
+
+	'''
+	Contructor for object of the class SimulationRunner.
+
+	Input arguments:
+		(a) Topology:				object of type BGPtopology (or CompactTopology)
+		(b) simulation_function:	function with arguments (Topology, run_id, rng)
+		(c) nb_of_processes:		the number of worker processes; default value is None (i.e., the number of CPUs)
+		(d) base_seed:				the base seed; default value is 0
+		(e) chunksize:				the number of runs sent to a worker process at a time; default value is 1
+		(f) clear_after_run:		IF TRUE, then clear the routing information of the topology after each run; default value is True
+		(g) seed_random:			IF TRUE, then seed the global random number generator before each run; default value is True
+	'''
+	def __init__(self,Topology,simulation_function,nb_of_processes=None,base_seed=0,chunksize=1,clear_after_run=True,seed_random=True):
+		self.Topology = Topology
+		self.simulation_function = simulation_function
+		self.nb_of_processes = nb_of_processes if nb_of_processes is not None else multiprocessing.cpu_count()
+		self.base_seed = base_seed
+		self.chunksize = chunksize
+		self.clear_after_run = clear_after_run
+		self.seed_random = seed_random
+
+
+	'''
+	Returns the seed of the given run, which depends only on the base seed and the run id.
+
+	Input argument:
+		(a) run_id: the id of the run (integer or string)
+
+	Returns:
+		An integer (64 bits)
+	'''
+	def get_seed(self,run_id):
+		digest = hashlib.sha256('{}:{}'.format(self.base_seed,run_id).encode()).digest()
+		return int.from_bytes(digest[:8],'big')
+
+
+	'''
+	Executes the given runs, and returns (as a generator) the results in the order of the given run ids.
+
+	IF a result_writer is given
+	THEN 	skip the runs that have already been completed (e.g., by a previous, interrupted, execution of the sweep), and write the results of each run as soon as it is returned
+	IF nb_of_processes is 1 (or, "fork" is not supported by the platform)
+	THEN 	execute the runs one after the other in the main process (and restore the state of the global random number generator after the runs)
+	ELSE 	(i) set the runner as a module variable, and freeze the garbage collector (so that the shared objects are not copied due to the gc bookkeeping),
+			(ii) fork a pool of worker processes, and restore the previous value of the module variable, and
+			(iii) distribute the runs to the workers, and return their results in order
+
+	Input arguments:
+		(a) run_ids: iterable with the ids of the runs to execute
+		(b) result_writer: object of type ResultWriter (optional); default value is None
+
+	Returns:
+		A generator of tuples (run_id, seed, results), where results is the value returned by the simulation function
+	'''
+	def run(self,run_ids,result_writer=None):
+		for run_id, seed, results in self.execute_runs(run_ids if result_writer is None else [run_id for run_id in run_ids if not result_writer.is_done(run_id)]):
+			if result_writer is not None:
+				result_writer.write(run_id,seed,results)
+			yield (run_id, seed, results)
+
+
+	'''
+	Executes the given runs (in the main process, or in the pool of worker processes), and returns (as a generator) the results in the order of the given run ids; see the method "run(...)".
+	'''
+	def execute_runs(self,run_ids):
+		global _shared_runner
+		run_ids_and_seeds = [(run_id,self.get_seed(run_id)) for run_id in run_ids]
+		if (self.nb_of_processes <= 1) or ('fork' not in multiprocessing.get_all_start_methods()):
+			random_state = random.getstate()
+			try:
+				for run_id_and_seed in run_ids_and_seeds:
+					yield self.execute_run(run_id_and_seed)
+			finally:
+				random.setstate(random_state)
+		else:
+			gc.freeze()
+			try:
+				previous_runner = _shared_runner
+				_shared_runner = self
+				try:
+					pool = multiprocessing.get_context('fork').Pool(self.nb_of_processes)	# the workers are forked here
+				finally:
+					_shared_runner = previous_runner
+				with pool:
+					for result in pool.imap(execute_shared_run,run_ids_and_seeds,chunksize=self.chunksize):
+						yield result
+			finally:
+				gc.unfreeze()
+
+
+	'''
+	Executes a single run (in a worker process, or in the main process).
+
+	(i) IF seed_random is TRUE, THEN seed the global random number generator (used by the BGPnode class) with the seed of the run; create a random number generator for the run, with the seed of the run
+	(ii) call the simulation function
+	(iii) IF clear_after_run is TRUE, THEN clear the routing information of the topology
+
+	Input argument:
+		(a) run_id_and_seed: a tuple (run_id, seed)
+
+	Returns:
+		A tuple (run_id, seed, results)
+	'''
+	def execute_run(self,run_id_and_seed):
+		run_id, seed = run_id_and_seed
+		if self.seed_random:
+			random.seed(seed)
+		rng = random.Random(seed)
+		try:
+			results = self.simulation_function(self.Topology,run_id,rng)
+		finally:
+			if self.clear_after_run:
+				self.Topology.clear_routing_information()
+		return (run_id, seed, results)
+
+
+
+'''
+Executes a single run in a worker process, with the runner that was shared when the worker was forked (see the method "execute_run(...)").
+'''
+def execute_shared_run(run_id_and_seed):
+	return _shared_runner.execute_run(run_id_and_seed)
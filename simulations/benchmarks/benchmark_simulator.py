@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','BGP_simulator'))
+from BGPtopology import BGPtopology
+import synthetic_topology
+
+HIJACK_TYPES = [0,1,2]
+NB_OF_MONITORS = 100
+FILTERING_FRACTION = 0.2
+ENGINES = {'message_passing': False, 'fast_converge': True}
+
+
+'''
+Returns the statistics (in seconds) of the given list of measured times.
+'''
+def get_time_statistics(times):
+	return {'repeats': len(times), 'total_s': sum(times), 'mean_s': statistics.mean(times), 'median_s': statistics.median(times), 'min_s': min(times), 'max_s': max(times)}
+
+
+'''
+Loads the topology from the given file (with the random preferences of the neighbors seeded with the given seed).
+
+Input arguments:
+	(a) topology_file:	the name of the file (in the CAIDA AS-relationship format)
+	(b) seed:			the seed of the random preferences
+	(c) fast_converge:	IF TRUE, then enable the fast converge mode; default value is False
+	(d) use_cache:		IF TRUE, then use the binary cache file of the topology; default value is False
+
+Returns:
+	An object of type BGPtopology
+'''
+def load_topology(topology_file, seed, fast_converge=False, use_cache=False):
+	random.seed(seed)
+	Topo = BGPtopology(fast_converge=fast_converge)
+	Topo.load_topology_from_csv(topology_file,use_cache=use_cache)
+	return Topo
+
+
+'''
+Measures the time to load the topology, (i) from the csv file, and (ii) from the binary cache file (which is written by a first, not measured, load).
+'''
+def benchmark_topology_load(topology_file, seed, repeats):
+	results = {}
+	results['load_topology'] = get_time_statistics([measure(lambda: load_topology(topology_file,seed)) for _ in range(repeats)])
+	load_topology(topology_file,seed,use_cache=True)	# write the cache file
+	results['load_topology_cached'] = get_time_statistics([measure(lambda: load_topology(topology_file,seed,use_cache=True)) for _ in range(repeats)])
+	return results
+
+
+'''
+Measures (for the given topology) the propagation of a legitimate prefix ("add_prefix"), of a hijack of each type ("do_hijack"), the queries on the resulting routing state, and the clearing of the routing state ("clear_routing_information").
+
+In each run, a random victim and hijacker are selected (with a random number generator seeded with the given seed) and the prefix is announced by the victim, and then hijacked by the hijacker;
+the runs of the different hijack types use the same victims and hijackers. The number of BGP messages delivered in each phase is recorded too.
+
+Input arguments:
+	(a) Topo:				object of type BGPtopology
+	(b) nb_of_runs:			the number of runs (per hijack type)
+	(c) seed:				the seed of the selection of the victims and hijackers
+	(d) engine_name:		the name of the engine (appended to the names of the benchmarks)
+
+Returns:
+	A dictionary with the statistics of each benchmark
+'''
+def benchmark_propagation(Topo, nb_of_runs, seed, engine_name):
+	rng = random.Random(seed)
+	list_of_ASNs = Topo.get_all_nodes_ASNs()
+	pairs = [rng.sample(list_of_ASNs,2) for _ in range(nb_of_runs)]
+	monitors = rng.sample(list_of_ASNs,min(NB_OF_MONITORS,len(list_of_ASNs)))
+
+	times = {'add_prefix': [], 'clear_routing_information': [], 'queries': []}
+	messages = {'add_prefix': []}
+	for hijack_type in HIJACK_TYPES:
+		times['do_hijack_type{}'.format(hijack_type)] = []
+		messages['do_hijack_type{}'.format(hijack_type)] = []
+
+	for hijack_type in HIJACK_TYPES:
+		name = 'do_hijack_type{}'.format(hijack_type)
+		for run,(victim,hijacker) in enumerate(pairs):
+			prefix = run
+			nb_of_messages = Topo.nb_of_BGP_messages
+			t = measure(lambda: Topo.add_prefix(victim,prefix))
+			if hijack_type == HIJACK_TYPES[0]:
+				times['add_prefix'].append(t)
+				messages['add_prefix'].append(Topo.nb_of_BGP_messages - nb_of_messages)
+			nb_of_messages = Topo.nb_of_BGP_messages
+			times[name].append(measure(lambda: Topo.do_hijack(hijacker,prefix,hijack_type)))
+			messages[name].append(Topo.nb_of_BGP_messages - nb_of_messages)
+			times['queries'].append(measure(lambda: run_queries(Topo,prefix,hijacker,monitors)))
+			times['clear_routing_information'].append(measure(Topo.clear_routing_information))
+
+	results = {}
+	for name,measured_times in times.items():
+		results['{}[{}]'.format(name,engine_name)] = get_time_statistics(measured_times)
+		if name in messages:
+			results['{}[{}]'.format(name,engine_name)]['mean_nb_of_messages'] = statistics.mean(messages[name])
+	return results
+
+
+'''
+Measures (for the given topology) a filter-heavy scenario (e.g., as in experiments with route origin validation / defenses), i.e., the filtering of the paths of a hijacker by many nodes after the hijack has propagated.
+
+In each run, a random victim and hijacker are selected (with a random number generator seeded with the given seed), the prefix is announced by the victim and hijacked (Type-0 hijack) by the hijacker,
+and then a random fraction FILTERING_FRACTION of the nodes filter the paths that contain the hijacker (method "filter_path(...)" of the BGPnode class); the filtering triggers withdrawals and the selection of new best paths.
+The number of BGP messages delivered during the filtering is recorded too.
+
+Input arguments:
+	(a) Topo:				object of type BGPtopology
+	(b) nb_of_runs:			the number of runs
+	(c) seed:				the seed of the selection of the victims, hijackers and filtering nodes
+	(d) engine_name:		the name of the engine (appended to the names of the benchmarks)
+
+Returns:
+	A dictionary with the statistics of the benchmark
+'''
+def benchmark_filtering(Topo, nb_of_runs, seed, engine_name):
+	rng = random.Random(seed)
+	list_of_ASNs = Topo.get_all_nodes_ASNs()
+	times = []
+	messages = []
+	for run in range(nb_of_runs):
+		victim, hijacker = rng.sample(list_of_ASNs,2)
+		filtering_nodes = rng.sample(list_of_ASNs,int(FILTERING_FRACTION*len(list_of_ASNs)))
+		prefix = run
+		Topo.add_prefix(victim,prefix)
+		Topo.do_hijack(hijacker,prefix,0)
+		nb_of_messages = Topo.nb_of_BGP_messages
+		times.append(measure(lambda: [Topo.get_node(ASN).filter_path(prefix,hijacker) for ASN in filtering_nodes if ASN != hijacker]))
+		messages.append(Topo.nb_of_BGP_messages - nb_of_messages)
+		Topo.clear_routing_information()
+	results = {'filter_path[{}]'.format(engine_name): get_time_statistics(times)}
+	results['filter_path[{}]'.format(engine_name)]['mean_nb_of_messages'] = statistics.mean(messages)
+	return results
+
+
+'''
+Measures (for the given topology) the cost of resetting the routing state between runs, as in the loops of the example scripts (i.e., clear the routing state, announce a prefix, and hijack it).
+
+In each run, a random victim and hijacker are selected (with a random number generator seeded with the given seed), and the cycle "reset + add_prefix + do_hijack (Type-0)" is measured (after the cycle of the previous run) with the reset done by
+	(i)		'none':		no reset; the routing state of the previous run is removed before the cycle (with the method "drop_prefix(...)", which is not measured), i.e., the cost of the propagation only
+	(ii)	'epoch':	the method "clear_routing_information()", i.e., the routing epoch (the routing tables of the nodes are cleared when they are next used)
+	(iii)	'per_node':	the method "clear_routing_information(list_of_nodes)" with all the nodes, i.e., the routing tables of each node are cleared at once (as before the routing epoch)
+The cycles of the three resets are interleaved (in each run), so that they are measured under the same conditions; the reset cost is the difference of the cycle times (ii) or (iii) from (i) (reported as 'reset_cost_s').
+
+Input arguments:
+	(a) Topo:				object of type BGPtopology
+	(b) nb_of_runs:			the number of runs
+	(c) seed:				the seed of the selection of the victims and hijackers
+	(d) engine_name:		the name of the engine (appended to the names of the benchmarks)
+
+Returns:
+	A dictionary with the statistics of each benchmark
+'''
+def benchmark_reset(Topo, nb_of_runs, seed, engine_name):
+	rng = random.Random(seed)
+	list_of_ASNs = Topo.get_all_nodes_ASNs()
+	pairs = [rng.sample(list_of_ASNs,2) for _ in range(nb_of_runs)]
+	resets = {'none': lambda: None, 'epoch': lambda: Topo.clear_routing_information(), 'per_node': lambda: Topo.clear_routing_information(list_of_ASNs)}
+
+	def run_cycle(reset, victim, hijacker):
+		reset()
+		Topo.add_prefix(victim,'reset')
+		Topo.do_hijack(hijacker,'reset',0)
+
+	times = {reset_name:[] for reset_name in resets}
+	Topo.clear_routing_information()
+	run_cycle(resets['none'],*pairs[0])
+	for victim,hijacker in pairs:
+		for reset_name,reset in resets.items():
+			if reset_name == 'none':
+				Topo.drop_prefix('reset')
+			times[reset_name].append(measure(lambda: run_cycle(reset,victim,hijacker)))
+	Topo.clear_routing_information()
+
+	results = {}
+	for reset_name,measured_times in times.items():
+		results['reset_cycle_{}[{}]'.format(reset_name,engine_name)] = get_time_statistics(measured_times)
+		if reset_name != 'none':
+			results['reset_cycle_{}[{}]'.format(reset_name,engine_name)]['reset_cost_s'] = statistics.median([t-t0 for t,t0 in zip(measured_times,times['none'])])
+	return results
+
+
+'''
+Measures the sweep over hijackers (method "get_hijack_impact_per_hijacker(...)"), i.e., the impact of the hijacks of each type by each of the given number of random hijackers, for a random victim.
+
+Input arguments:
+	(a) Topo:				object of type BGPtopology
+	(b) nb_of_hijackers:	the number of hijackers
+	(c) seed:				the seed of the selection of the victim and the hijackers
+
+Returns:
+	A dictionary with the statistics of the benchmark
+'''
+def benchmark_hijacker_sweep(Topo, nb_of_hijackers, seed):
+	rng = random.Random(seed)
+	list_of_ASNs = Topo.get_all_nodes_ASNs()
+	victim = rng.choice(list_of_ASNs)
+	hijackers = rng.sample(list_of_ASNs,min(nb_of_hijackers,len(list_of_ASNs)))
+	times = [measure(lambda: Topo.get_hijack_impact_per_hijacker(victim,hijackers,hijack_types=HIJACK_TYPES))]
+	results = {'get_hijack_impact_per_hijacker': get_time_statistics(times)}
+	results['get_hijack_impact_per_hijacker']['nb_of_hijacks'] = len(hijackers)*len(HIJACK_TYPES)
+	return results
+
+
+'''
+Runs the queries of the example scripts (the numbers of nodes with a path / with a hijacked path, the average path length, and the nodes seen by monitors) for the given prefix.
+'''
+def run_queries(Topo, prefix, hijacker, monitors):
+	Topo.get_nb_of_nodes_with_path_to_prefix(prefix)
+	Topo.get_nb_of_nodes_with_hijacked_path_to_prefix(prefix,hijacker)
+	Topo.get_nb_of_nodes_with_hijacked_path_to_prefix(prefix,hijacker,list_of_nodes=monitors)
+	Topo.get_average_path_length(prefix)
+	Topo.get_set_of_infected_nodes_seen_by_monitors(prefix,hijacker,monitors)
+
+
+'''
+Measures the memory (with tracemalloc) of (i) the topology, and (ii) the routing state of a prefix (i.e., after an "add_prefix"), averaged over the given number of prefixes that are kept in the topology at the same time.
+'''
+def benchmark_memory(topology_file, seed, nb_of_prefixes):
+	tracemalloc.start()
+	try:
+		Topo = load_topology(topology_file,seed)
+		topology_bytes = tracemalloc.get_traced_memory()[0]
+		rng = random.Random(seed)
+		list_of_ASNs = Topo.get_all_nodes_ASNs()
+		before = tracemalloc.get_traced_memory()[0]
+		for prefix in range(nb_of_prefixes):
+			Topo.add_prefix(rng.choice(list_of_ASNs),prefix)
+		routing_bytes = tracemalloc.get_traced_memory()[0] - before
+	finally:
+		tracemalloc.stop()
+	return {'topology_MB': topology_bytes/2**20, 'routing_state_per_prefix_MB': routing_bytes/2**20/max(nb_of_prefixes,1)}
+
+
+'''
+Returns the wall-clock time (in seconds) of a call of the given function.
+'''
+def measure(function):
+	start = time.perf_counter()
+	function()
+	return time.perf_counter() - start
+
+
+'''
+Prints the ratio of the median times of the benchmarks in the given results to the median times in the previous results (e.g., >1 for a slowdown).
+'''
+def compare_results(previous, results):
+	print('{:<50} {:>12} {:>12} {:>8}'.format('benchmark','previous (s)','current (s)','ratio'))
+	for name,stats in results['benchmarks'].items():
+		if name in previous.get('benchmarks',{}):
+			previous_median = previous['benchmarks'][name]['median_s']
+			ratio = stats['median_s']/previous_median if previous_median > 0 else float('nan')
+			print('{:<50} {:>12.6f} {:>12.6f} {:>8.2f}'.format(name,previous_median,stats['median_s'],ratio))
+
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Benchmarks of the BGP simulator, on a synthetic (or a CAIDA) AS-graph; the results are written as JSON.')
+	parser.add_argument('--nb-of-ASes', type=int, default=5000, help='the number of ASes of the synthetic AS-graph (default: 5000)')
+	parser.add_argument('--peering-density', type=float, default=0.02, help='the probability of a peering link between two tier-2 ASes of the synthetic AS-graph (default: 0.02)')
+	parser.add_argument('--nb-of-IXPs', type=int, default=20, help='the number of IXP peering cliques of the synthetic AS-graph (default: 20)')
+	parser.add_argument('--IXP-size', type=int, default=30, help='the number of members of each IXP of the synthetic AS-graph (default: 30)')
+	parser.add_argument('--caida', default=None, help='a CAIDA AS-relationship file to be used instead of the synthetic AS-graph')
+	parser.add_argument('--nb-of-runs', type=int, default=20, help='the number of runs (victim-hijacker pairs) per hijack type (default: 20)')
+	parser.add_argument('--repeats', type=int, default=3, help='the number of repeats of the topology load (default: 3)')
+	parser.add_argument('--seed', type=int, default=0, help='the seed of the AS-graph, the preferences and the victim-hijacker pairs (default: 0)')
+	parser.add_argument('--output', default='benchmark_results.json', help='the JSON file with the results (default: benchmark_results.json)')
+	parser.add_argument('--compare', default=None, help='a JSON file with previous results, to be compared with the current results')
+	args = parser.parse_args()
+
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		if args.caida:
+			topology_file = args.caida
+			topology = {'source': os.path.basename(args.caida)}
+		else:
+			topology_file = os.path.join(tmp_dir,'synthetic.as-rel2.txt')
+			links = synthetic_topology.generate_topology(args.nb_of_ASes,peering_density=args.peering_density,nb_of_IXPs=args.nb_of_IXPs,IXP_size=args.IXP_size,seed=args.seed)
+			synthetic_topology.write_topology(topology_file,links)
+			topology = {'source': 'synthetic', 'nb_of_ASes': args.nb_of_ASes, 'peering_density': args.peering_density, 'nb_of_IXPs': args.nb_of_IXPs, 'IXP_size': args.IXP_size}
+
+		print('Benchmarking topology load...')
+		benchmarks = benchmark_topology_load(topology_file,args.seed,args.repeats)
+		for engine_name,fast_converge in ENGINES.items():
+			print('Benchmarking propagation ({})...'.format(engine_name))
+			Topo = load_topology(topology_file,args.seed,fast_converge=fast_converge)
+			benchmarks.update(benchmark_propagation(Topo,args.nb_of_runs,args.seed,engine_name))
+			benchmarks.update(benchmark_filtering(Topo,args.nb_of_runs,args.seed,engine_name))
+			benchmarks.update(benchmark_reset(Topo,args.nb_of_runs,args.seed,engine_name))
+		print('Benchmarking hijacker sweep...')
+		benchmarks.update(benchmark_hijacker_sweep(Topo,10*args.nb_of_runs,args.seed))
+		topology['nb_of_nodes'] = Topo.get_nb_nodes()
+		topology['nb_of_links'] = sum(len(node.ASneighbors) for node in Topo.list_of_all_BGP_nodes.values())//2
+		print('Measuring memory...')
+		memory = benchmark_memory(topology_file,args.seed,args.nb_of_runs)
+
+	results = {
+		'metadata': {'date': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform(),
+					'seed': args.seed, 'nb_of_runs': args.nb_of_runs, 'topology': topology},
+		'benchmarks': benchmarks,
+		'memory': memory,
+	}
+	with open(args.output,'w') as f:
+		json.dump(results,f,indent=2)
+	print('Results written to: {}'.format(args.output))
+
+	if args.compare:
+		with open(args.compare,'r') as f:
+			compare_results(json.load(f),results)
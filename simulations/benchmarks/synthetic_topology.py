@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import random
+
+
+'''
+Generates a deterministic synthetic AS-graph with a tiered hierarchy (similar to the CAIDA AS-relationship datasets).
+
+The AS numbers are 1,2,...,nb_of_ASes, and the ASes are assigned to tiers in this order:
+	(i)		tier-1 ASes (the first nb_of_tier1 ASes): they form a full mesh of peering links, and have no providers
+	(ii)	tier-2 ASes (the next tier2_fraction*nb_of_ASes ASes): each one has 1-3 providers among the tier-1 and the (previous) tier-2 ASes, and peers with each other tier-2 AS with probability peering_density
+	(iii)	stub ASes (the rest): each one has 1-2 providers among the tier-2 (and, rarely, the tier-1) ASes
+The providers are selected with preference for the ASes with smaller AS numbers (i.e., "larger" ASes), so that the degree distribution is skewed.
+Finally, nb_of_IXPs IXPs are created, each with IXP_size members (randomly selected among the tier-2 and stub ASes), whose members form a clique of peering links (without replacing any existing link).
+
+Input arguments:
+	(a) nb_of_ASes:			the number of ASes
+	(b) nb_of_tier1:		the number of tier-1 ASes; default value is 10
+	(c) tier2_fraction:		the fraction of tier-2 ASes; default value is 0.15
+	(d) peering_density:	the probability of a peering link between two tier-2 ASes; default value is 0.02
+	(e) nb_of_IXPs:			the number of IXPs; default value is 20
+	(f) IXP_size:			the number of members of each IXP; default value is 30
+	(g) seed:				the seed of the random number generator; default value is 0
+
+Returns:
+	A list of tuples (ASN1, ASN2, peering_type) with the links of the graph, where peering_type is -1 if ASN2 is customer of ASN1, and 0 if ASN1 and ASN2 are peers
+'''
+def generate_topology(nb_of_ASes, nb_of_tier1=10, tier2_fraction=0.15, peering_density=0.02, nb_of_IXPs=20, IXP_size=30, seed=0):
+	rng = random.Random(seed)
+	nb_of_tier1 = min(nb_of_tier1,nb_of_ASes)
+	nb_of_tier2 = min(int(tier2_fraction*nb_of_ASes),nb_of_ASes-nb_of_tier1)
+	tier1 = list(range(1,nb_of_tier1+1))
+	tier2 = list(range(nb_of_tier1+1,nb_of_tier1+nb_of_tier2+1))
+	stubs = list(range(nb_of_tier1+nb_of_tier2+1,nb_of_ASes+1))
+
+	links = []
+	linked_pairs = set()
+	def add_link(ASN1,ASN2,peering_type):
+		pair = (min(ASN1,ASN2),max(ASN1,ASN2))
+		if (ASN1 != ASN2) and (pair not in linked_pairs):
+			linked_pairs.add(pair)
+			links.append((ASN1,ASN2,peering_type))
+
+	def select_providers(candidates,nb_of_providers):
+		return {candidates[int(len(candidates)*rng.random()**2)] for _ in range(nb_of_providers)}	# skewed towards the first candidates
+
+	for i,ASN1 in enumerate(tier1):
+		for ASN2 in tier1[i+1:]:
+			add_link(ASN1,ASN2,0)
+	for i,ASN in enumerate(tier2):
+		for provider in select_providers(tier1+tier2[:i],rng.randint(1,3)):
+			add_link(provider,ASN,-1)
+	for i,ASN1 in enumerate(tier2):
+		for ASN2 in tier2[i+1:]:
+			if rng.random() < peering_density:
+				add_link(ASN1,ASN2,0)
+	for ASN in stubs:
+		candidates = tier2 if (tier2 and rng.random() < 0.95) else tier1
+		for provider in select_providers(candidates,rng.randint(1,2)):
+			add_link(provider,ASN,-1)
+
+	members_pool = tier2 + stubs
+	for _ in range(nb_of_IXPs):
+		members = sorted(rng.sample(members_pool,min(IXP_size,len(members_pool))))
+		for i,ASN1 in enumerate(members):
+			for ASN2 in members[i+1:]:
+				add_link(ASN1,ASN2,0)
+
+	return links
+
+
+'''
+Writes the given links to a file in the format of the CAIDA AS-relationship datasets (i.e., "ASN1|ASN2|peering_type|source"), so that it can be loaded with the method "load_topology_from_csv(...)" of the BGPtopology class.
+
+Input arguments:
+	(a) filename:	the name of the file
+	(b) links:		a list of tuples (ASN1, ASN2, peering_type)
+'''
+def write_topology(filename, links):
+	with open(filename,'w') as f:
+		f.write('# synthetic AS-graph\n')
+		for ASN1,ASN2,peering_type in links:
+			f.write('{}|{}|{}|synthetic\n'.format(ASN1,ASN2,peering_type))
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+
+
+import csv
+import sys
+sys.path.insert(1, './BGP_simulator/')
+from BGPtopology import BGPtopology
+
+TOPOLOGY_FILE_FORMAT = '../CAIDA AS-graph/{}.as-rel2.txt'
+OUTPUT_FILE_FORMAT = './example_results_hijack_impact_per_hijacker__CAIDA{}_victim{}.csv'
+HIJACK_TYPES = [0,1,2]
+BATCH_SIZE = 64	# the number of hijackers whose routes are computed at once
+
+
+
+'''
+read the input arguments; if incorrect arguments, exit
+'''
+if len(sys.argv) in (3,4):
+	victim_AS = int(sys.argv[1]) # 3333
+	dataset = sys.argv[2] # 20160901
+	nb_of_processes = int(sys.argv[3]) if len(sys.argv) == 4 else 1 # (optional) 64
+else:
+	sys.exit("Incorrent arguments. Arguments should be {victim_ASN, dataset_id, [nb_of_processes]}")
+
+
+
+'''
+load and create topology
+'''
+print('Loading topology...')
+Topo = BGPtopology()
+Topo.load_topology_from_csv(TOPOLOGY_FILE_FORMAT.format(dataset))
+if not Topo.has_node(victim_AS):
+	sys.exit("The victim AS {} is not in the topology".format(victim_AS))
+
+
+
+'''
+compute the impact of the hijacks of each type by every AS (apart from the victim), and write the ranked table (the hijacks with the largest impact first)
+'''
+print('Sweep started')
+table = Topo.get_hijack_impact_per_hijacker(victim_AS,hijack_types=HIJACK_TYPES,batch_size=BATCH_SIZE,nb_of_processes=nb_of_processes)
+csvfilename = OUTPUT_FILE_FORMAT.format(dataset, victim_AS)
+with open(csvfilename,'w') as f:
+	csv_writer = csv.writer(f,delimiter=',')
+	csv_writer.writerow(['rank','hijacker_ASN','hijack_type','nb_of_infected_ASes','fraction_of_infected_ASes'])
+	for rank,row in enumerate(table,1):
+		csv_writer.writerow([rank]+list(row))
+print('Ranked table written to csv: {}'.format(csvfilename))
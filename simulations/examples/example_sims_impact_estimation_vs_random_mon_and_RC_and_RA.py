@@ -10,11 +10,13 @@
 
 
 #import time
-import random
-import csv
+import numpy as np
 import sys
 sys.path.insert(1, './BGP_simulator/')
 from BGPtopology import BGPtopology
+from SimulationRunner import SimulationRunner
+from ResultWriter import ResultWriter
+from PropagationStats import PropagationStats
 import util_functions as utils
 
 TOPOLOGY_FILE_FORMAT = '../CAIDA AS-graph/{}.as-rel2.txt'
@@ -22,6 +24,7 @@ OUTPUT_FILE_FORMAT = './example_results_impact__CAIDA{}_sims{}_hijackType{}_rnd_
 NB_RND_MONITORS = [5,10,20,30,40,50,100,200,300,400,500,1000]
 RIPE_ATLAS_FILE = '../data/RA_monitors_in_experiments.json'
 RIPE_RC_FILE = '../data/RC_monitors_in_experiments.json'
+INSTRUMENTATION = False	# IF True, then the instrumentation report of each run (i.e., message counters and phase times; see the class PropagationStats) is appended to its row, in the columns of "PropagationStats.get_csv_header()"
 
 
 
@@ -29,12 +32,13 @@ RIPE_RC_FILE = '../data/RC_monitors_in_experiments.json'
 '''
 read the input arguments; if incorrect arguments, exit
 '''  
-if len(sys.argv) is 4:
+if len(sys.argv) in (4,5):
 	nb_of_sims = int(sys.argv[1]) # e.g., 1000
 	hijack_type = int(sys.argv[2]) # e.g., 0 or 1 or 2 or ...
 	dataset = sys.argv[3] # e.g., 20190801
+	nb_of_processes = int(sys.argv[4]) if len(sys.argv) == 5 else 1 # (optional) e.g., 64
 else:
-	sys.exit("Incorrent arguments. Arguments should be {nb_of_sims, hijack_type, dataset_id}")
+	sys.exit("Incorrent arguments. Arguments should be {nb_of_sims, hijack_type, dataset_id, [nb_of_processes]}")
 
 
 
@@ -51,6 +55,9 @@ add to the topology the list of RIPE (RIS & Atlas) monitors (i.e., ASNs of the m
 '''
 Ripe_atlas = list(set(list_of_ASNs).intersection(set(utils.get_list_monitor_ASes(RIPE_ATLAS_FILE))))
 Route_collectors = list(set(list_of_ASNs).intersection(set(utils.get_list_monitor_ASes(RIPE_RC_FILE))))
+ids_of_ASNs = Topo.get_ids_of_nodes(list_of_ASNs)
+ids_of_Route_collectors = Topo.get_ids_of_nodes(Route_collectors)
+ids_of_Ripe_atlas = Topo.get_ids_of_nodes(Ripe_atlas)
 
 
 '''
@@ -59,22 +66,20 @@ do simulations:
 	(i) select randomly a legitimate and a hijacking AS
 	(ii) add a new prefix to the legitimate AS (BGP messages for the prefix will start propagating)
 	(iii) hijack the prefix from the hijacker AS
+	
+	the runs are independent; they are executed in parallel (if nb_of_processes > 1) by the SimulationRunner, with a random number generator "rng" seeded per run
 '''
-
-print('Simulation started')
-simulation_step = 0
-DATA = []
-for i in range(nb_of_sims):
-	print('simulation step: '+str(100*simulation_step/nb_of_sims)+'%\r',end='')
-	simulation_step += 1
+def run_simulation(Topo, run_id, rng):
+	if INSTRUMENTATION:
+		Topo.enable_instrumentation()	# new (zero) counters for the run
 
 	# randomly select victim, hijacker
-	r = random.sample(list_of_ASNs,2)
+	r = rng.sample(list_of_ASNs,2)
 	legitimate_AS = r[0]
 	hijacker_AS = r[1]
 
 	# create an IP prefix (here, we arbitrarity set the prefix value equal to the simulation run, i.e., 0, 1, 2, ... . You can use any other value)
-	prefix = simulation_step
+	prefix = run_id
 
 	# do the legitimate announcement from the victim
 	Topo.add_prefix(legitimate_AS,prefix)
@@ -89,37 +94,29 @@ for i in range(nb_of_sims):
 	Topo.do_hijack(hijacker_AS,prefix,hijack_type)
 	simulation_DATA.append(Topo.get_nb_of_nodes_with_hijacked_path_to_prefix(prefix,hijacker_AS))
 
-	# impact of the hijack as seen by a set (of size M) of random monitors
-	for M in NB_RND_MONITORS:
-		simulation_DATA.append(Topo.get_nb_of_nodes_with_hijacked_path_to_prefix(prefix,hijacker_AS,list_of_nodes=random.sample(list_of_ASNs,M)))
-	
-	# impact of the hijack as seen by a set (of size M) of RC monitors
-	for M in NB_RND_MONITORS:
-		if M < len(Route_collectors):
-			simulation_DATA.append(Topo.get_nb_of_nodes_with_hijacked_path_to_prefix(prefix,hijacker_AS,list_of_nodes=random.sample(Route_collectors,M)))
-		else:
-			simulation_DATA.append(-1)
-
-	# impact of the hijack as seen by a set (of size M) of RA monitors
-	for M in NB_RND_MONITORS:
-		if M < len(Ripe_atlas):
-			simulation_DATA.append(Topo.get_nb_of_nodes_with_hijacked_path_to_prefix(prefix,hijacker_AS,list_of_nodes=random.sample(Ripe_atlas,M)))
-		else:
-			simulation_DATA.append(-1)
-
-	DATA.append(simulation_DATA)
-
-	# withdraws all IP prefixes from the topology - clears the routing tables of all ASes (this is optional; used for memory performance reasons) 
-	Topo.clear_routing_information()
+	# impact of the hijack as seen by a set (of size M) of random / RC / RA monitors (the sets of each size are sampled and evaluated in one call)
+	np_rng = np.random.default_rng(rng.getrandbits(64))
+	for ids_of_monitors in [ids_of_ASNs, ids_of_Route_collectors, ids_of_Ripe_atlas]:
+		simulation_DATA.extend(utils.get_nb_of_infected_monitors_per_set_size(Topo,prefix,hijacker_AS,ids_of_monitors,NB_RND_MONITORS,rng=np_rng)[0].tolist())
 
+	if INSTRUMENTATION:
+		simulation_DATA.extend(Topo.stats.get_csv_row())
 
+	# the SimulationRunner withdraws all IP prefixes from the topology after the run - clears the routing tables of all ASes
+	return simulation_DATA
 
 
 '''
-Write the results to a csv file
+the results of each run are written to the csv file as soon as the run is completed; IF the script is run again (with the same arguments), THEN the completed runs are skipped (i.e., an interrupted sweep is resumed);
+the sweep is not resumed (i.e., the ResultWriter raises an error) IF its parameters have changed (the base seed of the runs, the numbers of monitors, and the instrumentation columns of the rows)
 '''
-print('Writing statistics to csv...')
+print('Simulation started')
 csvfilename = OUTPUT_FILE_FORMAT.format(dataset, nb_of_sims, hijack_type)
-with open(csvfilename, 'w') as csvfile:
-	writer = csv.writer(csvfile, delimiter=',')
-	writer.writerows(DATA)
+runner = SimulationRunner(Topo, run_simulation, nb_of_processes=nb_of_processes)
+sweep_parameters = {'base_seed': runner.base_seed, 'NB_RND_MONITORS': NB_RND_MONITORS, 'instrumentation_columns': PropagationStats.get_csv_header() if INSTRUMENTATION else []}
+with ResultWriter(csvfilename, parameters=sweep_parameters) as writer:
+	simulation_step = len(writer.done_runs)
+	for run_id, seed, simulation_DATA in runner.run(range(nb_of_sims), result_writer=writer):
+		print('simulation step: '+str(100*simulation_step/nb_of_sims)+'%\r',end='')
+		simulation_step += 1
+print('Statistics written to csv: {}'.format(csvfilename))
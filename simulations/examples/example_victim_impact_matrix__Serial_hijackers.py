@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+
+
+import csv
+import sys
+sys.path.insert(1, './BGP_simulator/')
+from BGPtopology import BGPtopology
+
+TOPOLOGY_FILE_FORMAT = '../CAIDA AS-graph/{}.as-rel2.txt'
+OUTPUT_FILE_FORMAT = './example_results_impact_matrix__CAIDA{}_hijackType{}__Serial_Hijackers.npy'
+Serial_Hijackers_file = '../data/serial_hijackers/groundtruth_dataset_cropped.csv'
+
+
+
+'''
+read the input arguments; if incorrect arguments, exit
+'''
+if len(sys.argv) in (3,4):
+	hijack_type = int(sys.argv[1]) # 0 or 1 or 2 or ...
+	dataset = sys.argv[2] # 20160901
+	nb_of_processes = int(sys.argv[3]) if len(sys.argv) == 4 else 1 # (optional) 64
+else:
+	sys.exit("Incorrent arguments. Arguments should be {hijack_type, dataset_id, [nb_of_processes]}")
+
+
+
+'''
+load and create topology
+'''
+print('Loading topology...')
+Topo = BGPtopology()
+Topo.load_topology_from_csv(TOPOLOGY_FILE_FORMAT.format(dataset))
+list_of_ASNs = Topo.get_all_nodes_ASNs()
+
+list_of_serial_hijackers = []
+with open(Serial_Hijackers_file, 'r') as f:
+	cr = csv.reader(f,delimiter=',')
+	next(cr, None) # skip the first row (i.e., the header)
+	for r in cr:
+		if int(r[1]) == 1:
+			list_of_serial_hijackers.append(int(r[0]))
+
+list_of_serial_hijackers = sorted(set(list_of_serial_hijackers).intersection(set(list_of_ASNs)))
+
+
+
+'''
+compute the impact of the hijacks by each serial hijacker on every victim AS, and write the victim x hijacker matrix;
+it can be sliced without loading the whole matrix in memory, e.g., 
+	data = BGPtopology.load_hijack_impact_matrix(filename)
+	data['impact'][i,:]		# the impact of all the serial hijackers on the victim data['victims'][i]
+'''
+print('Sweep started')
+filename = OUTPUT_FILE_FORMAT.format(dataset, hijack_type)
+data = Topo.write_hijack_impact_matrix(filename,list_of_serial_hijackers,hijack_type=hijack_type,nb_of_processes=nb_of_processes)
+print('Matrix of {} victims x {} hijackers written to: {}'.format(len(data['victims']),len(data['hijackers']),filename))
@@ -3,7 +3,9 @@ import matplotlib.pyplot as plt
 from matplotlib import colors
 import json
 import csv
+import os
 import random
+import zipfile
 from collections import defaultdict
 
 
@@ -12,16 +14,38 @@ Calculates experimental CDF of the given data
 
 Input: 
 	data: one dimensional np.array
+	epsilon: not used (kept for compatibility)
 
 Return:
 	cdf: the values (probablities) of the eCDF
 	x:	 the values of the data that correspond to the probabilities
 '''
 def ecdf(data, epsilon = 0.0001):
-	data = data[~np.isnan(data)]
-	cdf, x = np.histogram(data, bins=np.append(np.unique(data), np.array([np.max(data)+epsilon])))
-	cdf = np.cumsum(cdf)/np.sum(cdf)
-	return cdf, x[0:-1]
+	data = np.asarray(data)
+	x, counts = np.unique(data[~np.isnan(data)], return_counts=True)
+	cdf = np.cumsum(counts)/np.sum(counts)
+	return cdf, x
+
+'''
+Calculates the experimental CDFs of many data series (e.g., the errors of many estimators) at the given points, in one call
+
+Input:
+	data: np.array (K x N) with a data series per row; NaN values are ignored
+	x: one dimensional np.array (P) with the points where the CDFs are calculated
+
+Return:
+	cdf: np.array (K x P) with the value of the eCDF of each series at each point (NaN for series without data)
+'''
+def ecdf_at(data, x):
+	data = np.atleast_2d(np.asarray(data, dtype=float))
+	x = np.asarray(x, dtype=float)
+	data = np.sort(data, axis=1)	# NaN values are sorted at the end
+	nb_values = np.sum(~np.isnan(data), axis=1)
+	cdf = np.empty((data.shape[0], len(x)))
+	for i in range(data.shape[0]):
+		cdf[i,:] = np.searchsorted(data[i,0:nb_values[i]], x, side='right')
+	with np.errstate(divide='ignore', invalid='ignore'):
+		return cdf/nb_values[:,np.newaxis]
 
 '''
 plots the cdf of the given data
@@ -76,34 +100,151 @@ def get_list_monitor_ASes(monitor_file, ASes_in_topology=None):
 	return mon_ASes
 
 
-def impact_dist(x,y,relative_error=True):
-	if relative_error: 
-		return np.array([abs(y[i]-x[i])/x[i] for i, v in enumerate(x) if v!=0 and x[i]<=1 and y[i]<=1 and x[i]>=0 and y[i]>=0]) #abs(x-y)/x
+'''
+Samples (without replacement within each set) many sets of the same size from the given population, in a vectorized way.
+
+Input:
+	population: one dimensional np.array (N), e.g., the ids of the monitors in the topology (see the method "get_ids_of_nodes(...)" of the BGPtopology class)
+	set_size: the number of elements in each set (must not be larger than N)
+	nb_of_sets: the number of sets
+	rng: (optional) a np.random.Generator
+
+Returns:
+	sets: np.array (nb_of_sets x set_size) with a sampled set per row
+'''
+def sample_sets(population, set_size, nb_of_sets, rng=None):
+	if rng is None:
+		rng = np.random.default_rng()
+	N = len(population)
+	if (set_size < 0) or (set_size > N):
+		raise ValueError('Sample larger than population or is negative')
+	if nb_of_sets*N <= 2**22:	# sort random keys per set (the first set_size of a random permutation)
+		ind = np.argpartition(rng.random((nb_of_sets,N)), set_size-1, axis=1)[:,:set_size] if set_size > 0 else np.empty((nb_of_sets,0),dtype=np.int64)
 	else:
-		return np.array([abs(y[i]-x[i]) for i, v in enumerate(x) if x[i]<=1 and y[i]<=1 and x[i]>=0 and y[i]>=0]) #abs(x-y)/x
+		ind = np.array([rng.choice(N, set_size, replace=False) for i in range(nb_of_sets)], dtype=np.int64).reshape(nb_of_sets,set_size)
+	return population[ind]
+
+
+'''
+Calculates the number of infected monitors for many sets of monitors, of each of the given sizes (e.g., NB_RND_MONITORS), sampled from the given monitors.
+The mask of infected nodes is computed once, and the number of infected monitors of all the sets of a given size is calculated in one (vectorized) call.
+
+Input:
+	Topo: the BGPtopology
+	IPprefix: the hijacked prefix
+	hijacker_ASN: the hijacker
+	ids_of_monitors: np.array with the ids of the monitors in the topology (see the method "get_ids_of_nodes(...)" of the BGPtopology class)
+	set_sizes: a list with the sizes of the sets of monitors
+	nb_of_sets: (optional) the number of sets per size
+	rng: (optional) a np.random.Generator
+
+Returns:
+	nb_infected: np.array (nb_of_sets x len(set_sizes)) with the number of infected monitors of each set; -1 for the sizes that are not smaller than the number of monitors
+'''
+def get_nb_of_infected_monitors_per_set_size(Topo, IPprefix, hijacker_ASN, ids_of_monitors, set_sizes, nb_of_sets=1, rng=None):
+	if rng is None:
+		rng = np.random.default_rng()
+	infected = Topo.get_mask_of_nodes_with_hijacked_path_to_prefix(IPprefix, hijacker_ASN)
+	nb_infected = np.full((nb_of_sets, len(set_sizes)), -1, dtype=np.int64)
+	for j, M in enumerate(set_sizes):
+		if M < len(ids_of_monitors):
+			nb_infected[:,j] = Topo.count_nodes_in_mask_per_set(infected, sample_sets(ids_of_monitors, M, nb_of_sets, rng))
+	return nb_infected
+
+
+'''
+Calculates the error of the impact estimations y of the real impacts x (i.e., |y-x|/x, or |y-x| if not relative_error), considering only the valid pairs (x,y in [0,1], and x!=0 for the relative error).
+
+The inputs can be arrays of any (broadcastable) shape, e.g., x (N) the real impacts of N runs and y (K x N) the estimations of K estimators (e.g., monitor families and numbers of monitors) for the N runs.
+
+Input:
+	x: np.array (or list) with the real impacts
+	y: np.array (or list) with the estimated impacts
+	relative_error: (optional) IF TRUE, then calculate the relative error
 
+Returns:
+	IF the inputs are one dimensional, THEN a np.array with the errors of the valid pairs,
+	ELSE a np.array (of the broadcasted shape) with the errors, and NaN for the invalid pairs
+'''
+def impact_dist(x,y,relative_error=True):
+	x, y = np.broadcast_arrays(np.asarray(x), np.asarray(y))
+	valid = (x<=1) & (y<=1) & (x>=0) & (y>=0)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		if relative_error: 
+			valid &= (x!=0)
+			dist = np.abs(y-x)/x
+		else:
+			dist = np.abs(y-x)
+	return masked_values(dist, valid)
+
+'''
+Calculates the squared error (y-x)^2 of the impact estimations y of the real impacts x, considering only the valid pairs (x!=0, and x,y in [0,1]); see "impact_dist(...)" for the shapes of the inputs and outputs
+'''
 def impact_mse(x,y):
-	return np.array([(y[i]-x[i])**2 for i, v in enumerate(x) if v!=0 and x[i]<=1 and y[i]<=1 and x[i]>=0 and y[i]>=0])
+	x, y = np.broadcast_arrays(np.asarray(x), np.asarray(y))
+	valid = (x!=0) & (x<=1) & (y<=1) & (x>=0) & (y>=0)
+	return masked_values((y-x)**2, valid)
 
+'''
+Calculates the ratio y/x of the impact estimations y to the real impacts x, considering only the pairs with x!=0; see "impact_dist(...)" for the shapes of the inputs and outputs
+'''
 def impact_ratio(x,y): 
-	return np.array([y[i]/x[i] for i, v in enumerate(x) if v!=0])#y/x
+	x, y = np.broadcast_arrays(np.asarray(x), np.asarray(y))
+	valid = (x!=0)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		ratio = y/x
+	return masked_values(ratio, valid)
 
+'''
+Returns the values of the valid positions: IF the values are one dimensional, THEN only the valid values, ELSE the values with NaN at the invalid positions
+'''
+def masked_values(values, valid):
+	if values.ndim <= 1:
+		return values[valid]
+	return np.where(valid, values, np.nan)
+
+# the average/median errors are calculated over the last dimension (i.e., one value per estimator, for 2-D inputs)
 def avg_impact_dist(*args,**kwargs):
-	return np.nanmean(impact_dist(*args,**kwargs))
+	return np.nanmean(impact_dist(*args,**kwargs), axis=-1)
 
 def median_impact_dist(*args,**kwargs):
-	return np.nanmedian(impact_dist(*args,**kwargs))
+	return np.nanmedian(impact_dist(*args,**kwargs), axis=-1)
 
 
 def avg_impact_mse(x,y,root_mse=False):
-	MSE = np.nanmean(impact_mse(x,y))
+	MSE = np.nanmean(impact_mse(x,y), axis=-1)
 	if root_mse:
 		return np.sqrt(MSE)
 	else:
 		return MSE
 
 def avg_impact_ratio(*args): 
-	return np.nanmean(impact_ratio(*args))
+	return np.nanmean(impact_ratio(*args), axis=-1)
+
+
+'''
+Calculates all the error statistics of the impact estimations y of the real impacts x, in one call (e.g., for all the combinations of monitor families and numbers of monitors).
+
+Input:
+	x: np.array (N) with the real impacts of N runs
+	y: np.array (K x N) with the estimations of K estimators for the N runs (or, (N) for a single estimator)
+	relative_error: (optional) IF TRUE, then use the relative error for the distance statistics
+
+Returns:
+	a dictionary with the statistics ('avg_dist', 'median_dist', 'mse', 'rmse', 'avg_ratio'); each value is a np.array (K) (or, a number for a single estimator)
+'''
+def impact_error_statistics(x,y,relative_error=True):
+	y = np.asarray(y)
+	x = np.broadcast_to(np.asarray(x), y.shape) if y.ndim > 1 else x
+	dist = impact_dist(x, y, relative_error=relative_error)
+	mse = impact_mse(x, y)
+	statistics = dict()
+	statistics['avg_dist'] = np.nanmean(dist, axis=-1)
+	statistics['median_dist'] = np.nanmedian(dist, axis=-1)
+	statistics['mse'] = np.nanmean(mse, axis=-1)
+	statistics['rmse'] = np.sqrt(statistics['mse'])
+	statistics['avg_ratio'] = np.nanmean(impact_ratio(x, y), axis=-1)
+	return statistics
 
 
 def apply_plot_formatting_impact(filename, legends, fontsize, axis=[0,1,0,1], relative_error=True):
@@ -153,72 +294,151 @@ def plot_class_boundaries_2D(model, feature_names=None, fontsize=20, axes=[0,1,0
 
 
 
-def load_per_monitor_data(filename, shuffle_data=True, max_monitors=None, hijack_type=0):
-	features_keys = ['real_impact', 'mon_impact', 'dVc', 'dHc', 'dV', 'dH', 'mon_closer_V', 'mon_closer_H', 'mon_equal_d', 'mon_impact_d0', 'mon_d1','mon_impact_d1','mon_closer_V-H']
-	npDATA = np.empty((0,len(features_keys)), dtype=float)
-	
+'''
+Parses the given file with per monitor data (one row per simulation; columns 7,8,... contain a tuple "(m,d,dV,dH)" per monitor) into flat NumPy arrays.
+
+IF use_cache is TRUE and a cache file (the name of the file plus the suffix ".npz") exists for the current version (size and modification time) of the file
+THEN 	load the arrays from the cache file (IF the cache file cannot be read, THEN parse the file, as below)
+ELSE 	parse the file, and (IF use_cache is TRUE) write the arrays to the cache file
+
+Input:
+	filename: the csv file
+	use_cache: (optional) IF TRUE, then use (read or write) the cache file
+
+Returns:
+	a dictionary with the np.arrays:
+		'rows': (R x 4) the columns 2,4,5,6 of each row
+		'offsets': (R+1) the monitors of row i are the entries offsets[i]:offsets[i+1] of the arrays 'monitors' and 'valid'
+		'monitors': (T x 4) the tuple (m,d,dV,dH) of each monitor
+		'valid': (T) FALSE for the monitors whose tuple could not be parsed
+'''
+def parse_per_monitor_data(filename, use_cache=False):
+	stat = os.stat(filename)
+	cache_file = filename+'.npz'
+	if use_cache and os.path.isfile(cache_file):
+		try:
+			with np.load(cache_file) as data:
+				if (data['source_size'] == stat.st_size) and (data['source_mtime'] == stat.st_mtime_ns):
+					return {k: data[k] for k in ['rows', 'offsets', 'monitors', 'valid']}
+		except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):	# a corrupt (e.g., empty or partially written) or old cache file: parse the file again
+			pass
+
+	rows = []
+	nb_monitors = [0]
+	MON_DATA = []
 	with open(filename, 'r') as f:
 		cr = csv.reader(f, delimiter=',');
 		for r in cr:
-			features_dict = dict()
-			real_impact = int(r[4])/int(r[2])	#
-			features_dict['real_impact'] = real_impact
-			nb_monitors_with_path = int(r[5])
-			nb_monitors_infected = int(r[6])
-			if (real_impact>1) or (real_impact<0) or (nb_monitors_with_path<=0) or (nb_monitors_infected<0) or (nb_monitors_infected>nb_monitors_with_path):
-				continue
-			
-			m = []
-			d = []
-			dV = []
-			dH = []
-			dd = []
-			nb_checked_monitors = 0
-			MON_DATA = r[7:]
-			if shuffle_data:
-				random.shuffle(MON_DATA)
-			for mon_data in MON_DATA:
-				try:
-					x = list([int(i) for i in mon_data[1:-1].split(',')])
-				except ValueError:
-					continue
-				if (len(x)>0) and (x[2]>0) and (x[3]>0): # monitor has path to victim's AND hijacker's prefixes
-					m.append( x[0])
-					d.append( x[1])
-					dV.append(x[2])
-					dH.append(x[3])
-					dd.append(x[2]-x[3])
-
-				nb_checked_monitors +=1
-				if (max_monitors is not None) and (nb_checked_monitors >= max_monitors):
-					break
-			if len(m) ==0: 
+			rows.append((int(r[2]), int(r[4]), int(r[5]), int(r[6])))
+			nb_monitors.append(len(r)-7)
+			MON_DATA.extend(r[7:])
+
+	monitors = np.zeros((len(MON_DATA),4), dtype=np.int64)
+	valid = np.ones(len(MON_DATA), dtype=bool)
+	try:	# all the tuples have 4 integers: parse them in one call
+		if (len(MON_DATA) > 0) and np.all(np.char.count(np.array(MON_DATA), ',') == 3):
+			monitors = np.array(','.join([mon_data[1:-1] for mon_data in MON_DATA]).split(',')).astype(np.int64).reshape(len(MON_DATA),4)
+		else:
+			raise ValueError
+	except ValueError:	# parse each tuple separately
+		for i, mon_data in enumerate(MON_DATA):
+			try:
+				x = list([int(v) for v in mon_data[1:-1].split(',')])
+			except ValueError:
+				valid[i] = False
 				continue
+			if len(x) >= 4:
+				monitors[i,:] = x[0:4]
+			else:
+				valid[i] = False
+
+	data = {'rows': np.array(rows, dtype=np.int64).reshape(len(rows),4), 'offsets': np.cumsum(nb_monitors), 'monitors': monitors, 'valid': valid}
+	if use_cache:
+		try:
+			np.savez(cache_file, source_size=stat.st_size, source_mtime=stat.st_mtime_ns, **data)
+		except OSError:
+			pass
+	return data
+
+
+
+'''
+Loads the per monitor data of the given file, and calculates the features of each simulation (i.e., each row) from the data of its monitors.
 
-			m,d,dV,dH,dd = map(lambda x: np.array(x),  [m,d,dV,dH,dd])
-			V_ind = np.where(m==0)
-			H_ind = np.where(m==1)
-			nb_monitors = len(m)
-			features_dict['mon_impact'] = 1.0*len(H_ind[0])/nb_monitors if nb_monitors>0 else np.nan	#
-			features_dict['dVc'] = np.mean(d[V_ind]) if len(V_ind[0])>0 else np.nan	#
-			features_dict['dHc'] = np.mean(d[H_ind]) if len(H_ind[0])>0 else np.nan		#
-			features_dict['dV'] = np.mean(dV)	#
-			features_dict['dH'] = np.mean(dH)	#
-			features_dict['mon_closer_V'] = 1.0*len(np.where(dd<-hijack_type)[0])/nb_monitors if nb_monitors>0 else np.nan	#
-			features_dict['mon_closer_H'] = 1.0*len(np.where(dd>-hijack_type)[0])/nb_monitors if nb_monitors>0 else np.nan	#
-			d0_ind = np.where(dd==-hijack_type)
-			features_dict['mon_equal_d']  = 1.0*len(d0_ind[0])/nb_monitors if nb_monitors>0 else np.nan	#
-			nb_mon_d0 = len(d0_ind[0])
-			features_dict['mon_impact_d0'] = 1.0*sum(m[d0_ind])/nb_mon_d0 if (nb_mon_d0 > 0) else np.nan	#
-			d1_ind = np.where(np.abs(dd+hijack_type)<=1)
-			nb_mon_d1 = len(d1_ind[0])
-			features_dict['mon_d1']  = 1.0*nb_mon_d1/nb_monitors if nb_monitors>0 else np.nan	#
-			features_dict['mon_impact_d1'] = 1.0*sum(m[d1_ind])/nb_mon_d1 if (nb_mon_d1 > 0) else np.nan	#
-			features_dict['mon_closer_V-H'] = features_dict['mon_closer_V'] - features_dict['mon_closer_H']	#
+The monitors of the rows are parsed in flat arrays (see "parse_per_monitor_data(...)"), and the features are calculated with vectorized (per row) group operations.
+The monitors of each (valid) row are shuffled with "random.shuffle" (i.e., the random number generator is used in the same way as shuffling the list of the monitors of the row).
 
-			npDATA = np.vstack((npDATA, np.array([features_dict[k] for k in features_keys])))
+Input:
+	filename: the csv file
+	shuffle_data: (optional) IF TRUE, then shuffle the monitors of each row (before selecting max_monitors of them)
+	max_monitors: (optional) consider only the first max_monitors (parsed) monitors of each row
+	hijack_type: (optional) the type of the hijacks
+	use_cache: (optional) IF TRUE, then cache the parsed arrays; see "parse_per_monitor_data(...)"
 
-	return npDATA
+Returns:
+	npDATA: np.array (nb_of_rows x 13) with the features (in the order of "features_keys") of each row
+'''
+def load_per_monitor_data(filename, shuffle_data=True, max_monitors=None, hijack_type=0, use_cache=False):
+	features_keys = ['real_impact', 'mon_impact', 'dVc', 'dHc', 'dV', 'dH', 'mon_closer_V', 'mon_closer_H', 'mon_equal_d', 'mon_impact_d0', 'mon_d1','mon_impact_d1','mon_closer_V-H']
+	data = parse_per_monitor_data(filename, use_cache=use_cache)
+	rows, offsets = data['rows'], data['offsets']
+
+	# rows with valid impact and number of monitors
+	with np.errstate(divide='ignore', invalid='ignore'):
+		real_impact = rows[:,1]/rows[:,0]
+	rows_ind = np.flatnonzero((rows[:,0]!=0) & (real_impact<=1) & (real_impact>=0) & (rows[:,2]>0) & (rows[:,3]>=0) & (rows[:,3]<=rows[:,2]))
+
+	# the monitors of the rows, in the order they are checked
+	starts, ends = offsets[rows_ind], offsets[rows_ind+1]
+	nb_monitors = ends-starts
+	if shuffle_data:
+		mon_ind = []
+		for start, n in zip(starts.tolist(), nb_monitors.tolist()):
+			perm = list(range(start,start+n))
+			random.shuffle(perm)
+			mon_ind.extend(perm)
+		mon_ind = np.array(mon_ind, dtype=np.int64)
+	else:
+		mon_ind = np.arange(nb_monitors.sum(), dtype=np.int64) - np.repeat(np.cumsum(nb_monitors)-nb_monitors-starts, nb_monitors)
+	group = np.repeat(np.arange(len(rows_ind)), nb_monitors)
+	valid = data['valid'][mon_ind]
+	x = data['monitors'][mon_ind]
+
+	# the checked monitors of each row (i.e., the first max_monitors parsed monitors) that have path to victim's AND hijacker's prefixes
+	selected = valid & (x[:,2]>0) & (x[:,3]>0)
+	if max_monitors is not None:
+		cum_valid = np.cumsum(valid)
+		first_cum_valid = np.concatenate(([0], cum_valid))[np.cumsum(nb_monitors)-nb_monitors]
+		selected &= (cum_valid - np.repeat(first_cum_valid, nb_monitors)) <= max_monitors
+	group, x = group[selected], x[selected]
+	m, d, dV, dH = x[:,0], x[:,1], x[:,2], x[:,3]
+	dd = dV-dH
+
+	K = len(rows_ind)
+	count = lambda mask: np.bincount(group[mask], minlength=K)
+	total = lambda values, mask=slice(None): np.bincount(group[mask], weights=values[mask], minlength=K)
+	nb_monitors = np.bincount(group, minlength=K)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		nb_V, nb_H = count(m==0), count(m==1)
+		d0, d1 = (dd==-hijack_type), (np.abs(dd+hijack_type)<=1)
+		nb_mon_d0, nb_mon_d1 = count(d0), count(d1)
+		features_dict = dict()
+		features_dict['real_impact'] = real_impact[rows_ind]
+		features_dict['mon_impact'] = 1.0*nb_H/nb_monitors
+		features_dict['dVc'] = np.where(nb_V>0, total(d, m==0)/nb_V, np.nan)
+		features_dict['dHc'] = np.where(nb_H>0, total(d, m==1)/nb_H, np.nan)
+		features_dict['dV'] = total(dV)/nb_monitors
+		features_dict['dH'] = total(dH)/nb_monitors
+		features_dict['mon_closer_V'] = 1.0*count(dd<-hijack_type)/nb_monitors
+		features_dict['mon_closer_H'] = 1.0*count(dd>-hijack_type)/nb_monitors
+		features_dict['mon_equal_d'] = 1.0*nb_mon_d0/nb_monitors
+		features_dict['mon_impact_d0'] = np.where(nb_mon_d0>0, total(m, d0)/nb_mon_d0, np.nan)
+		features_dict['mon_d1'] = 1.0*nb_mon_d1/nb_monitors
+		features_dict['mon_impact_d1'] = np.where(nb_mon_d1>0, total(m, d1)/nb_mon_d1, np.nan)
+		features_dict['mon_closer_V-H'] = features_dict['mon_closer_V'] - features_dict['mon_closer_H']
+
+	npDATA = np.column_stack([features_dict[k] for k in features_keys]).astype(float).reshape(K,len(features_keys))
+	return npDATA[nb_monitors>0]
 
 
 
@@ -270,19 +490,8 @@ def get_impact_dict_from_data(data, max_monitors=None):
 
 
 def get_customer_cone_size(Topo, list_of_ASes):
-	customer_cone_sizes = []
-	for AS in list_of_ASes:
-		current_customer_cone = set()
-		ASes_to_check = set([AS])
-		checked_ASes = set()
-		while len(ASes_to_check)>0:
-			next_AS_to_check = ASes_to_check.pop()
-			checked_ASes.add(next_AS_to_check)
-			if Topo.has_node(next_AS_to_check):
-				current_customers = Topo.get_node(next_AS_to_check).get_neighbors()['customers']
-				ASes_to_check.update(set(current_customers)-checked_ASes)
-		customer_cone_sizes.append(len(checked_ASes))
-	return customer_cone_sizes
+	# the cones of all ASes are computed (once) and cached by the topology; see the method "get_customer_cones()" of the BGPtopology class
+	return Topo.get_customer_cone_sizes(list_of_ASes)
 
 
 def get_tier_type(Topo, list_of_ASes):
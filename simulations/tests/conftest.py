@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import os
+import random
+import sys
+import pytest
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','BGP_simulator'))
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','benchmarks'))
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','examples'))
+from BGPtopology import BGPtopology
+import synthetic_topology
+
+NB_OF_ASES = 300
+
+
+'''
+Returns the links of a small synthetic AS-graph (see the function "generate_topology(...)" of the benchmarks), which is shared by the tests.
+'''
+@pytest.fixture(scope='session')
+def links():
+	return synthetic_topology.generate_topology(NB_OF_ASES,nb_of_IXPs=5,IXP_size=15,seed=1)
+
+
+'''
+Returns a function that creates a topology from the synthetic AS-graph, with the preferences set from the given seed.
+'''
+@pytest.fixture
+def make_topology(links):
+	def make(fast_converge=False,preference_seed=0):
+		Topo = BGPtopology(fast_converge=fast_converge)
+		Topo.add_links(*zip(*links))
+		Topo.set_preferences(preference_seed)
+		return Topo
+	return make
+
+
+'''
+Returns a random number generator for the selection of victims and hijackers.
+'''
+@pytest.fixture
+def rng():
+	return random.Random(7)
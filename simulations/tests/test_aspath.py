@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import pytest
+from ASpath import ASpath
+
+PATHS = [[7], [3,7], [5,3,7], [1,2,3,4,5,6]]
+
+
+@pytest.mark.parametrize('path', PATHS)
+def test_aspath_behaves_as_a_list(path):
+	aspath = ASpath.from_list(path)
+	assert len(aspath) == len(path)
+	assert list(aspath) == path and aspath.tolist() == path
+	assert [aspath[i] for i in range(-len(path),len(path))] == [path[i] for i in range(-len(path),len(path))]
+	assert (aspath[1:] == path[1:]) and (aspath[::-1] == path[::-1]) and (aspath[:-1] == path[:-1])
+	for i in [len(path), -len(path)-1]:
+		with pytest.raises(IndexError):
+			aspath[i]
+	assert all((ASN in aspath) and (aspath.index(ASN) == path.index(ASN)) for ASN in path)
+	assert (0 not in aspath) and (8 not in aspath)
+	with pytest.raises(ValueError):
+		aspath.index(0)
+	assert aspath.origin == path[-1]
+	assert repr(aspath) == repr(path)
+	assert (aspath + [0] == path + [0]) and ([0] + aspath == [0] + path)
+
+
+@pytest.mark.parametrize('path', PATHS)
+def test_aspath_equality(path):
+	aspath = ASpath.from_list(path)
+	assert (aspath == path) and (path == aspath) and not (aspath != path)
+	assert aspath == ASpath.from_list(list(path))
+	assert (aspath != path+[0]) and (aspath != [0]+path) and (aspath != path[:-1]) and (aspath != [])
+	assert aspath != ASpath(0,aspath)
+	if len(path) > 1:
+		other = list(path)
+		other[1] = 0
+		assert (aspath != other) and (aspath != ASpath.from_list(other))
+	assert (aspath != tuple(path)) and (aspath != None)	# (only lists and ASpaths are equal to an ASpath)
+	with pytest.raises(TypeError):
+		hash(aspath)
+
+
+def test_aspaths_share_their_suffixes():
+	origin = ASpath(7)
+	path = ASpath(3,origin)
+	announced = [ASpath(ASN,path) for ASN in [1,2]]	# the paths announced to (and stored by) the neighbors
+	assert (announced[0].tail is path) and (announced[1].tail is path)
+	assert (announced[0] == [1,3,7]) and (announced[1] == [2,3,7])
+	assert (announced[0][1:] == announced[1][1:]) and (announced[0] != announced[1])
+	assert ASpath(5,announced[0]) == [5,1,3,7] and len(ASpath(5,announced[0])) == 4
+	assert ASpath(5,[1,3,7]) == ASpath(5,announced[0])	# (a tail given as a list is converted to an ASpath)
+	assert all(aspath.origin == 7 for aspath in announced)
+	assert ASpath.from_list(path) is path
+	assert ASpath.from_list([]) is None
+	assert path.tolist() == [3,7]	# (the shared suffix is not changed)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import util_functions
+from BGPtopology import BGPtopology
+
+
+'''
+Returns the customer cone of the given AS with a BFS over the provider->customer links, as the (previous) function "get_customer_cone_size(...)" of the util_functions.
+'''
+def get_customer_cone_by_BFS(Topo, AS):
+	ASes_to_check = set([AS])
+	checked_ASes = set()
+	while len(ASes_to_check)>0:
+		next_AS_to_check = ASes_to_check.pop()
+		checked_ASes.add(next_AS_to_check)
+		if Topo.has_node(next_AS_to_check):
+			current_customers = Topo.get_node(next_AS_to_check).get_neighbors()['customers']
+			ASes_to_check.update(set(current_customers)-checked_ASes)
+	return checked_ASes
+
+
+'''
+Checks that the customer cones of the topology (sizes, sets and membership) are the ones found with a BFS, for all nodes and for the given nodes that do not exist in the topology.
+'''
+def check_customer_cones(Topo, rng, missing_ASNs=(-1,)):
+	ASNs = sorted(Topo.get_all_nodes_ASNs())
+	cones = {ASN:get_customer_cone_by_BFS(Topo,ASN) for ASN in ASNs}
+	assert util_functions.get_customer_cone_size(Topo,ASNs+list(missing_ASNs)) == [len(cones[ASN]) for ASN in ASNs]+[1 for ASN in missing_ASNs]
+	for ASN in ASNs:
+		assert Topo.get_customer_cone(ASN) == cones[ASN]
+	for ASN in missing_ASNs:
+		assert Topo.get_customer_cone(ASN) == set()
+		assert not Topo.is_in_customer_cone(ASN,ASNs[0]) and not Topo.is_in_customer_cone(ASNs[0],ASN)
+	for ASN in rng.sample(ASNs,min(len(ASNs),40)):
+		for customer_ASN in ASNs:
+			assert Topo.is_in_customer_cone(ASN,customer_ASN) == (customer_ASN in cones[ASN])
+
+
+def test_customer_cones_match_the_BFS(make_topology, rng):
+	check_customer_cones(make_topology(),rng)
+
+
+def test_customer_cones_with_provider_cycles(rng):
+	Topo = BGPtopology()
+	for provider,customer in [(1,2), (2,3), (3,1), (3,4), (5,1), (4,6), (6,7), (7,11), (11,6), (8,7), (9,10)]:	# cycles 1->2->3->1 and 6->7->11->6
+		Topo.add_link(provider,customer,-1)
+	Topo.add_link(5,8,0)
+	check_customer_cones(Topo,rng)
+	assert Topo.get_customer_cone(2) == {1,2,3,4,6,7,11}
+	assert Topo.get_customer_cone_sizes([5,8,6,10]) == [8,4,3,1]
+
+
+def test_customer_cones_with_provider_cycles_in_a_large_topology(make_topology, rng):
+	Topo = make_topology()
+	ASNs = sorted(Topo.get_all_nodes_ASNs())
+	nb_of_links = 0
+	while nb_of_links < 20:	# provider->customer links from nodes to nodes of their cones (i.e., cycles)
+		ASN = rng.choice(ASNs)
+		cone = sorted(get_customer_cone_by_BFS(Topo,ASN) - {ASN})
+		if cone:
+			customer_ASN = rng.choice(cone)
+			if not Topo.has_link(ASN,customer_ASN):
+				Topo.add_link(customer_ASN,ASN,-1)
+				nb_of_links += 1
+	check_customer_cones(Topo,rng)
+
+
+def test_customer_cones_are_recomputed_after_a_change(make_topology, rng):
+	Topo = make_topology()
+	check_customer_cones(Topo,rng)
+	ASNs = sorted(Topo.get_all_nodes_ASNs())
+	sizes = Topo.get_customer_cone_sizes(ASNs)
+	largest = max(ASNs,key=lambda ASN: (len(Topo.get_customer_cone(ASN)),ASN))
+	stub = min([ASN for ASN in ASNs if (ASN != largest) and not Topo.has_link(ASN,largest)],key=lambda ASN: (len(Topo.get_customer_cone(ASN)),ASN))
+	cone = Topo.get_customer_cone(largest)
+	Topo.add_link(stub,largest,-1)	# the stub becomes a provider of the node with the largest cone (i.e., a cycle, if the stub is in the cone)
+	assert Topo.get_customer_cone(stub) == cone | {stub}
+	check_customer_cones(Topo,rng)
+	Topo.remove_link(stub,largest)
+	assert Topo.get_customer_cone_sizes(ASNs) == sizes
+	Topo.add_link(10**6,stub,-1)	# a new node
+	assert Topo.get_customer_cone_sizes([10**6]) == [2]
+	check_customer_cones(Topo,rng)
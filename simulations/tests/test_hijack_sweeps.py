@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import random
+import pytest
+
+HIJACK_TYPES = [0,1,2,3]
+
+
+'''
+Returns the number of nodes with a path to the hijacker, after the victim announces a prefix and the hijacker hijacks it (in the fast converge mode).
+'''
+def simulate_hijack(Topo, victim, hijacker, hijack_type):
+	Topo.add_prefix(victim,'simulated')
+	Topo.do_hijack(hijacker,'simulated',hijack_type)
+	impact = Topo.get_nb_of_nodes_with_hijacked_path_to_prefix('simulated',hijacker)
+	Topo.drop_prefix('simulated')
+	return impact
+
+
+@pytest.mark.parametrize('nb_of_processes', [1,2])
+def test_hijacker_sweep_keeps_the_routing_state(make_topology, rng, nb_of_processes):
+	Topo = make_topology(fast_converge=True)
+	ASNs = sorted(Topo.get_all_nodes_ASNs())
+	Topo.add_prefix(ASNs[0],'kept')
+	nb_of_nodes_with_path = Topo.get_nb_of_nodes_with_path_to_prefix('kept')
+	random.seed(5)
+	expected = random.random()
+	random.seed(5)
+	Topo.get_hijack_impact_per_hijacker(ASNs[1],rng.sample(ASNs,20),batch_size=8,nb_of_processes=nb_of_processes)
+	assert random.random() == expected
+	assert nb_of_nodes_with_path == len(ASNs)-1	# all nodes apart from the origin
+	assert Topo.get_nb_of_nodes_with_path_to_prefix('kept') == nb_of_nodes_with_path
+
+
+def test_hijacker_sweep_matches_do_hijack(make_topology, rng):
+	Topo = make_topology(fast_converge=True)
+	ASNs = sorted(Topo.get_all_nodes_ASNs())
+	victim = rng.choice(ASNs)
+	hijackers = rng.sample([ASN for ASN in ASNs if ASN != victim],15)
+	table = Topo.get_hijack_impact_per_hijacker(victim,hijackers,hijack_types=HIJACK_TYPES,batch_size=4)
+	assert len(table) == len(hijackers)*len(HIJACK_TYPES)
+	assert [row[2] for row in table] == sorted([row[2] for row in table],reverse=True)
+	for hijacker,hijack_type,nb_of_infected_nodes,fraction in table:
+		assert nb_of_infected_nodes == simulate_hijack(Topo,victim,hijacker,hijack_type)
+		assert fraction == nb_of_infected_nodes/len(ASNs)
+
+
+def test_impact_matrix_keeps_the_routing_state_and_matches_do_hijack(make_topology, rng, tmp_path):
+	Topo = make_topology(fast_converge=True)
+	ASNs = sorted(Topo.get_all_nodes_ASNs())
+	Topo.add_prefix(ASNs[0],'kept')
+	nb_of_nodes_with_path = Topo.get_nb_of_nodes_with_path_to_prefix('kept')
+	victims = rng.sample(ASNs,12)
+	hijackers = rng.sample(ASNs,5) + victims[:1]
+	filename = str(tmp_path/'impact.npy')
+	data = Topo.write_hijack_impact_matrix(filename,hijackers,list_of_victims=victims,hijack_type=1,batch_size=7,victims_per_batch=5,nb_of_processes=2)
+	assert Topo.get_nb_of_nodes_with_path_to_prefix('kept') == nb_of_nodes_with_path
+	assert data['impact'].shape == (len(victims),len(hijackers))
+	assert data['victims'].tolist() == victims and data['hijackers'].tolist() == hijackers
+	for i,victim in enumerate(victims):
+		for j,hijacker in enumerate(hijackers):
+			expected = -1 if victim == hijacker else simulate_hijack(Topo,victim,hijacker,1)
+			assert data['impact'][i,j] == expected
+	loaded = Topo.load_hijack_impact_matrix(filename)
+	assert (loaded['impact'][:] == data['impact'][:]).all()
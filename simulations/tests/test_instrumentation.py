@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+from PropagationStats import PropagationStats
+
+
+def test_reentrant_calls_are_counted(make_topology, rng):
+	Topo = make_topology()
+	victim, hijacker = rng.sample(sorted(Topo.get_all_nodes_ASNs()),2)
+	stats = Topo.enable_instrumentation()
+	Topo.add_prefix(victim,'p')
+	Topo.do_hijack(hijacker,'p',0)
+	assert stats.reentrant_calls > 0	# the receiving nodes export their new best paths during the delivery of the messages
+	assert stats.reentrant_calls <= stats.announcements_received + stats.withdrawals_received
+	assert len(stats.get_csv_row()) == len(PropagationStats.get_csv_header())
+	assert 'reentrant_calls' in PropagationStats.get_csv_header()
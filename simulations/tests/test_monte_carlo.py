@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import numpy as np
+from BGPtopology import BGPtopology
+from PropagationStats import PropagationStats
+
+
+def test_wilson_interval_contains_the_probability():
+	successes = np.arange(0,51)
+	low, high = BGPtopology.get_wilson_interval(successes,50,1.96)
+	p = successes/50
+	assert ((0 <= low) & (low <= p) & (p <= high) & (high <= 1)).all()
+	assert (low[0] == 0) and (high[-1] == 1)
+
+
+def test_monte_carlo_time_is_in_the_instrumentation_row(make_topology, rng):
+	Topo = make_topology(fast_converge=True)
+	victim, hijacker = rng.sample(sorted(Topo.get_all_nodes_ASNs()),2)
+	stats = Topo.enable_instrumentation()
+	Topo.get_hijack_infection_probabilities(victim,hijacker,nb_of_draws=4)
+	row = dict(zip(PropagationStats.get_csv_header(),stats.get_csv_row()))
+	assert row['time_monte_carlo'] > 0
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+from BGPtopology import BGPtopology
+
+
+'''
+Returns the preferences of all nodes for their neighbors, as a dictionary with (i) keys the ASNs and (ii) values the "ASneighbors_preference" dictionaries.
+'''
+def get_preferences(Topo):
+	return {ASN:Topo.get_node(ASN).ASneighbors_preference for ASN in Topo.get_all_nodes_ASNs()}
+
+
+'''
+Returns a topology with the given links, and the preferences set from the given seed.
+'''
+def make_topology_from_links(links, seed):
+	Topo = BGPtopology()
+	Topo.add_links(*zip(*links))
+	Topo.set_preferences(seed)
+	return Topo
+
+
+def test_preferences_do_not_depend_on_the_order_of_the_links(links, rng):
+	shuffled_links = list(links)
+	rng.shuffle(shuffled_links)
+	for seed in [0, 3]:
+		preferences = get_preferences(make_topology_from_links(links,seed))
+		assert get_preferences(make_topology_from_links(shuffled_links,seed)) == preferences
+		assert all(len(set(node_preferences.values())) == len(node_preferences) for node_preferences in preferences.values())	# (no ties)
+	assert get_preferences(make_topology_from_links(links,0)) != get_preferences(make_topology_from_links(links,3))
+
+
+def test_preferences_are_set_when_the_nodes_are_used(make_topology):
+	Topo = make_topology(preference_seed=0)
+	preferences = get_preferences(Topo)
+	Topo.set_preferences(5)
+	assert all(node.ASneighbors_preference == preferences[ASN] for ASN,node in Topo.list_of_all_BGP_nodes.items())	# (not set yet)
+	assert get_preferences(Topo) == get_preferences(make_topology(preference_seed=5))
+	Topo.set_preferences(0)
+	assert get_preferences(Topo) == preferences
+
+
+def test_seeded_preferences_after_adding_and_removing_links(links, rng):
+	seed = 4
+	Topo = make_topology_from_links(links,seed)
+	removed_links = rng.sample(links,5)
+	for ASN1,ASN2,peering_type in removed_links:
+		Topo.remove_link(ASN1,ASN2)
+	added_links = [(ASN1,ASN2,0) for ASN1,ASN2 in zip(rng.sample(Topo.get_all_nodes_ASNs(),5),[10**6+i for i in range(5)])]	# (links to new nodes)
+	for ASN1,ASN2,peering_type in added_links:
+		Topo.add_link(ASN1,ASN2,peering_type)
+	assert Topo.preference_seed == seed
+	assert get_preferences(Topo) == get_preferences(make_topology_from_links([link for link in links if link not in removed_links]+added_links,seed))
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import pytest
+
+from ResultWriter import ResultWriter
+
+
+def test_resume_with_run_ids_that_contain_commas(tmp_path):
+	filename = str(tmp_path/'results.csv')
+	with ResultWriter(filename) as writer:
+		writer.write((0,64),11,[1,2])
+		writer.write('a,b',12,[3,4])
+	with ResultWriter(filename) as writer:
+		assert writer.is_done((0,64)) and writer.is_done('a,b') and (not writer.is_done((1,0)))
+		assert writer.done_runs == {'(0, 64)': 11, 'a,b': 12}
+		writer.write((1,0),13,[5,6])
+	with open(filename) as f:
+		assert f.read().splitlines() == ['1,2','3,4','5,6']
+
+
+def test_resume_only_with_the_same_parameters(tmp_path):
+	filename = str(tmp_path/'results.csv')
+	with ResultWriter(filename, parameters={'base_seed': 0, 'columns': ['a','b']}) as writer:
+		writer.write(0,11,[1,2])
+	with pytest.raises(ValueError):
+		ResultWriter(filename, parameters={'base_seed': 1, 'columns': ['a','b']})
+	with ResultWriter(filename, parameters={'base_seed': 0, 'columns': ['a','b']}) as writer:
+		assert writer.done_runs == {'0': 11}
+	with ResultWriter(filename, parameters={'base_seed': 1, 'columns': ['a','b']}, resume=False) as writer:
+		assert writer.done_runs == {}
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import pytest
+import numpy as np
+
+HIJACK_TYPES = [0,1,2,3]
+NB_OF_RUNS = 8
+
+
+'''
+Returns the (non empty) paths of all nodes for the given prefix, as a dictionary with (i) keys the ASNs and (ii) values the paths (as lists).
+'''
+def get_paths(Topo, IPprefix):
+	paths = {}
+	for ASN in Topo.get_all_nodes_ASNs():
+		path = Topo.get_node(ASN).paths.get(IPprefix)
+		if path:
+			paths[ASN] = list(path)
+	return paths
+
+
+'''
+Returns the stored paths (i.e., "all_paths") of all nodes for the given prefix, as a dictionary with (i) keys the ASNs and (ii) values dictionaries {neighbor ASN: path (as a list)}.
+'''
+def get_all_paths(Topo, IPprefix):
+	all_paths = {}
+	for ASN in Topo.get_all_nodes_ASNs():
+		stored_paths = Topo.get_node(ASN).all_paths.get(IPprefix)
+		if stored_paths:
+			all_paths[ASN] = {neighbor:list(path) for neighbor,path in stored_paths.items()}
+	return all_paths
+
+
+'''
+Returns NB_OF_RUNS random (victim, hijacker) pairs.
+'''
+def get_victims_and_hijackers(Topo, rng):
+	ASNs = sorted(Topo.get_all_nodes_ASNs())
+	return [tuple(rng.sample(ASNs,2)) for run in range(NB_OF_RUNS)]
+
+
+@pytest.mark.parametrize('hijack_type', HIJACK_TYPES)
+def test_fast_converge_matches_message_passing(make_topology, rng, hijack_type):
+	message_passing, fast_converge = make_topology(), make_topology(fast_converge=True)
+	for run,(victim,hijacker) in enumerate(get_victims_and_hijackers(message_passing,rng)):
+		for Topo in (message_passing,fast_converge):
+			Topo.add_prefix(victim,run)
+		assert get_paths(fast_converge,run) == get_paths(message_passing,run)
+		for Topo in (message_passing,fast_converge):
+			Topo.do_hijack(hijacker,run,hijack_type)
+		assert get_paths(fast_converge,run) == get_paths(message_passing,run)
+		assert fast_converge.get_nb_of_nodes_with_hijacked_path_to_prefix(run,hijacker) == message_passing.get_nb_of_nodes_with_hijacked_path_to_prefix(run,hijacker)
+
+
+def test_filtered_prefixes_use_message_passing(make_topology, rng):
+	message_passing, fast_converge = make_topology(), make_topology(fast_converge=True)
+	(victim,hijacker), = get_victims_and_hijackers(message_passing,rng)[:1]
+	filtering_nodes = rng.sample(sorted(set(message_passing.get_all_nodes_ASNs())-{victim,hijacker}),30)
+	for Topo in (message_passing,fast_converge):
+		Topo.add_prefix(victim,'p')
+		for ASN in filtering_nodes:
+			Topo.get_node(ASN).filter_path('p',hijacker)
+		Topo.do_hijack(hijacker,'p',0)
+	assert not fast_converge.can_fast_converge('p')
+	assert get_paths(fast_converge,'p') == get_paths(message_passing,'p')
+	snapshot = fast_converge.snapshot_prefix('p')
+	fast_converge.drop_prefix('p')
+	assert fast_converge.can_fast_converge('p')
+	fast_converge.restore_prefix(snapshot,'q')
+	assert fast_converge.can_fast_converge('p') and (not fast_converge.can_fast_converge('q'))
+	fast_converge.clear_routing_information([ASN for ASN in filtering_nodes[:10]])
+	assert not fast_converge.can_fast_converge('q')
+	fast_converge.clear_routing_information(filtering_nodes)
+	assert fast_converge.can_fast_converge('q')
+	fast_converge.restore_prefix(snapshot,'q')
+	fast_converge.clear_routing_information()
+	assert fast_converge.can_fast_converge('q')
+
+
+@pytest.mark.parametrize('fast_converge', [False,True])
+def test_cleared_topology_matches_a_new_topology(make_topology, rng, fast_converge):
+	Topo = make_topology(fast_converge=fast_converge)
+	for run,(victim,hijacker) in enumerate(get_victims_and_hijackers(Topo,rng)):
+		Topo.add_prefix(victim,'p')
+		Topo.do_hijack(hijacker,'p',run % 3)
+		Topo.get_node(victim).filter_path('p',hijacker)
+		Topo.clear_routing_information()
+		assert Topo.get_nb_of_nodes_with_path_to_prefix('p') == 0
+		assert Topo.get_list_of_prefixes() == {} and Topo.get_list_of_hijacked_prefixes() == {}
+		assert Topo.snapshot_prefix('p')['paths'] == {}
+		assert sum(node.routing_epoch == Topo.routing_epoch for node in Topo.list_of_all_BGP_nodes.values()) == 0	# (the queries do not clear the stale routing tables)
+		reference = make_topology(fast_converge=fast_converge)
+		for T in (Topo,reference):
+			T.add_prefix(hijacker,'p')
+			T.do_hijack(victim,'p',1)
+		assert get_paths(Topo,'p') == get_paths(reference,'p')
+		assert get_all_paths(Topo,'p') == get_all_paths(reference,'p')
+		Topo.clear_routing_information()
+
+
+def test_add_prefixes_matches_add_prefix(make_topology, rng):
+	batched, single = make_topology(), make_topology(fast_converge=True)
+	ASNs = sorted(batched.get_all_nodes_ASNs())
+	origins_and_prefixes = [(rng.choice(ASNs),prefix) for prefix in range(20)]
+	batched.add_prefixes(origins_and_prefixes,batch_size=6)
+	for ASN,IPprefix in origins_and_prefixes:
+		single.add_prefix(ASN,IPprefix)
+	for ASN,IPprefix in origins_and_prefixes:
+		assert get_paths(batched,IPprefix) == get_paths(single,IPprefix)
+		assert get_all_paths(batched,IPprefix) == get_all_paths(single,IPprefix)
+
+
+@pytest.mark.parametrize('fast_converge', [False,True])
+def test_snapshot_and_restore_round_trip(make_topology, rng, fast_converge):
+	Topo = make_topology(fast_converge=fast_converge)
+	(victim,hijacker), = rng.sample(get_victims_and_hijackers(Topo,rng),1)
+	Topo.add_prefix(victim,'p')
+	snapshot = Topo.snapshot_prefix('p')
+	legitimate_paths, legitimate_all_paths = get_paths(Topo,'p'), get_all_paths(Topo,'p')
+	Topo.do_hijack(hijacker,'p',1)
+	hijacked_paths = get_paths(Topo,'p')
+	assert hijacked_paths != legitimate_paths
+	Topo.restore_prefix(snapshot,'p')
+	assert get_paths(Topo,'p') == legitimate_paths
+	assert get_all_paths(Topo,'p') == legitimate_all_paths
+	Topo.do_hijack(hijacker,'p',1)
+	assert get_paths(Topo,'p') == hijacked_paths
+	Topo.restore_prefix(snapshot,'q')
+	assert get_paths(Topo,'q') == legitimate_paths
+
+
+@pytest.mark.parametrize('fast_converge', [False,True])
+def test_withdraw_prefix_matches_a_fresh_announcement(make_topology, rng, fast_converge):
+	Topo, reference = make_topology(fast_converge=fast_converge), make_topology(fast_converge=True)
+	for run,(victim,hijacker) in enumerate(get_victims_and_hijackers(Topo,rng)):
+		Topo.add_prefix(victim,run)
+		Topo.do_hijack(hijacker,run,0)
+		if run % 2:
+			Topo.withdraw_prefix(hijacker,run)
+			reference.add_prefix(victim,run)
+		else:
+			Topo.withdraw_prefix(victim,run)
+			reference.add_prefix(hijacker,run)
+		assert get_paths(Topo,run) == get_paths(reference,run)
+		Topo.withdraw_prefix(victim,run)
+		Topo.withdraw_prefix(hijacker,run)
+		assert get_paths(Topo,run) == {}
+		assert get_all_paths(Topo,run) == {}
+
+
+def test_path_length_matrix_matches_the_paths(make_topology, rng):
+	Topo = make_topology()
+	ASNs = sorted(Topo.get_all_nodes_ASNs())
+	origins, nodes = rng.sample(ASNs,6), rng.sample(ASNs,50)
+	path_lengths = Topo.get_path_length_matrix(origins,nodes,batch_size=4)
+	for i,origin in enumerate(origins):
+		Topo.add_prefix(origin,i)
+		for j,ASN in enumerate(nodes):
+			path = Topo.get_node(ASN).paths.get(i)
+			assert path_lengths[i,j] == (len(path) if path is not None else -1)
+	assert (Topo.get_path_length_matrix(origins[::-1],nodes) == path_lengths[::-1]).all()
+
+
+@pytest.mark.parametrize('hijack_type', [0,2])
+def test_preference_draws_match_set_preferences(make_topology, rng, hijack_type):
+	Topo = make_topology(fast_converge=True)
+	victim, hijacker = get_victims_and_hijackers(Topo,rng)[0]
+	nb_of_draws, seed = 6, 11
+	results = Topo.get_hijack_infection_probabilities(victim,hijacker,hijack_type,nb_of_draws=nb_of_draws,seed=seed,batch_size=4)
+	ids = {ASN:i for i,ASN in enumerate(results['ASNs'].tolist())}
+	nb_of_infections = np.zeros(len(ids))
+	for k in range(nb_of_draws):
+		Topo.set_preferences(seed+k)
+		Topo.add_prefix(victim,k)
+		Topo.do_hijack(hijacker,k,hijack_type)
+		infected = Topo.get_set_of_nodes_with_hijacked_path_to_prefix(k,hijacker)
+		assert len(infected) == results['impact'][k]
+		nb_of_infections[[ids[ASN] for ASN in infected]] += 1
+	assert (nb_of_infections/nb_of_draws == results['probability']).all()
+	assert ((results['ci_low'] <= results['probability']) & (results['probability'] <= results['ci_high'])).all()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import random
+import SimulationRunner as simulation_runner
+from SimulationRunner import SimulationRunner
+
+
+'''
+A run that announces a prefix from a random node, and returns the number of nodes with a path and a number from the global random number generator.
+'''
+def announce_random_prefix(Topo, run_id, rng):
+	origin = rng.choice(sorted(Topo.get_all_nodes_ASNs()))
+	Topo.add_prefix(origin,run_id)
+	return [Topo.get_nb_of_nodes_with_path_to_prefix(run_id), random.random()]
+
+
+def test_results_do_not_depend_on_the_number_of_processes(make_topology):
+	Topo = make_topology()
+	serial = list(SimulationRunner(Topo,announce_random_prefix,nb_of_processes=1).run(range(6)))
+	parallel = list(SimulationRunner(Topo,announce_random_prefix,nb_of_processes=2).run(range(6)))
+	assert serial == parallel
+
+
+def test_serial_runs_restore_the_global_random_state(make_topology):
+	Topo = make_topology()
+	random.seed(123)
+	expected = random.random()
+	random.seed(123)
+	list(SimulationRunner(Topo,announce_random_prefix,nb_of_processes=1).run(range(3)))
+	assert random.random() == expected
+
+
+def test_routing_information_is_kept_without_clear_after_run(make_topology):
+	Topo = make_topology()
+	list(SimulationRunner(Topo,announce_random_prefix,nb_of_processes=1,clear_after_run=False).run(['a','b']))
+	assert (Topo.get_nb_of_nodes_with_path_to_prefix('a') > 0) and (Topo.get_nb_of_nodes_with_path_to_prefix('b') > 0)
+	list(SimulationRunner(Topo,announce_random_prefix,nb_of_processes=1).run(['c']))
+	assert [Topo.get_nb_of_nodes_with_path_to_prefix(prefix) for prefix in ['a','b','c']] == [0,0,0]
+
+
+def test_nested_runners_do_not_overwrite_the_shared_runner(make_topology):
+	Topo = make_topology()
+	def nested_run(Topo, run_id, rng):
+		inner = SimulationRunner(Topo,lambda Topo,run_id,rng: run_id,nb_of_processes=2,clear_after_run=False,seed_random=False)
+		return [result for run_id,seed,result in inner.run(range(3))]
+	results = list(SimulationRunner(Topo,nested_run,nb_of_processes=1).run(range(2)))
+	assert [result for run_id,seed,result in results] == [[0,1,2],[0,1,2]]
+	assert simulation_runner._shared_runner is None
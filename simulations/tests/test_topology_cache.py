@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import bz2
+import gzip
+import os
+import numpy as np
+from BGPtopology import BGPtopology
+
+LINKS = '# AS-relationships\n1|2|-1|bgp\n1|3|0|bgp\n3|4|-1|bgp\n'
+OTHER_LINKS = '# AS-relationships\n1|2|-1|bgp\n1|3|0|bgp\n3|5|-1|bgp\n'	# (same size as LINKS)
+
+
+'''
+Writes the given text to the given file, and sets its modification time (in ns) if given.
+'''
+def write_file(filename, text, mtime_ns=None):
+	with open(filename,'w') as f:
+		f.write(text)
+	if mtime_ns is not None:
+		os.utime(filename,ns=(mtime_ns,mtime_ns))
+
+
+def test_cache_hit(tmp_path):
+	filename = str(tmp_path/'rel.txt')
+	write_file(filename,LINKS)
+	assert BGPtopology().read_links_from_csv(filename) == ([1,1,3],[2,3,4],[-1,0,-1])
+	assert os.path.isfile(filename+'.npz')
+	write_file(filename,OTHER_LINKS,os.stat(filename).st_mtime_ns)	# same size and modification time: the cache file is used
+	assert BGPtopology().read_links_from_csv(filename) == ([1,1,3],[2,3,4],[-1,0,-1])
+	assert BGPtopology().read_links_from_csv(filename,use_cache=False) == ([1,1,3],[2,3,5],[-1,0,-1])
+	assert BGPtopology().read_links_from_csv(filename,asn_as_str=True) == (['1','1','3'],['2','3','5'],[-1,0,-1])	# (the cache file is for integer ASNs)
+
+
+def test_stale_cache(tmp_path):
+	filename = str(tmp_path/'rel.txt')
+	write_file(filename,LINKS)
+	mtime_ns = os.stat(filename).st_mtime_ns
+	BGPtopology().read_links_from_csv(filename)
+	write_file(filename,OTHER_LINKS,mtime_ns+10**9)	# same size, other modification time
+	assert BGPtopology().read_links_from_csv(filename) == ([1,1,3],[2,3,5],[-1,0,-1])
+	write_file(filename,LINKS+'4|6|-1|bgp\n',mtime_ns+10**9)	# other size, same modification time
+	assert BGPtopology().read_links_from_csv(filename) == ([1,1,3,4],[2,3,4,6],[-1,0,-1,-1])
+
+
+def test_corrupt_cache(tmp_path):
+	filename = str(tmp_path/'rel.txt')
+	write_file(filename,LINKS)
+	for cache in [b'not a cache file', b'PK\x03\x04truncated', b'']:
+		with open(filename+'.npz','wb') as f:
+			f.write(cache)
+		Topo = BGPtopology()
+		Topo.load_topology_from_csv(filename)
+		assert sorted(Topo.get_all_nodes_ASNs()) == [1,2,3,4]
+		with np.load(filename+'.npz') as data:	# the cache file is written again
+			assert data['ASN2'].tolist() == [2,3,4]
+
+
+def test_compressed_files(tmp_path):
+	for suffix,open_file in [('.gz',gzip.open), ('.bz2',bz2.open)]:
+		filename = str(tmp_path/('rel.txt'+suffix))
+		with open_file(filename,'wt') as f:
+			f.write(LINKS)
+		for use_cache in [False, True, True]:	# (the second load with the cache reads the cache file)
+			Topo = BGPtopology()
+			Topo.load_topology_from_csv(filename,use_cache=use_cache)
+			assert Topo.get_node(1).ASneighbors == {2: -1, 3: 0}
+			assert Topo.get_node(4).ASneighbors == {3: 1}
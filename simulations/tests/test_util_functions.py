@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+#
+#
+# Author: Pavlos Sermpezis
+# Institute of Computer Science, Foundation for Research and Technology - Hellas (FORTH), Greece
+#
+# E-mail: sermpezis@ics.forth.gr
+#
+#
+# This file is part of the BGPsimulator
+#
+
+import numpy as np
+import pytest
+import util_functions
+from util_functions import parse_per_monitor_data
+
+NB_OF_RUNS = 300
+NB_OF_ESTIMATORS = 6
+POINTS = np.linspace(-0.1,1.5,33)
+
+
+# the (previous) per element implementations of the impact error metrics and the ECDF of the util_functions
+
+def baseline_impact_dist(x,y,relative_error=True):
+	if relative_error:
+		return np.array([abs(y[i]-x[i])/x[i] for i, v in enumerate(x) if v!=0 and x[i]<=1 and y[i]<=1 and x[i]>=0 and y[i]>=0])
+	else:
+		return np.array([abs(y[i]-x[i]) for i, v in enumerate(x) if x[i]<=1 and y[i]<=1 and x[i]>=0 and y[i]>=0])
+
+def baseline_impact_mse(x,y):
+	return np.array([(y[i]-x[i])**2 for i, v in enumerate(x) if v!=0 and x[i]<=1 and y[i]<=1 and x[i]>=0 and y[i]>=0])
+
+def baseline_impact_ratio(x,y):
+	return np.array([y[i]/x[i] for i, v in enumerate(x) if v!=0])
+
+def baseline_ecdf(data, epsilon = 0.0001):
+	data = data[~np.isnan(data)]
+	cdf, x = np.histogram(data, bins=np.append(np.unique(data), np.array([np.max(data)+epsilon])))
+	cdf = np.cumsum(cdf)/np.sum(cdf)
+	return cdf, x[0:-1]
+
+
+'''
+Returns the values of the ECDF (computed with "baseline_ecdf(...)") of the given data at the given points.
+'''
+def baseline_ecdf_at(data, points):
+	cdf, x = baseline_ecdf(data)
+	return np.array([cdf[np.searchsorted(x,point,side='right')-1] if point >= x[0] else 0 for point in points])
+
+
+'''
+Returns random real impacts x (N) and estimations y (K x N), with zeros, NaN values, values out of [0,1], and repeated values.
+'''
+def get_random_impacts(seed):
+	rng = np.random.default_rng(seed)
+	x = np.round(rng.uniform(-0.1,1.1,NB_OF_RUNS),2)
+	y = np.round(np.clip(x+rng.normal(0,0.2,(NB_OF_ESTIMATORS,NB_OF_RUNS)),-0.2,1.2),2)
+	x[rng.random(NB_OF_RUNS) < 0.1] = 0
+	x[rng.random(NB_OF_RUNS) < 0.05] = np.nan
+	y[rng.random(y.shape) < 0.05] = np.nan
+	return x, y
+
+
+'''
+Returns the non NaN values of the given array.
+'''
+def non_nan(values):
+	return values[~np.isnan(values)]
+
+
+@pytest.mark.parametrize('seed', [0,1,2])
+def test_impact_metrics_match_the_baseline(seed):
+	x, y = get_random_impacts(seed)
+	for k in range(NB_OF_ESTIMATORS):
+		for relative_error in [True,False]:
+			np.testing.assert_array_equal(util_functions.impact_dist(x,y[k],relative_error=relative_error),baseline_impact_dist(x,y[k],relative_error=relative_error))
+		np.testing.assert_array_equal(util_functions.impact_mse(x,y[k]),baseline_impact_mse(x,y[k]))
+		np.testing.assert_array_equal(util_functions.impact_ratio(x,y[k]),baseline_impact_ratio(x,y[k]))
+		np.testing.assert_array_equal(util_functions.impact_dist(list(x),list(y[k])),baseline_impact_dist(x,y[k]))	# (lists)
+
+
+@pytest.mark.parametrize('seed', [0,1,2])
+def test_ecdf_matches_the_baseline(seed):
+	x, y = get_random_impacts(seed)
+	for data in [x, y[0], baseline_impact_dist(x,y[1])]:
+		cdf, values = util_functions.ecdf(data)
+		baseline_cdf, baseline_values = baseline_ecdf(data)
+		np.testing.assert_allclose(cdf,baseline_cdf)
+		np.testing.assert_array_equal(values,baseline_values)
+		np.testing.assert_allclose(util_functions.ecdf_at(data,POINTS)[0],baseline_ecdf_at(data,POINTS))
+
+
+@pytest.mark.parametrize('seed', [0,1,2])
+def test_2D_impact_metrics_match_the_baseline_per_estimator(seed):
+	x, y = get_random_impacts(seed)
+	for relative_error in [True,False]:
+		dist = util_functions.impact_dist(x,y,relative_error=relative_error)
+		assert dist.shape == y.shape
+		statistics = util_functions.impact_error_statistics(x,y,relative_error=relative_error)
+		cdf = util_functions.ecdf_at(dist,POINTS)
+		assert cdf.shape == (NB_OF_ESTIMATORS,len(POINTS))
+		for k in range(NB_OF_ESTIMATORS):
+			baseline_dist = baseline_impact_dist(x,y[k],relative_error=relative_error)
+			np.testing.assert_array_equal(non_nan(dist[k]),baseline_dist)
+			np.testing.assert_allclose(cdf[k],baseline_ecdf_at(baseline_dist,POINTS))
+			baseline_mse = np.nanmean(baseline_impact_mse(x,y[k]))
+			assert statistics['avg_dist'][k] == pytest.approx(np.nanmean(baseline_dist))
+			assert statistics['median_dist'][k] == pytest.approx(np.nanmedian(baseline_dist))
+			assert statistics['mse'][k] == pytest.approx(baseline_mse)
+			assert statistics['rmse'][k] == pytest.approx(np.sqrt(baseline_mse))
+			assert statistics['avg_ratio'][k] == pytest.approx(np.nanmean(baseline_impact_ratio(x,y[k])))
+			assert util_functions.avg_impact_dist(x,y,relative_error=relative_error)[k] == statistics['avg_dist'][k]
+	np.testing.assert_array_equal(non_nan(util_functions.impact_mse(x,y)[2]),baseline_impact_mse(x,y[2]))
+	np.testing.assert_array_equal(non_nan(util_functions.impact_ratio(x,y)[3]),non_nan(baseline_impact_ratio(x,y[3])))
+
+
+def test_impact_error_statistics_of_a_single_estimator():
+	x, y = get_random_impacts(4)
+	statistics = util_functions.impact_error_statistics(x,y[0])
+	assert statistics['avg_dist'] == pytest.approx(np.nanmean(baseline_impact_dist(x,y[0])))
+	assert statistics['median_dist'] == pytest.approx(np.nanmedian(baseline_impact_dist(x,y[0])))
+	assert statistics['rmse'] == pytest.approx(np.sqrt(np.nanmean(baseline_impact_mse(x,y[0]))))
+	assert statistics['avg_ratio'] == pytest.approx(np.nanmean(baseline_impact_ratio(x,y[0])))
+
+
+def test_ecdf_at_without_data():
+	cdf = util_functions.ecdf_at(np.array([[np.nan,np.nan],[0.5,np.nan]]),[0,0.5,1])
+	assert np.isnan(cdf[0]).all()
+	np.testing.assert_array_equal(cdf[1],[0,1,1])
+
+
+def test_parse_per_monitor_data_with_a_corrupt_cache(tmp_path):
+	filename = str(tmp_path/'results.csv')
+	with open(filename,'w') as f:
+		f.write('0,1,2,3,4,5,6,"(1,2,3,4)","(5,6,7,8)"\n')
+		f.write('1,1,7,3,8,9,10,"(9,10,11,12)"\n')
+	data = parse_per_monitor_data(filename)
+	assert data['rows'].tolist() == [[2,4,5,6],[7,8,9,10]]
+	assert data['offsets'].tolist() == [0,2,3]
+	for cache in [b'not a cache file', b'PK\x03\x04truncated', b'']:
+		with open(filename+'.npz','wb') as f:
+			f.write(cache)
+		cached = parse_per_monitor_data(filename, use_cache=True)
+		for k in data:
+			assert np.array_equal(cached[k], data[k])
+	cached = parse_per_monitor_data(filename, use_cache=True)	# (from the cache file written by the previous call)
+	for k in data:
+		assert np.array_equal(cached[k], data[k])